@@ -47,7 +47,9 @@ public function deliver(OutboxEvent $event): bool
 
         try {
             $response = Http::timeout(config('apps.webhook_timeout', 10))
-                ->post($app->callback_url, $event->payload);
+                // The event id is stable across retries, so the receiver
+                // can tell a redelivery from a repeated command
+                ->post($app->callback_url, $event->payload + ['event_id' => $event->id]);
 
             if ($response->successful()) {
                 $event->markSuccess();
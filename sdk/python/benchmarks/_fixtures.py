@@ -0,0 +1,87 @@
+"""
+Synthetic API payloads shared by the benchmark scripts.
+
+Shapes mirror what BotApiController returns: Laravel-serialized models with
+microsecond ``...Z`` timestamps.
+"""
+
+from typing import Any, Dict, List
+
+AUTHORS = 12
+
+
+def make_user(user_id: int) -> Dict[str, Any]:
+    return {
+        "id": user_id,
+        "name": f"User {user_id}",
+        "email": f"user{user_id}@example.com",
+        "avatar_url": f"https://cdn.example.com/avatars/{user_id}.png",
+        "created_at": "2024-01-15T09:30:00.000000Z",
+        "updated_at": "2024-03-02T17:45:12.000000Z",
+    }
+
+
+def make_conversation(members: int = 5000) -> Dict[str, Any]:
+    return {
+        "id": 42,
+        "workspace_id": 1,
+        "name": "general",
+        "description": "Company-wide announcements and work-based matters",
+        "type": "public_channel",
+        "is_archived": False,
+        "created_by": 1,
+        "created_at": "2024-01-15T09:30:00.000000Z",
+        "updated_at": "2024-01-15T09:30:00.000000Z",
+        "members": [
+            {
+                "id": 10_000 + i,
+                "conversation_id": 42,
+                "user_id": i + 1,
+                "role": "member",
+                "created_at": "2024-01-15T09:30:00.000000Z",
+                "user": make_user(i + 1),
+            }
+            for i in range(members)
+        ],
+    }
+
+
+def make_message(message_id: int) -> Dict[str, Any]:
+    author = message_id % AUTHORS + 1
+    minute = message_id % 60
+    hour = (message_id // 60) % 24
+    return {
+        "id": message_id,
+        "conversation_id": 42,
+        "user_id": author,
+        "body_md": f"Message **{message_id}** with some `markdown`",
+        "body_html": f"<p>Message <strong>{message_id}</strong> with some <code>markdown</code></p>",
+        "parent_message_id": None,
+        "created_at": f"2024-05-06T{hour:02d}:{minute:02d}:07.000000Z",
+        "updated_at": f"2024-05-06T{hour:02d}:{minute:02d}:07.000000Z",
+        "user": make_user(author),
+        "reactions": [
+            {
+                "id": message_id * 10 + r,
+                "emoji": ":+1:",
+                "user_id": (author + r) % AUTHORS + 1,
+                "user": make_user((author + r) % AUTHORS + 1),
+            }
+            for r in range(message_id % 3)
+        ],
+        "attachments": [
+            {
+                "id": message_id,
+                "filename": "report.pdf",
+                "mime_type": "application/pdf",
+                "size": 48213,
+                "url": f"https://cdn.example.com/files/{message_id}",
+            }
+        ]
+        if message_id % 5 == 0
+        else [],
+    }
+
+
+def make_message_page(count: int = 1000, start: int = 1) -> List[Dict[str, Any]]:
+    return [make_message(i) for i in range(start, start + count)]
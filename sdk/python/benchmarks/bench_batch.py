@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+MessageBatch benchmark
+
+Builds a large message history and computes per-user and per-hour counts
+and a filtered count, once over a list of ``Message`` objects and once over
+a columnar ``MessageBatch`` (with NumPy when installed, and the pure-array
+fallback).
+
+Usage:
+    python benchmarks/bench_batch.py [--messages 100000] [--rounds 5]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _fixtures import make_message_page  # noqa: E402
+from latch_bot.batch import MessageBatch, _numpy  # noqa: E402
+from latch_bot.models import Message  # noqa: E402
+
+SINCE = datetime(2024, 5, 6, 12, tzinfo=timezone.utc)
+
+
+def best_of(rounds, func):
+    best = float("inf")
+    result = None
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best, result
+
+
+def retained(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        obj = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del obj
+    return after - before
+
+
+def query_objects(messages):
+    by_user = Counter(m.user_id for m in messages)
+    by_hour = Counter(m.created_at.hour for m in messages if m.created_at)
+    recent = sum(1 for m in messages if m.user_id == 3 and m.created_at and m.created_at >= SINCE)
+    return dict(by_user), dict(by_hour), recent
+
+
+def query_batch(batch):
+    by_user = batch.count_by("user_id")
+    by_hour = batch.count_by("hour_of_day")
+    recent = len(batch.where(user_id=3, since=SINCE))
+    return by_user, by_hour, recent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    page = make_message_page(args.messages)
+    print(f"{args.messages} messages\n")
+    print(f"{'':<30} {'build':>10} {'query':>10} {'memory':>10}")
+
+    build, messages = best_of(args.rounds, lambda: [Message.from_dict(m) for m in page])
+    query, expected = best_of(args.rounds, lambda: query_objects(messages))
+    memory = retained(lambda: [Message.from_dict(m) for m in page])
+    print(f"{'list of Message':<30} {build * 1000:7.1f} ms {query * 1000:7.1f} ms {memory / 2**20:6.1f} MiB")
+    del messages
+
+    variants = [("MessageBatch (pure arrays)", False)]
+    if _numpy() is not None:
+        variants.append(("MessageBatch (NumPy)", True))
+    else:
+        print(f"{'MessageBatch (NumPy)':<30} not installed")
+    for name, use_numpy in variants:
+        build, batch = best_of(
+            args.rounds,
+            lambda: MessageBatch.from_dicts(page, keep_raw=False, use_numpy=use_numpy),
+        )
+        query, result = best_of(args.rounds, lambda: query_batch(batch))
+        assert result == expected, name
+        memory = retained(lambda: MessageBatch.from_dicts(page, keep_raw=False, use_numpy=use_numpy))
+        print(f"{name:<30} {build * 1000:7.1f} ms {query * 1000:7.1f} ms {memory / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+JSON codec benchmark
+
+Compares decoding a large ``GET /api/bot/conversations/{id}`` response the
+old way (``response.text`` for debug logging, then ``response.json()``)
+with a single bytes decode through each installed codec.
+
+Usage:
+    python benchmarks/bench_codec.py [--members 5000] [--rounds 20]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _fixtures import make_conversation  # noqa: E402
+from latch_bot.codec import get_codec  # noqa: E402
+from latch_bot.models import Conversation  # noqa: E402
+
+
+def best_of(rounds, func):
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = {"conversation": make_conversation(args.members)}
+    raw = json.dumps(payload).encode("utf-8")
+    print(f"Payload: {len(raw) / 1024:.0f} KiB, {args.members} members\n")
+
+    def legacy():
+        raw.decode("utf-8")  # response.text for the debug log
+        return json.loads(raw.decode("utf-8"))  # response.json() decodes again
+
+    baseline = best_of(args.rounds, legacy)
+    baseline_total = best_of(
+        args.rounds,
+        lambda: Conversation.from_dict(legacy()["conversation"]),
+    )
+    print(f"{'':<24} {'decode':>11} {'+ from_dict':>14}")
+    print(
+        f"{'legacy (text + json())':<24} {baseline * 1000:8.2f} ms "
+        f"{baseline_total * 1000:11.2f} ms"
+    )
+
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<24} {'not installed':>11}")
+            continue
+
+        decode = best_of(args.rounds, lambda: codec.loads(raw))
+        total = best_of(
+            args.rounds,
+            lambda: Conversation.from_dict(codec.loads(raw)["conversation"]),
+        )
+        print(
+            f"{name:<24} {decode * 1000:8.2f} ms {total * 1000:11.2f} ms  "
+            f"(decode {baseline / decode:.2f}x)"
+        )
+
+    encode_payload = {"conversation_id": 42, "text": "x" * 4000}
+    print()
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        elapsed = best_of(args.rounds, lambda: [codec.dumps(encode_payload) for _ in range(1000)])
+        print(f"encode x1000 {name:<11} {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark
+
+Measures cold-start import cost of the SDK entry points in fresh
+interpreters and fails (exit code 1) when a budget is exceeded or a heavy
+dependency is loaded eagerly. Suitable for CI.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 7] [--scale 1.0] [--importtime]
+
+``--scale`` multiplies every budget (useful on slow CI machines).
+``--importtime`` prints the ``python -X importtime`` breakdown of the
+slowest latch_bot modules for each entry point.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SDK_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# (statement, budget in milliseconds, modules that must not be imported)
+CASES = [
+    ("import latch_bot", 5.0, ("requests", "httpx", "flask", "asyncio")),
+    ("from latch_bot import Message, Conversation", 40.0, ("requests", "httpx", "flask", "asyncio")),
+    ("from latch_bot import WebhookServer", 40.0, ("requests", "httpx", "flask", "asyncio")),
+    ("from latch_bot import LatchBot", 60.0, ("requests", "httpx", "flask", "asyncio")),
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {forbidden!r} if m in sys.modules]
+print(elapsed * 1000, ",".join(loaded))
+"""
+
+
+def measure(stmt, forbidden, runs):
+    best = float("inf")
+    loaded = ""
+    env = dict(os.environ, PYTHONPATH=SDK_ROOT, PYTHONDONTWRITEBYTECODE="")
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(stmt=stmt, forbidden=forbidden)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+            cwd=SDK_ROOT,
+        ).stdout.split()
+        best = min(best, float(out[0]))
+        loaded = out[1] if len(out) > 1 else ""
+    return best, loaded
+
+
+def importtime_breakdown(stmt, top=8):
+    env = dict(os.environ, PYTHONPATH=SDK_ROOT)
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=SDK_ROOT,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line.split("|")
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue
+        name = parts[2].rstrip()
+        if name.strip() == "site":
+            # Everything so far was interpreter startup, not our import
+            rows = []
+            continue
+        rows.append((cumulative, name))
+    rows.sort(reverse=True)
+    for cumulative, name in rows[:top]:
+        print(f"      {cumulative / 1000:7.2f} ms {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so the first run is not an outlier
+    measure(CASES[-1][0], (), 1)
+
+    failed = False
+    for stmt, budget, forbidden in CASES:
+        budget *= args.scale
+        elapsed, loaded = measure(stmt, forbidden, args.runs)
+        ok = elapsed <= budget and not loaded
+        failed |= not ok
+        status = "ok" if ok else "FAIL"
+        print(f"{status:<4} {elapsed:7.2f} ms (budget {budget:5.1f} ms)  {stmt}")
+        if loaded:
+            print(f"      eagerly imported: {loaded}")
+        if args.importtime:
+            importtime_breakdown(stmt)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
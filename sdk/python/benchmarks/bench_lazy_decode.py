@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Lazy message decoding benchmark
+
+Decodes a page of messages with ``Message.from_dict`` eagerly and with
+``lazy=True``, for a handler that reads only ``id`` and ``body_md`` and
+for one that touches every field.
+
+Usage:
+    python benchmarks/bench_lazy_decode.py [--messages 10000] [--rounds 10]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _fixtures import make_message_page  # noqa: E402
+from latch_bot.models import Message  # noqa: E402
+
+
+def best_of(rounds, func):
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def read_summary(messages):
+    for m in messages:
+        m.id, m.body_md
+
+
+def read_everything(messages):
+    for m in messages:
+        m.id, m.body_md, m.created_at, m.updated_at, m.user, m.reactions, m.attachments
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    page = make_message_page(args.messages)
+    assert [Message.from_dict(m, lazy=True) for m in page] == [Message.from_dict(m) for m in page]
+
+    print(f"{args.messages} messages\n")
+    print(f"{'':<22} {'eager':>10} {'lazy':>10}")
+    for name, access in (("id + body_md", read_summary), ("every field", read_everything)):
+        eager = best_of(args.rounds, lambda: access([Message.from_dict(m) for m in page]))
+        lazy = best_of(args.rounds, lambda: access([Message.from_dict(m, lazy=True) for m in page]))
+        print(
+            f"{name:<22} {eager * 1000:7.1f} ms {lazy * 1000:7.1f} ms  "
+            f"({eager / lazy:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Model memory benchmark
+
+Measures bytes retained per decoded ``Message`` (with its nested ``User``,
+``Reaction`` and ``Attachment`` objects) for the slotted models, with and
+without a shared ``DecodeContext``, against the same dataclasses rebuilt
+with a per-instance ``__dict__``.
+
+Usage:
+    python benchmarks/bench_models_memory.py [--messages 20000]
+"""
+
+import argparse
+import copy
+import dataclasses
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _fixtures import make_message_page  # noqa: E402
+from latch_bot import models  # noqa: E402
+from latch_bot.models import DecodeContext  # noqa: E402
+
+
+def unslotted(cls):
+    """The same dataclass as ``cls``, without ``__slots__``."""
+    spec = []
+    for f in dataclasses.fields(cls):
+        if f.default_factory is not dataclasses.MISSING:
+            spec.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        elif f.default is not dataclasses.MISSING:
+            spec.append((f.name, f.type, f.default))
+        else:
+            spec.append((f.name, f.type))
+    return dataclasses.make_dataclass(f"Dict{cls.__name__}", spec)
+
+
+LEGACY = {cls: unslotted(cls) for cls in (models.User, models.Reaction, models.Attachment, models.Message)}
+
+
+def to_legacy(obj):
+    """Convert to the unslotted classes, with one datetime per field as before."""
+    if isinstance(obj, datetime):
+        return copy.copy(obj)
+    if isinstance(obj, list):
+        return [to_legacy(item) for item in obj]
+    legacy_cls = LEGACY.get(type(obj))
+    if legacy_cls is None:
+        return obj
+    return legacy_cls(**{f.name: to_legacy(getattr(obj, f.name)) for f in dataclasses.fields(obj)})
+
+
+def retained_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, objects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    raw = json.dumps(make_message_page(args.messages)).encode("utf-8")
+
+    def slotted():
+        return [models.Message.from_dict(m) for m in json.loads(raw)]
+
+    def interned():
+        ctx = DecodeContext()
+        return ctx, [models.Message.from_dict(m, ctx=ctx) for m in json.loads(raw)]
+
+    def with_dict():
+        return [to_legacy(models.Message.from_dict(m)) for m in json.loads(raw)]
+
+    baseline, objects = retained_bytes(with_dict)
+    assert hasattr(objects[0], "__dict__")
+    del objects
+    shared, (ctx, _) = retained_bytes(interned)
+    del ctx, _
+    current, objects = retained_bytes(slotted)
+    assert not hasattr(objects[0], "__dict__")
+
+    print(f"{args.messages} messages (avg {sum(len(m.reactions) for m in objects) / len(objects):.1f} reactions, "
+          f"{sum(len(m.attachments) for m in objects) / len(objects):.1f} attachments)\n")
+    print(f"{'__dict__ dataclasses':<22} {baseline / args.messages:8.0f} bytes/message")
+    print(f"{'slotted models':<22} {current / args.messages:8.0f} bytes/message  "
+          f"({1 - current / baseline:.0%} smaller)")
+    print(f"{'+ DecodeContext':<22} {shared / args.messages:8.0f} bytes/message  "
+          f"({1 - shared / baseline:.0%} smaller)")
+    legacy = to_legacy(objects[0])
+    print(
+        f"\nMessage instance: {sys.getsizeof(objects[0])} bytes slotted, "
+        f"{sys.getsizeof(legacy) + sys.getsizeof(legacy.__dict__)} bytes with __dict__"
+    )
+
+
+if __name__ == "__main__":
+    main()
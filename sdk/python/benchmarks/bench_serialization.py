@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Model serialization benchmark
+
+Compares the size and speed of ``to_bytes`` / ``from_bytes`` against JSON
+(``dataclasses.asdict`` + ``from_dict``) and pickle for a large
+conversation and a page of messages. Round-trip correctness is covered by
+``tests/test_serialization.py``.
+
+Usage:
+    python benchmarks/bench_serialization.py [--members 5000] [--messages 1000]
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import pickle
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _fixtures import make_conversation, make_message_page  # noqa: E402
+from latch_bot.models import Conversation, Message  # noqa: E402
+
+
+def best_of(rounds, func):
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    page = make_message_page(args.messages)
+    conversation = Conversation.from_dict(make_conversation(args.members))
+    messages = [Message.from_dict(m) for m in page]
+
+    def json_dump(obj):
+        return json.dumps(dataclasses.asdict(obj), default=datetime.isoformat).encode()
+
+    cases = [
+        (f"Conversation ({args.members} members)", [conversation], Conversation),
+        (f"{args.messages} messages", messages, Message),
+    ]
+    print(f"{'':<28} {'format':<8} {'bytes':>10} {'dump':>10} {'load':>10}")
+    for name, objects, cls in cases:
+        encoded_json = [json_dump(o) for o in objects]
+        encoded_bin = [o.to_bytes() for o in objects]
+        encoded_pickle = [pickle.dumps(o, pickle.HIGHEST_PROTOCOL) for o in objects]
+        rows = [
+            ("json", encoded_json,
+             lambda: [json_dump(o) for o in objects],
+             lambda: [cls.from_dict(json.loads(b)) for b in encoded_json]),
+            ("pickle", encoded_pickle,
+             lambda: [pickle.dumps(o, pickle.HIGHEST_PROTOCOL) for o in objects],
+             lambda: [pickle.loads(b) for b in encoded_pickle]),
+            ("binary", encoded_bin,
+             lambda: [o.to_bytes() for o in objects],
+             lambda: [cls.from_bytes(b) for b in encoded_bin]),
+        ]
+        for fmt, encoded, dump, load in rows:
+            size = sum(len(b) for b in encoded)
+            print(
+                f"{name:<28} {fmt:<8} {size:>10,} "
+                f"{best_of(args.rounds, dump) * 1000:7.2f} ms {best_of(args.rounds, load) * 1000:7.2f} ms"
+            )
+            name = ""
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark
+
+Drives LatchBot, AsyncLatchBot (when httpx is installed) and
+WebhookServer.handle against the in-process StubLatchServer and reports
+requests/sec, p50/p99 latency per attempt and traced memory per 10k
+messages sent.
+
+Usage:
+    python benchmarks/bench_throughput.py [--messages 2000] [--concurrency 16]
+        [--latency 0.005] [--rate-limited 0.0] [--server-errors 0.0]
+        [--rate-limit] [--memory]
+
+``--rate-limited`` and ``--server-errors`` inject 429 and 503 responses
+with the given probability. Rate limiting is disabled on the clients
+unless ``--rate-limit`` is passed, so the numbers measure the SDK rather
+than the 60/min server quota.
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from latch_bot import ClientHooks, LatchBot, LatchBotError, WebhookServer  # noqa: E402
+from latch_bot.ratelimit import RateLimiter  # noqa: E402
+from latch_bot.testing import StubLatchServer  # noqa: E402
+
+TOKEN = "bot_benchmark"
+
+
+class LatencyRecorder(ClientHooks):
+    """Collects the duration of every attempt."""
+
+    def __init__(self):
+        self.durations = []
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def on_request_end(self, info):
+        with self._lock:
+            self.durations.append(info.duration)
+
+    def on_retry(self, info, delay):
+        with self._lock:
+            self.retries += 1
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def client_kwargs(args, recorder):
+    kwargs = {
+        "token": TOKEN,
+        "hooks": [recorder],
+        "rate_limit": args.rate_limit,
+    }
+    if args.rate_limit:
+        kwargs["rate_limiter"] = RateLimiter(limit=args.server_rate_limit)
+    return kwargs
+
+
+def report(name, count, elapsed, recorder, errors=0):
+    durations = recorder.durations
+    print(
+        f"{name:<28} {count / elapsed:9.0f} req/s "
+        f"p50 {percentile(durations, 0.50) * 1000:7.2f} ms "
+        f"p99 {percentile(durations, 0.99) * 1000:7.2f} ms "
+        f"retries {recorder.retries:5d} errors {errors:5d}"
+    )
+
+
+def bench_send_serial(server, args):
+    recorder = LatencyRecorder()
+    bot = LatchBot(base_url=server.url, **client_kwargs(args, recorder))
+    errors = 0
+    start = time.perf_counter()
+    for i in range(args.messages):
+        try:
+            bot.send_message(conversation_id=i % 50 + 1, text=f"message {i}")
+        except LatchBotError:
+            errors += 1
+    report("send_message (serial)", args.messages, time.perf_counter() - start, recorder, errors)
+
+
+def bench_send_bulk(server, args):
+    recorder = LatencyRecorder()
+    bot = LatchBot(
+        base_url=server.url,
+        pool_maxsize=args.concurrency,
+        **client_kwargs(args, recorder),
+    )
+    items = [(i % 50 + 1, f"message {i}") for i in range(args.messages)]
+    start = time.perf_counter()
+    results = bot.send_messages_bulk(items, max_concurrency=args.concurrency)
+    elapsed = time.perf_counter() - start
+    errors = sum(isinstance(r, LatchBotError) for r in results)
+    report(f"send_messages_bulk (x{args.concurrency})", args.messages, elapsed, recorder, errors)
+
+
+def bench_get_conversation(server, args):
+    recorder = LatencyRecorder()
+    bot = LatchBot(base_url=server.url, **client_kwargs(args, recorder))
+    errors = 0
+    start = time.perf_counter()
+    for i in range(args.messages):
+        try:
+            bot.get_conversation(i + 1)
+        except LatchBotError:
+            errors += 1
+    report("get_conversation (serial)", args.messages, time.perf_counter() - start, recorder, errors)
+
+
+def bench_async(server, args):
+    try:
+        from latch_bot import AsyncLatchBot
+    except ImportError:
+        print(f"{'AsyncLatchBot':<28} httpx not installed")
+        return
+
+    recorder = LatencyRecorder()
+
+    async def run():
+        async with AsyncLatchBot(
+            base_url=server.url,
+            max_connections=args.concurrency,
+            **client_kwargs(args, recorder),
+        ) as bot:
+            items = [(i % 50 + 1, f"message {i}") for i in range(args.messages)]
+            start = time.perf_counter()
+            results = await bot.send_messages_bulk(items, max_concurrency=args.concurrency)
+            elapsed = time.perf_counter() - start
+        return elapsed, sum(isinstance(r, LatchBotError) for r in results)
+
+    elapsed, errors = asyncio.run(run())
+    report(f"AsyncLatchBot bulk (x{args.concurrency})", args.messages, elapsed, recorder, errors)
+
+
+def bench_webhook(server, args):
+    recorder = LatencyRecorder()
+    bot = LatchBot(base_url=server.url, **client_kwargs(args, recorder))
+    webhook = WebhookServer(bot)
+
+    @webhook.command("echo")
+    def echo(ctx):
+        ctx.reply(ctx.text)
+
+    payloads = [
+        {
+            "command": "echo",
+            "text": f"hello {i}",
+            "conversation_id": i % 50 + 1,
+            "user_id": 7,
+            "user_name": "bench",
+            "workspace_id": 1,
+        }
+        for i in range(args.messages)
+    ]
+    start = time.perf_counter()
+    errors = sum("error" in webhook.handle(payload) for payload in payloads)
+    report("WebhookServer.handle + reply", args.messages, time.perf_counter() - start, recorder, errors)
+
+
+def bench_memory(server, args):
+    recorder = LatencyRecorder()
+    bot = LatchBot(base_url=server.url, **client_kwargs(args, recorder))
+    count = min(args.messages, 2000)
+    bot.send_message(conversation_id=1, text="warm up")
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        messages = []
+        for i in range(count):
+            try:
+                messages.append(bot.send_message(conversation_id=i % 50 + 1, text=f"message {i}"))
+            except LatchBotError:
+                pass
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    scale = 10_000 / max(len(messages), 1)
+    print(
+        f"\nMemory per 10k messages: retained {(retained - baseline) * scale / 1024 / 1024:.1f} MiB, "
+        f"peak {(peak - baseline) * scale / 1024 / 1024:.1f} MiB "
+        f"(measured over {len(messages)} sends)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.005, help="stub latency in seconds")
+    parser.add_argument("--rate-limited", type=float, default=0.0, help="fraction of 429s")
+    parser.add_argument("--server-errors", type=float, default=0.0, help="fraction of 503s")
+    parser.add_argument("--rate-limit", action="store_true", help="enable client rate limiting")
+    parser.add_argument("--server-rate-limit", type=int, default=100_000)
+    parser.add_argument("--memory", action="store_true", help="also trace memory (slow)")
+    args = parser.parse_args()
+
+    # Injected faults make the SDK log every retry and handler error
+    logging.getLogger("latch_bot").setLevel(logging.CRITICAL)
+
+    with StubLatchServer(
+        latency=args.latency,
+        rate_limited_ratio=args.rate_limited,
+        server_error_ratio=args.server_errors,
+        retry_after=0,
+        rate_limit=args.server_rate_limit,
+        seed=1,
+    ) as server:
+        print(
+            f"Stub server {server.url}: latency {args.latency * 1000:.1f} ms, "
+            f"429 {args.rate_limited:.1%}, 5xx {args.server_errors:.1%}, "
+            f"{args.messages} requests per scenario\n"
+        )
+        bench_send_serial(server, args)
+        bench_send_bulk(server, args)
+        bench_get_conversation(server, args)
+        bench_async(server, args)
+        bench_webhook(server, args)
+        if args.memory:
+            bench_memory(server, args)
+        print(f"\nServer responses: {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Timestamp parsing micro-benchmark
+
+Parses 100k server timestamps with the previous ``_parse_datetime``
+implementation, ``parse_timestamp`` (the fixed-format fast path) and
+``parse_timestamp`` behind a bounded ``lru_cache``, for all-distinct values
+(decoding a large history) and for a small set of values seen repeatedly
+(redrawing the same page). The distinct case is the one decoding pays for,
+and there a memo costs more than it saves.
+
+Usage:
+    python benchmarks/bench_timestamps.py [--count 100000] [--distinct 200]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from latch_bot import timestamps  # noqa: E402
+
+
+def legacy_parse(value):
+    if not value:
+        return None
+    try:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def make_timestamps(count, distinct):
+    start = datetime(2024, 5, 6, tzinfo=timezone.utc)
+    values = [
+        (start + timedelta(seconds=7 * i, microseconds=i)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        for i in range(distinct)
+    ]
+    return [values[i % distinct] for i in range(count)]
+
+
+def best_of(rounds, func, values):
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            if hasattr(func, "cache_clear"):
+                func.cache_clear()
+            start = time.perf_counter()
+            for value in values:
+                func(value)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("all distinct", make_timestamps(args.count, args.count)),
+        (f"{args.distinct} distinct, repeated", make_timestamps(args.count, args.distinct)),
+    ]
+    parsers = [
+        ("legacy _parse_datetime", legacy_parse),
+        ("parse_timestamp", timestamps.parse_timestamp),
+        ("lru_cache(1024) memo", lru_cache(maxsize=1024)(timestamps.parse_timestamp)),
+    ]
+
+    sample = cases[0][1][:1000]
+    for _, func in parsers:
+        assert [func(v) for v in sample] == [legacy_parse(v) for v in sample]
+
+    print(f"{args.count} timestamps, Python {sys.version.split()[0]}\n")
+    for case, values in cases:
+        print(case)
+        baseline = None
+        for name, func in parsers:
+            elapsed = best_of(args.rounds, func, values)
+            baseline = baseline or elapsed
+            print(
+                f"  {name:<24} {elapsed * 1000:7.1f} ms "
+                f"{elapsed / len(values) * 1e9:6.0f} ns/ts  ({baseline / elapsed:.1f}x)"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,7 @@ import os
 import logging
 import requests
 from flask import Flask, request, jsonify
-from latch_bot import LatchBot, WebhookServer
+from latch_bot import HTTPClient, LatchBot, WebhookServer
 
 # Configuration
 TOKEN = os.environ.get("LATCH_BOT_TOKEN")
@@ -38,23 +38,23 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 bot = LatchBot(token=TOKEN, base_url=BASE_URL)
-webhook = WebhookServer(bot, debug=True)
+# Shared, pooled client for OpenWeatherMap; handlers reach it as ctx.http
+webhook = WebhookServer(bot, debug=True, http=HTTPClient(max_per_host=8, timeout=5))
 
 
-def get_weather(city: str) -> dict:
+def get_weather(ctx, city: str) -> dict:
     """Fetch current weather from OpenWeatherMap API."""
     if not WEATHER_API_KEY:
         return {"error": "Weather API not configured"}
 
     try:
-        response = requests.get(
+        response = ctx.http.get(
             "https://api.openweathermap.org/data/2.5/weather",
             params={
                 "q": city,
                 "appid": WEATHER_API_KEY,
                 "units": "metric",
             },
-            timeout=10,
         )
         response.raise_for_status()
         return response.json()
@@ -63,13 +63,13 @@ def get_weather(city: str) -> dict:
         return {"error": str(e)}
 
 
-def get_forecast(city: str) -> dict:
+def get_forecast(ctx, city: str) -> dict:
     """Fetch 5-day forecast from OpenWeatherMap API."""
     if not WEATHER_API_KEY:
         return {"error": "Weather API not configured"}
 
     try:
-        response = requests.get(
+        response = ctx.http.get(
             "https://api.openweathermap.org/data/2.5/forecast",
             params={
                 "q": city,
@@ -77,7 +77,6 @@ def get_forecast(city: str) -> dict:
                 "units": "metric",
                 "cnt": 5,  # 5 forecast entries
             },
-            timeout=10,
         )
         response.raise_for_status()
         return response.json()
@@ -104,14 +103,14 @@ def format_weather_emoji(condition: str) -> str:
     return "🌤️"
 
 
-@webhook.command("weather")
+@webhook.command("weather", defer=True, ack="Checking the weather…")
 def handle_weather(ctx):
     """Handle /weather command."""
     city = ctx.text.strip() if ctx.text else "London"
 
     logger.info(f"Weather request for {city} by {ctx.user_name}")
 
-    data = get_weather(city)
+    data = get_weather(ctx, city)
 
     if "error" in data:
         ctx.reply(f"Sorry, couldn't get weather for **{city}**. Please check the city name.")
@@ -148,14 +147,14 @@ def handle_weather(ctx):
         ctx.reply("Sorry, there was an error processing the weather data.")
 
 
-@webhook.command("forecast")
+@webhook.command("forecast", defer=True, ack="Fetching the forecast…")
 def handle_forecast(ctx):
     """Handle /forecast command."""
     city = ctx.text.strip() if ctx.text else "London"
 
     logger.info(f"Forecast request for {city} by {ctx.user_name}")
 
-    data = get_forecast(city)
+    data = get_forecast(ctx, city)
 
     if "error" in data:
         ctx.reply(f"Sorry, couldn't get forecast for **{city}**.")
@@ -8,31 +8,88 @@ Example usage:
 
     bot = LatchBot(token="bot_YOUR_TOKEN")
     bot.send_message(conversation_id=123, text="Hello!")
+
+Public names are loaded lazily on first access, so importing the package
+(or just its models or webhook server) does not pull in ``requests``,
+``httpx`` or Flask.
 """
 
-from .client import LatchBot
-from .models import Message, Conversation, User, ConversationMember
-from .exceptions import (
-    LatchBotError,
-    AuthenticationError,
-    RateLimitError,
-    NotFoundError,
-    ValidationError,
-)
-from .webhook import WebhookServer, CommandContext
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "1.0.0"
-__all__ = [
-    "LatchBot",
-    "Message",
-    "Conversation",
-    "User",
-    "ConversationMember",
-    "LatchBotError",
-    "AuthenticationError",
-    "RateLimitError",
-    "NotFoundError",
-    "ValidationError",
-    "WebhookServer",
-    "CommandContext",
-]
+
+_LAZY_IMPORTS = {
+    "LatchBot": ".client",
+    "AsyncLatchBot": ".async_client",
+    "Message": ".models",
+    "Conversation": ".models",
+    "User": ".models",
+    "ConversationMember": ".models",
+    "DecodeContext": ".models",
+    "MessageBatch": ".batch",
+    "LatchBotError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "ServerError": ".exceptions",
+    "CircuitOpenError": ".exceptions",
+    "RateLimiter": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "RetryBudget": ".retry",
+    "CircuitBreaker": ".retry",
+    "ClientHooks": ".instrumentation",
+    "MetricsCollector": ".instrumentation",
+    "RequestInfo": ".instrumentation",
+    "WebhookServer": ".webhook",
+    "CommandContext": ".webhook",
+    "DeferredDispatcher": ".dispatch",
+    "ShardedDispatcher": ".dispatch",
+    "HTTPClient": ".http",
+    "IdempotencyCache": ".idempotency",
+    "MemoryIdempotencyStore": ".idempotency",
+    "SQLiteIdempotencyStore": ".idempotency",
+    "PreforkServer": ".prefork",
+    "WebhookASGIApp": ".asgi",
+    "create_asgi_app": ".asgi",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .client import LatchBot
+    from .async_client import AsyncLatchBot
+    from .models import Message, Conversation, User, ConversationMember, DecodeContext
+    from .batch import MessageBatch
+    from .exceptions import (
+        LatchBotError,
+        AuthenticationError,
+        RateLimitError,
+        NotFoundError,
+        ValidationError,
+        ServerError,
+        CircuitOpenError,
+    )
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy, RetryBudget, CircuitBreaker
+    from .instrumentation import ClientHooks, MetricsCollector, RequestInfo
+    from .webhook import WebhookServer, CommandContext
+    from .dispatch import DeferredDispatcher, ShardedDispatcher
+    from .http import HTTPClient
+    from .idempotency import IdempotencyCache, MemoryIdempotencyStore, SQLiteIdempotencyStore
+    from .prefork import PreforkServer
+    from .asgi import WebhookASGIApp, create_asgi_app
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
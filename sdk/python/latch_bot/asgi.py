@@ -0,0 +1,187 @@
+"""
+Latch Bot SDK ASGI Application
+
+Framework-free ASGI app serving slash command webhooks, for uvicorn,
+hypercorn or any other ASGI server.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .codec import JSONCodec, get_codec
+from .webhook import WebhookServer
+
+if TYPE_CHECKING:
+    from .client import LatchBot
+
+logger = logging.getLogger(__name__)
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+
+class PayloadTooLarge(Exception):
+    """Request body exceeded the configured limit."""
+
+
+class WebhookASGIApp:
+    """
+    ASGI application dispatching webhooks to a :class:`WebhookServer`.
+
+    ``async def`` handlers run on the event loop; plain handlers run on the
+    webhook server's bounded thread pool. ``GET /health`` answers
+    ``{"status": "ok"}``. The thread pool is shut down on lifespan shutdown.
+
+    Example:
+        webhook = WebhookServer(bot, max_workers=16)
+        app = WebhookASGIApp(webhook)
+        # uvicorn mybot:app --port 3000
+    """
+
+    def __init__(
+        self,
+        webhook: WebhookServer,
+        webhook_path: str = "/latch/webhook",
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        codec: Optional[JSONCodec] = None,
+    ):
+        """
+        Initialize the app.
+
+        Args:
+            webhook: Webhook server holding the command handlers
+            webhook_path: URL path for the webhook endpoint
+            max_body_size: Largest request body accepted, in bytes
+            codec: JSON codec for request and response bodies (defaults to
+                the bot's codec)
+        """
+        self.webhook = webhook
+        self.webhook_path = webhook_path
+        self.max_body_size = max_body_size
+        self.codec = codec or getattr(webhook.bot, "codec", None) or get_codec()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope_type = scope["type"]
+        if scope_type == "http":
+            await self._http(scope, receive, send)
+        elif scope_type == "lifespan":
+            await self._lifespan(receive, send)
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope["path"]
+        method = scope["method"]
+
+        if path == self.webhook_path:
+            if method != "POST":
+                await self._respond(send, 405, {"error": "Method not allowed"}, [(b"allow", b"POST")])
+                return
+            try:
+                body = await self._read_body(receive)
+            except PayloadTooLarge:
+                await self._respond(send, 413, {"error": "Payload too large"})
+                return
+            try:
+                data = self.codec.loads(body)
+            except ValueError as e:
+                logger.error(f"Invalid webhook body: {e}")
+                await self._respond(send, 400, {"error": "Invalid JSON"})
+                return
+            if not isinstance(data, dict):
+                await self._respond(send, 400, {"error": "Invalid payload"})
+                return
+            await self._respond(send, 200, await self.webhook.handle_async(data))
+        elif path == "/health":
+            if method not in ("GET", "HEAD"):
+                await self._respond(send, 405, {"error": "Method not allowed"}, [(b"allow", b"GET")])
+                return
+            await self._respond(send, 200, {"status": "ok"})
+        else:
+            await self._respond(send, 404, {"error": "Not found"})
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        chunks: List[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                raise PayloadTooLarge()
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _respond(
+        self,
+        send: Send,
+        status: int,
+        body: Dict[str, Any],
+        headers: Optional[List[Tuple[bytes, bytes]]] = None,
+    ) -> None:
+        encoded = self.codec.dumps(body)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(encoded)).encode()),
+                ]
+                + (headers or []),
+            }
+        )
+        await send({"type": "http.response.body", "body": encoded})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                # close() waits for running handlers; keep the loop serving them
+                await asyncio.get_running_loop().run_in_executor(None, self.webhook.close)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app(
+    bot: "LatchBot",
+    webhook_path: str = "/latch/webhook",
+    max_workers: int = WebhookServer.DEFAULT_MAX_WORKERS,
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+) -> WebhookASGIApp:
+    """
+    Create an ASGI app with webhook endpoint configured.
+
+    Args:
+        bot: LatchBot or AsyncLatchBot client instance
+        webhook_path: URL path for the webhook endpoint
+        max_workers: Threads available to plain (non-async) handlers
+        max_body_size: Largest request body accepted, in bytes
+
+    Returns:
+        ASGI application
+
+    Example:
+        bot = AsyncLatchBot(token="bot_YOUR_TOKEN")
+        app = create_asgi_app(bot)
+
+        @bot.webhook.command("hello")
+        async def hello(ctx):
+            await ctx.reply_async("Hello!")
+
+        # uvicorn mybot:app --port 3000
+    """
+    webhook = WebhookServer(bot, max_workers=max_workers)
+
+    # Attach webhook to bot for easy access
+    bot.webhook = webhook
+
+    return WebhookASGIApp(webhook, webhook_path=webhook_path, max_body_size=max_body_size)
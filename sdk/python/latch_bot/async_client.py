@@ -0,0 +1,437 @@
+"""
+Latch Bot SDK Async Client
+
+asyncio-native client for interacting with the Latch Bot API.
+
+Requires ``httpx`` (``pip install "latch-bot-sdk[async]"``). HTTP/2 support
+additionally needs the ``h2`` package (``pip install "latch-bot-sdk[http2]"``).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional, Dict, Any, Awaitable, Callable, Hashable, Iterable, TypeVar, Union
+
+from .client import _LatchBotBase, BulkItem, BulkResult, _path_template
+from .models import Message, Conversation
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, RetryBudget, CircuitBreaker
+from .codec import JSONCodec
+from .instrumentation import ClientHooks, RequestInfo
+from .exceptions import LatchBotError, RateLimitError, ServerError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of :class:`latch_bot.cache.SingleFlight`.
+
+    The shared call runs as its own task, so a caller being cancelled (e.g.
+    by a handler deadline) does not cancel it for the others; it is only
+    cancelled once every caller waiting on it is gone.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` unless an identical call is already in flight."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if not task.done():
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    # Forget it now, so a caller arriving before the task
+                    # has finished cancelling starts a fresh call
+                    self._forget(key, task)
+                    task.cancel()
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+
+
+class AsyncLatchBot(_LatchBotBase):
+    """
+    Asynchronous Latch Bot API client.
+
+    Uses a single pooled ``httpx.AsyncClient`` so that keep-alive
+    connections are reused across requests, and the number of open
+    connections stays bounded no matter how many coroutines are sending.
+
+    Example usage:
+        async with AsyncLatchBot(
+            token="bot_YOUR_TOKEN",
+            base_url="https://your-latch-instance.com",
+        ) as bot:
+            message = await bot.send_message(conversation_id=123, text="Hi!")
+
+            # Fan out from a single event loop
+            await asyncio.gather(*(
+                bot.send_message(conversation_id=cid, text="Announcement")
+                for cid in conversation_ids
+            ))
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE = 20
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "http://localhost",
+        timeout: int = _LatchBotBase.DEFAULT_TIMEOUT,
+        max_retries: int = _LatchBotBase.DEFAULT_RETRIES,
+        debug: bool = False,
+        rate_limit: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_rate_limit_wait: Optional[float] = None,
+        conversation_cache_ttl: Optional[float] = None,
+        conversation_cache_size: int = _LatchBotBase.DEFAULT_CACHE_SIZE,
+        coalesce_requests: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        codec: Optional[JSONCodec] = None,
+        hooks: Optional[Iterable[ClientHooks]] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+        http2: bool = False,
+    ):
+        """
+        Initialize the async Latch Bot client.
+
+        Args:
+            token: Bot API token (starts with 'bot_')
+            base_url: Base URL of the Latch instance
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for rate-limited requests
+            debug: Enable debug logging
+            rate_limit: Pace requests client-side to stay under the server limit
+            rate_limiter: Limiter to use (e.g. shared with a LatchBot)
+            max_rate_limit_wait: Longest time in seconds a call may wait for
+                a rate limit slot before failing fast with RateLimitError
+            conversation_cache_ttl: Cache get_conversation results for this
+                many seconds (disabled by default)
+            conversation_cache_size: Maximum number of cached conversations
+            coalesce_requests: Share one in-flight request between coroutines
+                issuing the same GET at the same time
+            retry_policy: Backoff policy for connection errors and 5xx
+                responses (idempotent methods only by default)
+            retry_budget: Cap on retries relative to traffic; shared per
+                host by default
+            circuit_breaker: Breaker that fails fast while the server is
+                unhealthy; shared per host by default
+            codec: JSON codec for request and response bodies (orjson or
+                msgspec when installed, else the standard library)
+            hooks: Instrumentation hooks, e.g. a MetricsCollector
+            max_connections: Upper bound on concurrently open connections
+            max_keepalive_connections: Idle connections kept for reuse
+            http2: Negotiate HTTP/2 when the server supports it
+        """
+        super().__init__(
+            token,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            debug=debug,
+            rate_limit=rate_limit,
+            rate_limiter=rate_limiter,
+            max_rate_limit_wait=max_rate_limit_wait,
+            conversation_cache_ttl=conversation_cache_ttl,
+            conversation_cache_size=conversation_cache_size,
+            coalesce_requests=coalesce_requests,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            codec=codec,
+            hooks=hooks,
+        )
+
+        import httpx
+
+        self.max_connections = max_connections
+        self._single_flight = AsyncSingleFlight()
+        self._httpx = httpx
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._default_headers(),
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            http2=http2,
+        )
+
+    async def send_message(
+        self,
+        conversation_id: int,
+        text: str,
+        thread_id: Optional[int] = None,
+    ) -> Message:
+        """
+        Send a message to a conversation.
+
+        Args:
+            conversation_id: ID of the conversation to send to
+            text: Message content (supports Markdown)
+            thread_id: Optional parent message ID for threaded replies
+
+        Returns:
+            Message: The created message
+        """
+        payload = self._message_payload(conversation_id, text, thread_id)
+        response = await self._request("POST", "/api/bot/messages", json=payload)
+        return Message.from_dict(response["message"])
+
+    async def send_threaded_reply(
+        self,
+        conversation_id: int,
+        thread_id: int,
+        text: str,
+    ) -> Message:
+        """
+        Send a reply to a thread.
+
+        Args:
+            conversation_id: ID of the conversation
+            thread_id: ID of the parent message
+            text: Reply content (supports Markdown)
+
+        Returns:
+            Message: The created reply message
+        """
+        return await self.send_message(
+            conversation_id=conversation_id,
+            text=text,
+            thread_id=thread_id,
+        )
+
+    async def send_messages_bulk(
+        self,
+        items: Iterable[BulkItem],
+        max_concurrency: Optional[int] = None,
+    ) -> BulkResult:
+        """
+        Send many messages concurrently.
+
+        Args:
+            items: ``(conversation_id, text)`` or
+                ``(conversation_id, text, thread_id)`` tuples, or dicts with
+                the same keys
+            max_concurrency: Maximum requests in flight (defaults to
+                ``max_connections``, at most the rate limit's burst)
+
+        Returns:
+            List with a Message or the raised LatchBotError for each item,
+            in input order; requests wait for rate limit budget (ignoring
+            ``max_rate_limit_wait``) rather than fail
+        """
+        payloads = self._bulk_payloads(items)
+        semaphore = asyncio.Semaphore(
+            self._bulk_concurrency(max_concurrency, self.max_connections)
+        )
+
+        async def send(payload: Dict[str, Any]) -> Union[Message, Exception]:
+            async with semaphore:
+                try:
+                    response = await self._send_request(
+                        "POST", "/api/bot/messages", payload, None, wait_for_budget=True
+                    )
+                    return Message.from_dict(response["message"])
+                except LatchBotError as e:
+                    return e
+
+        return list(await asyncio.gather(*(send(p) for p in payloads)))
+
+    async def get_conversation(self, conversation_id: int) -> Conversation:
+        """
+        Get information about a conversation.
+
+        Args:
+            conversation_id: ID of the conversation
+
+        Returns:
+            Conversation: The conversation details
+        """
+        cached = self._cached_conversation(conversation_id)
+        if cached is not None:
+            return cached
+
+        response = await self._request(
+            "GET", f"/api/bot/conversations/{conversation_id}"
+        )
+        conversation = Conversation.from_dict(response["conversation"])
+        self._cache_conversation(conversation)
+        return conversation
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncLatchBot":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the Latch API.
+
+        Identical GET requests awaited concurrently are coalesced into one.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path (e.g., /api/bot/messages)
+            json: JSON body data
+            params: Query parameters
+
+        Returns:
+            Dict containing the response data
+
+        Raises:
+            LatchBotError: On API errors
+        """
+        flight_key = self._flight_key(method, path, params)
+        if flight_key is None:
+            return await self._send_request(method, path, json, params)
+        return await self._single_flight.do(
+            flight_key, lambda: self._send_request(method, path, json, params)
+        )
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        wait_for_budget: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Send a request, pacing it through the rate limiter.
+
+        Rate limit waits and 429 retries are awaited, so they never block
+        the event loop. With ``rate_limit=False`` the retry awaits
+        ``Retry-After`` itself.
+        """
+        body = self._encode_body(json)
+        key = self._rate_limit_key(method, path)
+        template = _path_template(path)
+        attempt = 0
+        retry_count = 0
+        error_retries = 0
+        self.retry_budget.record_request()
+
+        while True:
+            info = RequestInfo(
+                method=method,
+                path=template,
+                attempt=attempt,
+                request_bytes=len(body) if body else 0,
+            )
+            attempt += 1
+
+            delay = self._reserve_rate_limit(key, wait_for_budget)
+            if delay > 0:
+                self._emit("on_rate_limited", info, delay)
+                await asyncio.sleep(delay)
+
+            if self.debug:
+                logger.debug(f"{method} {self.base_url}{path}")
+                if json:
+                    logger.debug(f"Request body: {json}")
+
+            self.circuit_breaker.allow()
+            try:
+                self._emit("on_request_start", info)
+                started = time.perf_counter()
+                response = await self._client.request(
+                    method,
+                    path,
+                    content=body,
+                    params=params,
+                )
+            except self._httpx.HTTPError as e:
+                self._record_outcome(None)
+                info.duration = time.perf_counter() - started
+                info.error = e
+                self._emit("on_request_end", info)
+                backoff = self._retry_delay(method, error_retries, None)
+                if backoff is None:
+                    raise LatchBotError(f"Request failed: {e}")
+                error_retries += 1
+                logger.warning(
+                    f"Request failed ({e}), retrying in {backoff:.2f}s "
+                    f"(attempt {error_retries}/{self.retry_policy.max_retries})"
+                )
+                self._emit("on_retry", info, backoff)
+                await asyncio.sleep(backoff)
+                continue
+            except BaseException:
+                # Interrupted before reaching the server: free the probe slot
+                self.circuit_breaker.release()
+                raise
+
+            self._record_outcome(response.status_code)
+            info.duration = time.perf_counter() - started
+            info.status = response.status_code
+            info.response_bytes = len(response.content)
+            self._emit("on_request_end", info)
+
+            if self.debug:
+                logger.debug(f"Response status: {response.status_code}")
+                logger.debug(f"Response body: {self._body_preview(response)}")
+
+            self._observe_rate_limit(key, response)
+
+            try:
+                return self._handle_response(response)
+            except RateLimitError as e:
+                if retry_count >= self.max_retries:
+                    raise
+                retry_count += 1
+                logger.warning(
+                    f"Rate limited, retry scheduled in {e.retry_after}s "
+                    f"(attempt {retry_count}/{self.max_retries})"
+                )
+                self._emit("on_retry", info, float(e.retry_after or 0))
+                if self.rate_limiter is None:
+                    # No limiter to queue the retry behind; wait it out here
+                    await asyncio.sleep(e.retry_after or 0)
+            except ServerError as e:
+                info.error = e
+                backoff = self._retry_delay(method, error_retries, e.status_code)
+                if backoff is None:
+                    raise
+                error_retries += 1
+                logger.warning(
+                    f"{e}, retrying in {backoff:.2f}s "
+                    f"(attempt {error_retries}/{self.retry_policy.max_retries})"
+                )
+                self._emit("on_retry", info, backoff)
+                await asyncio.sleep(backoff)
@@ -0,0 +1,343 @@
+"""
+Latch Bot SDK Message Batches
+
+Column-wise storage of message pages for bots that scan large histories.
+"""
+
+from array import array
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .models import Message
+from .timestamps import parse_timestamp
+
+# Sentinel in the created_at column for messages without a timestamp
+NO_TIMESTAMP = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_US_PER_HOUR = 3_600_000_000
+_US_PER_DAY = 24 * _US_PER_HOUR
+
+GROUP_KEYS = ("user_id", "conversation_id", "hour", "hour_of_day", "day")
+
+Mask = Union[Sequence[bool], Any]  # list of bools or a NumPy bool array
+
+
+def _numpy() -> Any:
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _to_micros(value: Optional[str]) -> int:
+    dt = parse_timestamp(value)
+    if dt is None:
+        return NO_TIMESTAMP
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def _from_micros(value: int) -> Optional[datetime]:
+    if value == NO_TIMESTAMP:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _micros(value: Union[datetime, int]) -> int:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _EPOCH) // _ONE_MICROSECOND
+    return value
+
+
+class MessageBatch:
+    """
+    A page or stream of messages stored column-wise.
+
+    ``ids``, ``conversation_ids``, ``user_ids``, ``parent_ids`` (0 for top
+    level messages) and ``created_at`` (UTC microseconds since the epoch)
+    are ``array('q')`` columns; ``bodies`` holds the Markdown bodies.
+    Filters and group-bys run over the columns, using NumPy when it is
+    installed, without creating a ``Message`` per row. Individual messages
+    are materialized on demand by indexing or iterating.
+
+    Example:
+        batch = MessageBatch.from_dicts(page)
+        recent = batch.where(since=datetime(2024, 5, 1, tzinfo=timezone.utc))
+        recent.count_by("user_id")      # {user_id: messages}
+        recent.count_by("hour_of_day")  # {0..23: messages}
+        recent[0]                       # Message
+    """
+
+    def __init__(self, keep_raw: bool = True, use_numpy: Optional[bool] = None):
+        """
+        Create an empty batch.
+
+        Args:
+            keep_raw: Keep the source dicts so materialized messages are
+                complete (user, reactions, attachments). Without them,
+                messages are rebuilt from the columns only.
+            use_numpy: Force NumPy on or off; by default it is used when
+                installed
+        """
+        self.ids = array("q")
+        self.conversation_ids = array("q")
+        self.user_ids = array("q")
+        self.parent_ids = array("q")
+        self.created_at = array("q")
+        self.bodies: List[str] = []
+        self._raw: Optional[List[Dict[str, Any]]] = [] if keep_raw else None
+        self._np = _numpy() if use_numpy is not False else None
+        if use_numpy and self._np is None:
+            raise ImportError("NumPy is not installed")
+
+    @classmethod
+    def from_dicts(
+        cls,
+        messages: Iterable[Dict[str, Any]],
+        keep_raw: bool = True,
+        use_numpy: Optional[bool] = None,
+    ) -> "MessageBatch":
+        """Build a batch from message dicts as returned by the API."""
+        batch = cls(keep_raw=keep_raw, use_numpy=use_numpy)
+        batch.extend(messages)
+        return batch
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """Append message dicts, e.g. the next page of a stream."""
+        if not isinstance(messages, list):
+            messages = list(messages)
+        self.ids.extend([m["id"] for m in messages])
+        self.conversation_ids.extend([m["conversation_id"] for m in messages])
+        self.user_ids.extend([m["user_id"] for m in messages])
+        self.parent_ids.extend([m.get("parent_message_id") or 0 for m in messages])
+        self.created_at.extend([_to_micros(m.get("created_at")) for m in messages])
+        self.bodies.extend([m.get("body_md", "") for m in messages])
+        if self._raw is not None:
+            self._raw.extend(messages)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Message:
+        """Materialize the message at ``index``."""
+        if self._raw is not None:
+            return Message.from_dict(self._raw[index], lazy=True)
+        parent_id = self.parent_ids[index]
+        return Message(
+            id=self.ids[index],
+            conversation_id=self.conversation_ids[index],
+            user_id=self.user_ids[index],
+            body_md=self.bodies[index],
+            body_html="",
+            parent_message_id=parent_id or None,
+            created_at=_from_micros(self.created_at[index]),
+        )
+
+    def __iter__(self) -> Iterator[Message]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, name: str) -> Any:
+        """
+        Return a column as a NumPy array (zero-copy) if available.
+
+        Args:
+            name: ``ids``, ``conversation_ids``, ``user_ids``,
+                ``parent_ids`` or ``created_at``
+
+        Returns:
+            ``numpy.ndarray`` of int64 when NumPy is used, otherwise the
+            underlying ``array('q')``. A NumPy view pins the column, so drop
+            it before calling :meth:`extend`.
+        """
+        values = getattr(self, name)
+        if not isinstance(values, array):
+            raise ValueError(f"Not a numeric column: {name}")
+        if self._np is not None:
+            return self._np.frombuffer(values, dtype=self._np.int64)
+        return values
+
+    def mask(
+        self,
+        user_id: Optional[int] = None,
+        conversation_id: Optional[int] = None,
+        since: Optional[Union[datetime, int]] = None,
+        until: Optional[Union[datetime, int]] = None,
+        threads_only: bool = False,
+    ) -> Mask:
+        """
+        Row mask for the given conditions (all must hold).
+
+        Args:
+            user_id: Only messages by this user
+            conversation_id: Only messages in this conversation
+            since: Only messages created at or after this time
+                (aware datetime, or epoch microseconds)
+            until: Only messages created before this time
+            threads_only: Only thread replies
+
+        Returns:
+            NumPy bool array, or a list of bools without NumPy
+        """
+        np = self._np
+        if np is not None:
+            result = np.ones(len(self), dtype=bool)
+            if user_id is not None:
+                result &= self.column("user_ids") == user_id
+            if conversation_id is not None:
+                result &= self.column("conversation_ids") == conversation_id
+            if since is not None:
+                result &= self.column("created_at") >= _micros(since)
+            if until is not None:
+                created = self.column("created_at")
+                result &= (created < _micros(until)) & (created != NO_TIMESTAMP)
+            if threads_only:
+                result &= self.column("parent_ids") != 0
+            return result
+
+        selected = set(self._select(user_id, conversation_id, since, until, threads_only))
+        return [i in selected for i in range(len(self))]
+
+    def _select(
+        self,
+        user_id: Optional[int],
+        conversation_id: Optional[int],
+        since: Optional[Union[datetime, int]],
+        until: Optional[Union[datetime, int]],
+        threads_only: bool,
+    ) -> List[int]:
+        """Indices matching all conditions (pure Python path)."""
+        # Each condition narrows the index list, so later ones scan fewer rows
+        indices: Optional[List[int]] = None
+        for column, value in ((self.user_ids, user_id), (self.conversation_ids, conversation_id)):
+            if value is None:
+                continue
+            if indices is None:
+                indices = [i for i, v in enumerate(column) if v == value]
+            else:
+                indices = [i for i in indices if column[i] == value]
+
+        if since is not None or until is not None:
+            lower = NO_TIMESTAMP + 1 if since is None else max(_micros(since), NO_TIMESTAMP + 1)
+            upper = 2 ** 63 - 1 if until is None else _micros(until)
+            created = self.created_at
+            if indices is None:
+                indices = [i for i, v in enumerate(created) if lower <= v < upper]
+            else:
+                indices = [i for i in indices if lower <= created[i] < upper]
+
+        if threads_only:
+            parents = self.parent_ids
+            if indices is None:
+                indices = [i for i, v in enumerate(parents) if v]
+            else:
+                indices = [i for i in indices if parents[i]]
+
+        return list(range(len(self))) if indices is None else indices
+
+    def where(
+        self,
+        user_id: Optional[int] = None,
+        conversation_id: Optional[int] = None,
+        since: Optional[Union[datetime, int]] = None,
+        until: Optional[Union[datetime, int]] = None,
+        threads_only: bool = False,
+    ) -> "MessageBatch":
+        """New batch with the rows matching all conditions (see :meth:`mask`)."""
+        if self._np is not None:
+            return self.take(self.mask(user_id, conversation_id, since, until, threads_only))
+        return self.take(self._select(user_id, conversation_id, since, until, threads_only))
+
+    def take(self, selector: Union[Mask, Sequence[int]]) -> "MessageBatch":
+        """
+        New batch with selected rows.
+
+        Args:
+            selector: Bool mask (as returned by :meth:`mask`) or row indices
+        """
+        np = self._np
+        batch = MessageBatch(keep_raw=self._raw is not None, use_numpy=np is not None)
+        if np is not None:
+            selector = np.asarray(selector)
+            if selector.dtype == bool:
+                positions = np.flatnonzero(selector)
+            else:
+                positions = selector.astype(np.intp)
+            for name in ("ids", "conversation_ids", "user_ids", "parent_ids", "created_at"):
+                getattr(batch, name).frombytes(self.column(name)[positions].tobytes())
+            indices = positions.tolist()
+        else:
+            if len(selector) and isinstance(selector[0], bool):
+                indices = [i for i, keep in enumerate(selector) if keep]
+            else:
+                indices = list(selector)
+            for name in ("ids", "conversation_ids", "user_ids", "parent_ids", "created_at"):
+                column = getattr(self, name)
+                getattr(batch, name).extend([column[i] for i in indices])
+        batch.bodies = [self.bodies[i] for i in indices]
+        if self._raw is not None:
+            batch._raw = [self._raw[i] for i in indices]
+        return batch
+
+    def count_by(self, key: str) -> Dict[Any, int]:
+        """
+        Count messages per group.
+
+        Args:
+            key: ``user_id``, ``conversation_id``, ``hour`` (UTC datetime
+                truncated to the hour), ``hour_of_day`` (0-23, UTC) or
+                ``day`` (UTC date)
+
+        Returns:
+            Dict of group value to message count. Messages without a
+            timestamp are left out of the time-based groups.
+        """
+        if key not in GROUP_KEYS:
+            raise ValueError(f"Unknown group key: {key} (expected one of {', '.join(GROUP_KEYS)})")
+
+        np = self._np
+        if key in ("user_id", "conversation_id"):
+            column_name = "user_ids" if key == "user_id" else "conversation_ids"
+            if np is not None:
+                values, counts = np.unique(self.column(column_name), return_counts=True)
+                return dict(zip(values.tolist(), counts.tolist()))
+            return dict(Counter(getattr(self, column_name)))
+
+        if np is not None:
+            created = self.column("created_at")
+            created = created[created != NO_TIMESTAMP]
+            if key == "hour_of_day":
+                buckets = (created // _US_PER_HOUR) % 24
+            elif key == "hour":
+                buckets = created // _US_PER_HOUR
+            else:
+                buckets = created // _US_PER_DAY
+            values, counts = np.unique(buckets, return_counts=True)
+            counted = zip(values.tolist(), counts.tolist())
+        else:
+            # One pass over the column; coarser buckets are folded from hours
+            hours = Counter([v // _US_PER_HOUR for v in self.created_at if v != NO_TIMESTAMP])
+            if key == "hour":
+                counted = hours.items()
+            else:
+                folded: Counter = Counter()
+                for hour, n in hours.items():
+                    folded[hour % 24 if key == "hour_of_day" else hour // 24] += n
+                counted = folded.items()
+
+        if key == "hour_of_day":
+            return dict(counted)
+        if key == "hour":
+            return {_EPOCH + timedelta(hours=h): n for h, n in counted}
+        return {date(1970, 1, 1) + timedelta(days=d): n for d, n in counted}
+
+    def __repr__(self) -> str:
+        return f"MessageBatch({len(self)} messages)"
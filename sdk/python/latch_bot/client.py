@@ -4,14 +4,25 @@ Latch Bot SDK Client
 Main client for interacting with the Latch Bot API.
 """
 
+import re
 import time
 import logging
-from typing import Optional, Dict, Any
-from urllib.parse import urljoin
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Hashable, Iterable, List, Mapping, Sequence, Tuple, Union
+from urllib.parse import urljoin, urlparse
 
 from .models import Message, Conversation
+from .ratelimit import RateLimiter
+from .cache import TTLCache, SingleFlight
+from .codec import JSONCodec, get_codec
+from .instrumentation import ClientHooks, RequestInfo
+from .retry import (
+    RetryPolicy,
+    RetryBudget,
+    CircuitBreaker,
+    circuit_breaker_for,
+    retry_budget_for,
+)
 from .exceptions import (
     LatchBotError,
     AuthenticationError,
@@ -23,8 +34,370 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+BulkItem = Union[Tuple[int, str], Tuple[int, str, Optional[int]], Mapping[str, Any]]
+BulkResult = List[Union[Message, Exception]]
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def _path_template(path: str) -> str:
+    """Collapse numeric path segments: /conversations/12 -> /conversations/{id}."""
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+class _LatchBotBase:
+    """
+    Shared configuration and response handling for the Latch Bot clients.
+
+    Both the blocking :class:`LatchBot` and the asyncio-based
+    ``AsyncLatchBot`` derive from this class so that token validation,
+    default headers and the mapping of HTTP errors onto SDK exceptions
+    stay identical between them.
+    """
+
+    DEFAULT_TIMEOUT = 30
+    DEFAULT_RETRIES = 3
+    DEFAULT_CACHE_SIZE = 256
+    USER_AGENT = "LatchBotSDK/1.0.0 (Python)"
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "http://localhost",
+        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_RETRIES,
+        debug: bool = False,
+        rate_limit: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_rate_limit_wait: Optional[float] = None,
+        conversation_cache_ttl: Optional[float] = None,
+        conversation_cache_size: int = DEFAULT_CACHE_SIZE,
+        coalesce_requests: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        codec: Optional[JSONCodec] = None,
+        hooks: Optional[Iterable[ClientHooks]] = None,
+    ):
+        if not token:
+            raise ValueError("Token is required")
+        if not token.startswith("bot_"):
+            raise ValueError("Invalid token format. Token should start with 'bot_'")
+
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.debug = debug
+        self.rate_limiter: Optional[RateLimiter] = None
+        if rate_limit:
+            self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_rate_limit_wait = (
+            max_rate_limit_wait if max_rate_limit_wait is not None else timeout
+        )
+        self._conversation_cache: Optional[TTLCache] = None
+        if conversation_cache_ttl:
+            self._conversation_cache = TTLCache(
+                maxsize=conversation_cache_size, ttl=conversation_cache_ttl
+            )
+        self.coalesce_requests = coalesce_requests
+
+        host = urlparse(self.base_url).netloc or self.base_url
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or retry_budget_for(host)
+        self.circuit_breaker = circuit_breaker or circuit_breaker_for(host)
+        self.codec = codec or get_codec()
+        self.hooks: List[ClientHooks] = list(hooks or [])
+
+        if debug:
+            logging.basicConfig(level=logging.DEBUG)
+            logger.setLevel(logging.DEBUG)
+
+    def invalidate(self, conversation_id: int) -> None:
+        """
+        Drop a conversation from the cache.
+
+        Call this after changing a conversation (e.g. membership) so the
+        next get_conversation fetches fresh data.
+        """
+        if self._conversation_cache is not None:
+            self._conversation_cache.invalidate(conversation_id)
+
+    def clear_cache(self) -> None:
+        """Drop all cached conversations."""
+        if self._conversation_cache is not None:
+            self._conversation_cache.clear()
+
+    @property
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the conversation cache (empty if disabled)."""
+        if self._conversation_cache is None:
+            return {}
+        return self._conversation_cache.stats()
+
+    def _cached_conversation(self, conversation_id: int) -> Optional[Conversation]:
+        if self._conversation_cache is None:
+            return None
+        return self._conversation_cache.get(conversation_id)
+
+    def _cache_conversation(self, conversation: Conversation) -> None:
+        if self._conversation_cache is not None:
+            self._conversation_cache.set(conversation.id, conversation)
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every API request."""
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": self.USER_AGENT,
+        }
+
+    def _rate_limit_key(self, method: str, path: str) -> Hashable:
+        """Rate limit bucket for a request: per token, or also per endpoint."""
+        if self.rate_limiter is not None and self.rate_limiter.per_route:
+            return (self.token, method.upper(), _path_template(path))
+        return (self.token,)
+
+    def _flight_key(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Optional[Hashable]:
+        """Key identifying a coalescible request, or None if it must run alone."""
+        if not self.coalesce_requests or method.upper() != "GET":
+            return None
+        return (path, tuple(sorted((params or {}).items())))
+
+    def add_hook(self, hook: ClientHooks) -> None:
+        """Register an instrumentation hook (see ClientHooks)."""
+        self.hooks.append(hook)
+
+    def _emit(self, event: str, *args: Any) -> None:
+        """Call ``event`` on every hook; hook failures never fail the request."""
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(*args)
+            except Exception:
+                logger.exception(f"Instrumentation hook {hook!r}.{event} failed")
+
+    def _record_outcome(self, status_code: Optional[int]) -> None:
+        """Report a connection error (None) or response status to the breaker."""
+        if status_code is None or status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int],
+    ) -> Optional[float]:
+        """
+        Backoff before retrying a failed attempt.
+
+        Returns:
+            Seconds to wait, or None if the request must not be retried
+            (policy says no, or the retry budget is spent)
+        """
+        if not self.retry_policy.should_retry(method, attempt, status_code):
+            return None
+        if not self.retry_budget.try_acquire():
+            logger.warning(f"Retry budget exhausted, not retrying {method}")
+            return None
+        return self.retry_policy.backoff(attempt)
+
+    def _reserve_rate_limit(self, key: Hashable, wait_for_budget: bool = False) -> float:
+        """
+        Reserve a slot with the rate limiter.
+
+        Args:
+            key: Bucket key
+            wait_for_budget: Accept any wait instead of max_rate_limit_wait
+
+        Returns:
+            Seconds to wait before sending
+
+        Raises:
+            RateLimitError: If the slot is further out than max_rate_limit_wait
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        max_wait = None if wait_for_budget else self.max_rate_limit_wait
+        return self.rate_limiter.reserve(key, max_wait=max_wait)
+
+    def _bulk_concurrency(self, max_concurrency: Optional[int], pool_size: int) -> int:
+        """
+        Requests a bulk send keeps in flight.
+
+        Defaults to the connection pool size, capped at the rate limiter's
+        burst: further requests would only hold a slot waiting for budget.
+        """
+        if max_concurrency:
+            return max_concurrency
+        if self.rate_limiter is None:
+            return pool_size
+        burst = self.rate_limiter.capacity(self._rate_limit_key("POST", "/api/bot/messages"))
+        return max(1, min(pool_size, int(burst)))
+
+    def _observe_rate_limit(self, key: Hashable, response: Any) -> None:
+        """Feed the response's rate limit headers back to the limiter."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(key, response.status_code, response.headers)
+
+    @classmethod
+    def _bulk_payloads(cls, items: Iterable[BulkItem]) -> List[Dict[str, Any]]:
+        """
+        Normalize bulk send items into message payloads.
+
+        Items may be ``(conversation_id, text)``,
+        ``(conversation_id, text, thread_id)`` or a mapping with
+        ``conversation_id``, ``text`` and optional ``thread_id`` keys.
+        """
+        payloads = []
+        for item in items:
+            if isinstance(item, Mapping):
+                payloads.append(
+                    cls._message_payload(
+                        item["conversation_id"], item["text"], item.get("thread_id")
+                    )
+                )
+            elif isinstance(item, Sequence) and 2 <= len(item) <= 3:
+                thread_id = item[2] if len(item) == 3 else None
+                payloads.append(cls._message_payload(item[0], item[1], thread_id))
+            else:
+                raise TypeError(f"Invalid bulk message item: {item!r}")
+        return payloads
+
+    @staticmethod
+    def _message_payload(
+        conversation_id: int,
+        text: str,
+        thread_id: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build the request body for ``POST /api/bot/messages``."""
+        payload: Dict[str, Any] = {
+            "conversation_id": conversation_id,
+            "text": text,
+        }
+        if thread_id is not None:
+            payload["thread_id"] = thread_id
+        return payload
+
+    def _encode_body(self, json: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Encode a request body with the client's codec."""
+        if json is None:
+            return None
+        return self.codec.dumps(json)
+
+    @staticmethod
+    def _body_preview(response: Any, limit: int = 500) -> str:
+        """First ``limit`` bytes of a response body, for debug logging."""
+        return response.content[:limit].decode("utf-8", errors="replace")
+
+    def _handle_response(self, response: Any) -> Dict[str, Any]:
+        """
+        Handle the API response and raise appropriate exceptions.
+
+        Works with any response object exposing ``status_code``,
+        ``headers`` and ``content`` (``requests`` and ``httpx`` responses
+        both qualify). The body is decoded exactly once, from bytes, with
+        the client's codec. A 429 is surfaced as :class:`RateLimitError`;
+        retrying is left to the caller.
+        """
+        status = response.status_code
+        raw = response.content
+
+        # Success
+        if 200 <= status < 300:
+            if not raw:
+                return {}
+            try:
+                return self.codec.loads(raw)
+            except ValueError:
+                return {"raw": raw.decode("utf-8", errors="replace")}
+
+        # Try to parse error response
+        try:
+            body = self.codec.loads(raw) if raw else {}
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            body = {"error": raw.decode("utf-8", errors="replace")}
+
+        error_message = body.get("error", body.get("message", "Unknown error"))
+
+        # Handle specific error codes
+        if status == 401:
+            raise AuthenticationError(
+                "Invalid or missing authentication token",
+                status_code=status,
+                response_body=body,
+            )
+
+        if status == 403:
+            code = body.get("code", "")
+            if code == "TOKEN_EXPIRED":
+                raise AuthenticationError(
+                    "Token has expired",
+                    status_code=status,
+                    response_body=body,
+                )
+            elif code == "BOT_INACTIVE":
+                raise AuthenticationError(
+                    "Bot is not active",
+                    status_code=status,
+                    response_body=body,
+                )
+            raise AuthenticationError(
+                f"Access denied: {error_message}",
+                status_code=status,
+                response_body=body,
+            )
+
+        if status == 404:
+            raise NotFoundError(
+                error_message,
+                status_code=status,
+                response_body=body,
+            )
+
+        if status == 422:
+            raise ValidationError(
+                error_message,
+                errors=body.get("errors", {}),
+                status_code=status,
+                response_body=body,
+            )
+
+        if status == 429:
+            raise RateLimitError(
+                "Rate limit exceeded",
+                retry_after=int(response.headers.get("Retry-After", 60)),
+                status_code=status,
+                response_body=body,
+            )
+
+        if status >= 500:
+            raise ServerError(
+                f"Server error: {error_message}",
+                status_code=status,
+                response_body=body,
+            )
+
+        raise LatchBotError(
+            error_message,
+            status_code=status,
+            response_body=body,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(base_url='{self.base_url}')"
+
 
-class LatchBot:
+class LatchBot(_LatchBotBase):
     """
     Latch Bot API client.
 
@@ -44,17 +417,27 @@ class LatchBot:
         conversation = bot.get_conversation(123)
     """
 
-    DEFAULT_TIMEOUT = 30
-    DEFAULT_RETRIES = 3
-    USER_AGENT = "LatchBotSDK/1.0.0 (Python)"
+    DEFAULT_POOL_SIZE = 10
 
     def __init__(
         self,
         token: str,
         base_url: str = "http://localhost",
-        timeout: int = DEFAULT_TIMEOUT,
-        max_retries: int = DEFAULT_RETRIES,
+        timeout: int = _LatchBotBase.DEFAULT_TIMEOUT,
+        max_retries: int = _LatchBotBase.DEFAULT_RETRIES,
         debug: bool = False,
+        rate_limit: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_rate_limit_wait: Optional[float] = None,
+        conversation_cache_ttl: Optional[float] = None,
+        conversation_cache_size: int = _LatchBotBase.DEFAULT_CACHE_SIZE,
+        coalesce_requests: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        codec: Optional[JSONCodec] = None,
+        hooks: Optional[Iterable[ClientHooks]] = None,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
     ):
         """
         Initialize the Latch Bot client.
@@ -65,31 +448,61 @@ class LatchBot:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for rate-limited requests
             debug: Enable debug logging
+            rate_limit: Pace requests client-side to stay under the server limit
+            rate_limiter: Limiter to use (e.g. shared between clients);
+                a private one is created by default
+            max_rate_limit_wait: Longest time in seconds a call may wait for
+                a rate limit slot before failing fast with RateLimitError
+                (defaults to ``timeout``)
+            conversation_cache_ttl: Cache get_conversation results for this
+                many seconds (disabled by default)
+            conversation_cache_size: Maximum number of cached conversations
+            coalesce_requests: Share one in-flight request between threads
+                issuing the same GET at the same time
+            retry_policy: Backoff policy for connection errors and 5xx
+                responses (idempotent methods only by default)
+            retry_budget: Cap on retries relative to traffic; shared per
+                host by default
+            circuit_breaker: Breaker that fails fast while the server is
+                unhealthy; shared per host by default
+            codec: JSON codec for request and response bodies (orjson or
+                msgspec when installed, else the standard library)
+            hooks: Instrumentation hooks, e.g. a MetricsCollector
+            pool_maxsize: Keep-alive connections kept per host; also the
+                default concurrency of send_messages_bulk
         """
-        if not token:
-            raise ValueError("Token is required")
-        if not token.startswith("bot_"):
-            raise ValueError("Invalid token format. Token should start with 'bot_'")
-
-        self.token = token
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.debug = debug
+        super().__init__(
+            token,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            debug=debug,
+            rate_limit=rate_limit,
+            rate_limiter=rate_limiter,
+            max_rate_limit_wait=max_rate_limit_wait,
+            conversation_cache_ttl=conversation_cache_ttl,
+            conversation_cache_size=conversation_cache_size,
+            coalesce_requests=coalesce_requests,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            codec=codec,
+            hooks=hooks,
+        )
 
-        if debug:
-            logging.basicConfig(level=logging.DEBUG)
-            logger.setLevel(logging.DEBUG)
+        # Imported here so that `import latch_bot` stays cheap for workers
+        # that only need the models or the webhook server.
+        import requests
+        from requests.adapters import HTTPAdapter
 
+        self.pool_maxsize = pool_maxsize
+        self._single_flight = SingleFlight()
+        self._requests = requests
         self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": self.USER_AGENT,
-            }
-        )
+        self._session.headers.update(self._default_headers())
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def send_message(
         self,
@@ -121,13 +534,7 @@ class LatchBot:
             )
             print(f"Sent message {message.id}")
         """
-        payload: Dict[str, Any] = {
-            "conversation_id": conversation_id,
-            "text": text,
-        }
-        if thread_id is not None:
-            payload["thread_id"] = thread_id
-
+        payload = self._message_payload(conversation_id, text, thread_id)
         response = self._request("POST", "/api/bot/messages", json=payload)
         return Message.from_dict(response["message"])
 
@@ -154,10 +561,66 @@ class LatchBot:
             thread_id=thread_id,
         )
 
+    def send_messages_bulk(
+        self,
+        items: Iterable[BulkItem],
+        max_concurrency: Optional[int] = None,
+    ) -> BulkResult:
+        """
+        Send many messages concurrently.
+
+        Requests run on a bounded thread pool over the client's pooled
+        session and still go through the rate limiter; once its budget is
+        spent they wait for it (ignoring ``max_rate_limit_wait``) rather
+        than fail. A failing item does not stop the others: its exception
+        is returned in its place.
+
+        Args:
+            items: ``(conversation_id, text)`` or
+                ``(conversation_id, text, thread_id)`` tuples, or dicts with
+                the same keys
+            max_concurrency: Maximum requests in flight (defaults to
+                ``pool_maxsize``, at most the rate limit's burst)
+
+        Returns:
+            List with a Message or the raised LatchBotError for each item,
+            in input order
+
+        Example:
+            results = bot.send_messages_bulk(
+                [(cid, "Maintenance at 18:00 UTC") for cid in channel_ids],
+                max_concurrency=8,
+            )
+            failed = [r for r in results if isinstance(r, Exception)]
+        """
+        payloads = self._bulk_payloads(items)
+        if not payloads:
+            return []
+
+        workers = min(self._bulk_concurrency(max_concurrency, self.pool_maxsize), len(payloads))
+
+        def send(payload: Dict[str, Any]) -> Union[Message, Exception]:
+            try:
+                response = self._send_request(
+                    "POST", "/api/bot/messages", payload, None, wait_for_budget=True
+                )
+                return Message.from_dict(response["message"])
+            except LatchBotError as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="latch-bulk"
+        ) as executor:
+            return list(executor.map(send, payloads))
+
     def get_conversation(self, conversation_id: int) -> Conversation:
         """
         Get information about a conversation.
 
+        When the client was created with ``conversation_cache_ttl``, results
+        are served from an in-memory LRU cache until they expire or are
+        dropped with :meth:`invalidate`.
+
         Args:
             conversation_id: ID of the conversation
 
@@ -172,8 +635,14 @@ class LatchBot:
             conv = bot.get_conversation(123)
             print(f"Channel: {conv.name}, Members: {len(conv.members)}")
         """
+        cached = self._cached_conversation(conversation_id)
+        if cached is not None:
+            return cached
+
         response = self._request("GET", f"/api/bot/conversations/{conversation_id}")
-        return Conversation.from_dict(response["conversation"])
+        conversation = Conversation.from_dict(response["conversation"])
+        self._cache_conversation(conversation)
+        return conversation
 
     def _request(
         self,
@@ -181,17 +650,19 @@ class LatchBot:
         path: str,
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0,
     ) -> Dict[str, Any]:
         """
         Make an HTTP request to the Latch API.
 
+        Identical GET requests issued concurrently from several threads are
+        coalesced: one request goes out and every caller receives its
+        result.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API path (e.g., /api/bot/messages)
             json: JSON body data
             params: Query parameters
-            retry_count: Current retry attempt
 
         Returns:
             Dict containing the response data
@@ -199,134 +670,125 @@ class LatchBot:
         Raises:
             LatchBotError: On API errors
         """
-        url = urljoin(self.base_url, path)
-
-        if self.debug:
-            logger.debug(f"{method} {url}")
-            if json:
-                logger.debug(f"Request body: {json}")
-
-        try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                json=json,
-                params=params,
-                timeout=self.timeout,
-            )
-        except requests.RequestException as e:
-            raise LatchBotError(f"Request failed: {e}")
-
-        if self.debug:
-            logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"Response body: {response.text[:500]}")
-
-        return self._handle_response(response, method, path, json, params, retry_count)
+        flight_key = self._flight_key(method, path, params)
+        if flight_key is None:
+            return self._send_request(method, path, json, params)
+        return self._single_flight.do(
+            flight_key, lambda: self._send_request(method, path, json, params)
+        )
 
-    def _handle_response(
+    def _send_request(
         self,
-        response: requests.Response,
         method: str,
         path: str,
         json: Optional[Dict[str, Any]],
         params: Optional[Dict[str, Any]],
-        retry_count: int,
+        wait_for_budget: bool = False,
     ) -> Dict[str, Any]:
-        """Handle the API response and raise appropriate exceptions."""
-        status = response.status_code
-
-        # Success
-        if 200 <= status < 300:
-            if not response.text:
-                return {}
-            try:
-                return response.json()
-            except ValueError:
-                return {"raw": response.text}
+        """
+        Send a request, pacing it through the rate limiter.
 
-        # Try to parse error response
-        try:
-            body = response.json()
-        except ValueError:
-            body = {"error": response.text}
+        A 429 response blocks the token's bucket for ``Retry-After``
+        seconds and the retry is queued behind it, so concurrent callers
+        share the pause instead of each sleeping and then stampeding the
+        server. With ``rate_limit=False`` the retry sleeps for ``Retry-After``.
+        """
+        url = urljoin(self.base_url, path)
+        body = self._encode_body(json)
+        key = self._rate_limit_key(method, path)
+        template = _path_template(path)
+        attempt = 0
+        retry_count = 0
+        error_retries = 0
+        self.retry_budget.record_request()
+
+        while True:
+            info = RequestInfo(
+                method=method,
+                path=template,
+                attempt=attempt,
+                request_bytes=len(body) if body else 0,
+            )
+            attempt += 1
 
-        error_message = body.get("error", body.get("message", "Unknown error"))
+            delay = self._reserve_rate_limit(key, wait_for_budget)
+            if delay > 0:
+                logger.debug(f"Rate limiter delaying {method} {path} by {delay:.2f}s")
+                self._emit("on_rate_limited", info, delay)
+                time.sleep(delay)
 
-        # Handle specific error codes
-        if status == 401:
-            raise AuthenticationError(
-                "Invalid or missing authentication token",
-                status_code=status,
-                response_body=body,
-            )
+            if self.debug:
+                logger.debug(f"{method} {url}")
+                if json:
+                    logger.debug(f"Request body: {json}")
 
-        if status == 403:
-            code = body.get("code", "")
-            if code == "TOKEN_EXPIRED":
-                raise AuthenticationError(
-                    "Token has expired",
-                    status_code=status,
-                    response_body=body,
+            self.circuit_breaker.allow()
+            try:
+                self._emit("on_request_start", info)
+                started = time.perf_counter()
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    data=body,
+                    params=params,
+                    timeout=self.timeout,
                 )
-            elif code == "BOT_INACTIVE":
-                raise AuthenticationError(
-                    "Bot is not active",
-                    status_code=status,
-                    response_body=body,
+            except self._requests.RequestException as e:
+                self._record_outcome(None)
+                info.duration = time.perf_counter() - started
+                info.error = e
+                self._emit("on_request_end", info)
+                backoff = self._retry_delay(method, error_retries, None)
+                if backoff is None:
+                    raise LatchBotError(f"Request failed: {e}")
+                error_retries += 1
+                logger.warning(
+                    f"Request failed ({e}), retrying in {backoff:.2f}s "
+                    f"(attempt {error_retries}/{self.retry_policy.max_retries})"
                 )
-            raise AuthenticationError(
-                f"Access denied: {error_message}",
-                status_code=status,
-                response_body=body,
-            )
-
-        if status == 404:
-            raise NotFoundError(
-                error_message,
-                status_code=status,
-                response_body=body,
-            )
+                self._emit("on_retry", info, backoff)
+                time.sleep(backoff)
+                continue
+            except BaseException:
+                # Interrupted before reaching the server: free the probe slot
+                self.circuit_breaker.release()
+                raise
+
+            self._record_outcome(response.status_code)
+            info.duration = time.perf_counter() - started
+            info.status = response.status_code
+            info.response_bytes = len(response.content)
+            self._emit("on_request_end", info)
+
+            if self.debug:
+                logger.debug(f"Response status: {response.status_code}")
+                logger.debug(f"Response body: {self._body_preview(response)}")
+
+            self._observe_rate_limit(key, response)
 
-        if status == 422:
-            raise ValidationError(
-                error_message,
-                errors=body.get("errors", {}),
-                status_code=status,
-                response_body=body,
-            )
-
-        if status == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
-
-            if retry_count < self.max_retries:
+            try:
+                return self._handle_response(response)
+            except RateLimitError as e:
+                if retry_count >= self.max_retries:
+                    raise
+                retry_count += 1
                 logger.warning(
-                    f"Rate limited, retrying in {retry_after}s "
-                    f"(attempt {retry_count + 1}/{self.max_retries})"
+                    f"Rate limited, retry scheduled in {e.retry_after}s "
+                    f"(attempt {retry_count}/{self.max_retries})"
                 )
-                time.sleep(retry_after)
-                return self._request(
-                    method, path, json, params, retry_count=retry_count + 1
+                self._emit("on_retry", info, float(e.retry_after or 0))
+                if self.rate_limiter is None:
+                    # No limiter to queue the retry behind; wait it out here
+                    time.sleep(e.retry_after or 0)
+            except ServerError as e:
+                info.error = e
+                backoff = self._retry_delay(method, error_retries, e.status_code)
+                if backoff is None:
+                    raise
+                error_retries += 1
+                logger.warning(
+                    f"{e}, retrying in {backoff:.2f}s "
+                    f"(attempt {error_retries}/{self.retry_policy.max_retries})"
                 )
-
-            raise RateLimitError(
-                "Rate limit exceeded",
-                retry_after=retry_after,
-                status_code=status,
-                response_body=body,
-            )
-
-        if status >= 500:
-            raise ServerError(
-                f"Server error: {error_message}",
-                status_code=status,
-                response_body=body,
-            )
-
-        raise LatchBotError(
-            error_message,
-            status_code=status,
-            response_body=body,
-        )
-
-    def __repr__(self) -> str:
-        return f"LatchBot(base_url='{self.base_url}')"
+                self._emit("on_retry", info, backoff)
+                time.sleep(backoff)
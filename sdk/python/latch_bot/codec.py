@@ -0,0 +1,132 @@
+"""
+Latch Bot SDK JSON Codecs
+
+Pluggable JSON encoding/decoding for API request and response bodies.
+
+``orjson`` or ``msgspec`` are used automatically when installed
+(``pip install "latch-bot-sdk[fast]"``); otherwise the standard library
+``json`` module is used.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+Bytes = Union[bytes, bytearray, memoryview, str]
+
+
+class JSONCodec:
+    """
+    Base class for JSON codecs.
+
+    Codecs encode straight to UTF-8 bytes and decode from bytes, so bodies
+    are never round-tripped through an intermediate ``str``. Decoding
+    errors are raised as ``ValueError`` regardless of the backend.
+    """
+
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` to UTF-8 JSON bytes."""
+        raise NotImplementedError
+
+    def loads(self, data: Bytes) -> Any:
+        """Decode JSON ``data``."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibCodec(JSONCodec):
+    """Codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Bytes) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Bytes) -> Any:
+        # orjson.JSONDecodeError is a ValueError subclass
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by ``msgspec.json``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+_default_codec: Optional[JSONCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Return a JSON codec.
+
+    Args:
+        name: ``"orjson"``, ``"msgspec"`` or ``"json"``. When omitted, the
+            fastest installed backend is returned.
+
+    Raises:
+        ValueError: If ``name`` is unknown
+        ImportError: If the named backend is not installed
+    """
+    global _default_codec
+
+    if name is not None:
+        try:
+            return _CODECS[name]()
+        except KeyError:
+            raise ValueError(f"Unknown JSON codec: {name}")
+
+    if _default_codec is None:
+        for factory in (OrjsonCodec, MsgspecCodec):
+            try:
+                _default_codec = factory()
+                break
+            except ImportError:
+                continue
+        else:
+            _default_codec = StdlibCodec()
+    return _default_codec
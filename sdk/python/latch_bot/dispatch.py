@@ -0,0 +1,330 @@
+"""
+Latch Bot SDK Deferred Dispatch
+
+Runs slash command handlers in the background so the webhook can be
+acknowledged immediately, well within the server's webhook timeout.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .webhook import CommandContext, CommandHandler
+
+logger = logging.getLogger(__name__)
+
+_STOP = None
+
+
+def _run(ctx: "CommandContext", handler: "CommandHandler") -> bool:
+    """Run a deferred handler; returns False if it raised."""
+    from .webhook import _call
+
+    try:
+        result = _call(handler, ctx)
+        if result is not None:
+            logger.debug(f"Discarding return value of deferred /{ctx.command}")
+        return True
+    except Exception as e:
+        logger.exception(f"Deferred handler error for /{ctx.command}: {e}")
+        return False
+
+
+class _WorkQueue:
+    """A bounded queue served by ``workers`` threads, with counters."""
+
+    def __init__(self, name: str, workers: int, queue_size: int):
+        self.name = name
+        self.workers = workers
+        self._queue: "queue.Queue[Optional[Tuple[Any, Any, float]]]" = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._shed = 0
+        self._max_wait = 0.0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def submit(self, ctx: "CommandContext", handler: "CommandHandler") -> bool:
+        with self._lock:
+            if self._closed:
+                self._shed += 1
+                return False
+            if not self._threads:
+                self._start()
+            # Enqueue under the same lock hold as the closed check, so
+            # nothing lands behind the _STOP sentinels close() puts
+            try:
+                self._queue.put_nowait((ctx, handler, time.monotonic()))
+            except queue.Full:
+                self._shed += 1
+                full = True
+            else:
+                self._submitted += 1
+                full = False
+        if full:
+            logger.warning(f"Deferred queue {self.name} full, shedding /{ctx.command}")
+            return False
+        return True
+
+    def _start(self) -> None:
+        for i in range(self.workers):
+            suffix = f"-{i}" if self.workers > 1 else ""
+            thread = threading.Thread(target=self._work, name=f"{self.name}{suffix}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            ctx, handler, queued_at = item
+            started = time.monotonic()
+            with self._lock:
+                self._in_flight += 1
+                self._max_wait = max(self._max_wait, started - queued_at)
+            ok = _run(ctx, handler)
+            # Latency is queue wait plus run time: what the invoker waits for
+            latency = time.monotonic() - queued_at
+            with self._lock:
+                self._in_flight -= 1
+                if ok:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            done = self._completed + self._failed
+            return {
+                "queued": self._queue.qsize(),
+                "in_flight": self._in_flight,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "shed": self._shed,
+                "max_wait": self._max_wait,
+                "avg_latency": self._total_latency / done if done else 0.0,
+                "max_latency": self._max_latency,
+            }
+
+    def reset_after_fork(self) -> None:
+        """Start over in a forked child: the parent's threads did not survive."""
+        # The lock may have been held by a parent thread at fork time, and
+        # queued calls belong to the parent
+        self.__init__(self.name, self.workers, self._queue.maxsize)  # type: ignore[misc]
+
+    def close(self) -> List[threading.Thread]:
+        """Stop accepting calls and signal the workers; returns them for joining."""
+        with self._lock:
+            if self._closed:
+                return []
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(_STOP)
+        return threads
+
+
+def _join(threads: List[threading.Thread], timeout: Optional[float]) -> None:
+    for thread in threads:
+        thread.join(timeout)
+
+
+class DeferredDispatcher:
+    """
+    Bounded queue of deferred handler calls served by a pool of threads.
+
+    When the queue is full, :meth:`submit` refuses the call instead of
+    blocking, so a backlog of slow handlers can never delay the webhook
+    response. Handlers deliver their result with ``ctx.reply``; return
+    values are discarded, since the webhook has already been answered.
+    ``async def`` handlers of webhooks handled with ``handle_async`` run on
+    that event loop (the worker thread waits for them, so ``workers`` still
+    bounds how many run at once); otherwise they run to completion on a
+    new loop in the worker thread.
+
+    Calls run in parallel, so two commands in one conversation may reply
+    out of order; use :class:`ShardedDispatcher` when order matters.
+
+    Example:
+        dispatcher = DeferredDispatcher(workers=8, queue_size=200)
+        webhook = WebhookServer(bot, dispatcher=dispatcher)
+
+        @webhook.command("weather", defer=True, ack="Fetching the forecast…")
+        def weather(ctx):
+            ctx.reply(fetch_forecast(ctx.text))
+    """
+
+    def __init__(self, workers: int = 8, queue_size: int = 100):
+        """
+        Initialize the dispatcher.
+
+        Worker threads are started on the first submission.
+
+        Args:
+            workers: Number of worker threads
+            queue_size: Calls that may wait for a worker before new ones
+                are shed
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.queue_size = queue_size
+        self._queue = _WorkQueue("latch-deferred", workers, queue_size)
+
+    def submit(self, ctx: "CommandContext", handler: "CommandHandler") -> bool:
+        """
+        Queue a handler call.
+
+        Args:
+            ctx: Command context passed to the handler
+            handler: Command handler
+
+        Returns:
+            True if the call was queued, False if it was shed because the
+            queue is full or the dispatcher is shut down
+        """
+        return self._queue.submit(ctx, handler)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Dispatcher counters.
+
+        Returns:
+            Dict with ``queued`` (waiting now), ``in_flight``, ``submitted``,
+            ``completed``, ``failed``, ``shed``, ``max_wait`` (longest time
+            in seconds a call waited for a worker) and ``avg_latency`` /
+            ``max_latency`` (queue wait plus run time, in seconds)
+        """
+        return self._queue.stats()
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting calls and stop the workers once the queue is drained.
+
+        Args:
+            wait: Block until queued and running handlers have finished
+            timeout: Maximum seconds to wait per worker thread
+        """
+        threads = self._queue.close()
+        if wait:
+            _join(threads, timeout)
+
+    def _reset_after_fork(self) -> None:
+        # Used by PreforkServer in each worker process
+        self._queue.reset_after_fork()
+
+
+class ShardedDispatcher:
+    """
+    Deferred dispatcher that keeps each conversation's commands in order.
+
+    Calls are hashed by ``conversation_id`` onto ``shards`` queues, each
+    served by a single thread: commands in one conversation run (and reply)
+    in the order they arrived, while different conversations run in
+    parallel. Each shard has its own bounded queue, so a busy conversation
+    only sheds load on its own shard.
+
+    Example:
+        webhook = WebhookServer(bot, dispatcher=ShardedDispatcher(shards=16))
+
+        @webhook.command("deploy", defer=True, ack="Queued")
+        def deploy(ctx):
+            ctx.reply(run_deploy(ctx.text))
+
+        webhook.dispatcher.stats()["shards"][3]["queued"]
+    """
+
+    def __init__(self, shards: int = 8, queue_size: int = 100):
+        """
+        Initialize the dispatcher.
+
+        Shard threads are started on their first submission.
+
+        Args:
+            shards: Number of serial worker queues
+            queue_size: Calls that may wait on each shard before new ones
+                are shed
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.queue_size = queue_size
+        self._shards = [_WorkQueue(f"latch-shard-{i}", 1, queue_size) for i in range(shards)]
+
+    @property
+    def shards(self) -> int:
+        """Number of shards."""
+        return len(self._shards)
+
+    def shard_for(self, conversation_id: int) -> int:
+        """Index of the shard serving a conversation."""
+        return hash(conversation_id) % len(self._shards)
+
+    def submit(self, ctx: "CommandContext", handler: "CommandHandler") -> bool:
+        """
+        Queue a handler call on its conversation's shard.
+
+        Args:
+            ctx: Command context passed to the handler
+            handler: Command handler
+
+        Returns:
+            True if the call was queued, False if it was shed because the
+            shard's queue is full or the dispatcher is shut down
+        """
+        return self._shards[self.shard_for(ctx.conversation_id)].submit(ctx, handler)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Dispatcher counters.
+
+        Returns:
+            Dict with the totals of :meth:`DeferredDispatcher.stats` (the
+            maxima and average taken over all shards) and ``shards``, a
+            list with the same counters for each shard
+        """
+        shards = [shard.stats() for shard in self._shards]
+        totals: Dict[str, Any] = {
+            key: sum(s[key] for s in shards)
+            for key in ("queued", "in_flight", "submitted", "completed", "failed", "shed")
+        }
+        done = totals["completed"] + totals["failed"]
+        totals["max_wait"] = max(s["max_wait"] for s in shards)
+        totals["avg_latency"] = (
+            sum(s["avg_latency"] * (s["completed"] + s["failed"]) for s in shards) / done
+            if done
+            else 0.0
+        )
+        totals["max_latency"] = max(s["max_latency"] for s in shards)
+        totals["shards"] = shards
+        return totals
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting calls and stop the shards once their queues are drained.
+
+        Args:
+            wait: Block until queued and running handlers have finished
+            timeout: Maximum seconds to wait per shard thread
+        """
+        threads: List[threading.Thread] = []
+        for shard in self._shards:
+            threads.extend(shard.close())
+        if wait:
+            _join(threads, timeout)
+
+    def _reset_after_fork(self) -> None:
+        # Used by PreforkServer in each worker process
+        for shard in self._shards:
+            shard.reset_after_fork()
@@ -71,3 +71,17 @@ class ServerError(LatchBotError):
     """Raised when a server error occurs (5xx)."""
 
     pass
+
+
+class CircuitOpenError(LatchBotError):
+    """Raised without contacting the server while its circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[float] = None,
+        status_code: Optional[int] = None,
+        response_body: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(message, status_code, response_body)
+        self.retry_after = retry_after
@@ -0,0 +1,413 @@
+"""
+Latch Bot SDK Outbound HTTP
+
+Pooled, cache-aware HTTP client for the upstream APIs that command handlers
+call (weather services, issue trackers, ...). Handlers get it as
+``ctx.http``, whose timeouts never run past the handler's deadline.
+"""
+
+import email.utils
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .cache import TTLCache
+
+if TYPE_CHECKING:
+    import requests
+
+    from .webhook import CommandContext
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "latch-bot-sdk-python/http"
+
+
+@dataclass
+class _CacheEntry:
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    encoding: Optional[str]
+    url: str
+    fresh_until: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    no_cache: bool
+
+
+def _cache_control(headers: Mapping[str, str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into {directive: value or None}."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
+
+
+def _freshness(headers: Mapping[str, str], now: float) -> Optional[float]:
+    """
+    Seconds a response stays fresh, or None if it must not be stored.
+
+    ``max-age`` wins over ``Expires``; ``no-cache`` stores the response but
+    makes it stale at once, so it is always revalidated.
+    """
+    directives = _cache_control(headers)
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            age = float(headers.get("Age", 0))
+        except ValueError:
+            age = 0.0
+        try:
+            return max(0.0, float(max_age) - age)
+        except ValueError:
+            return 0.0
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            expires_at = email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, expires_at - now)
+    return 0.0
+
+
+class HTTPClient:
+    """
+    Shared HTTP client for calling upstream APIs from handlers.
+
+    - One ``requests.Session`` with keep-alive pools, so repeated calls to
+      the same host reuse connections.
+    - At most ``max_per_host`` concurrent requests per host; further
+      callers wait (bounded by their timeout) instead of opening more
+      connections.
+    - A private HTTP cache for GET requests: fresh responses (per
+      ``Cache-Control: max-age`` or ``Expires``) are served without a
+      request, and stale ones carrying an ``ETag`` or ``Last-Modified``
+      are revalidated with a conditional request. ``no-store`` responses
+      are never stored. Entries are keyed by URL, query parameters and the
+      ``headers`` passed to the request, so responses fetched with one
+      caller's credentials are never served to another; requests using
+      ``auth=`` or ``cookies=`` bypass the cache. ``Vary`` is not
+      interpreted beyond that.
+
+    Example:
+        http = HTTPClient(max_per_host=4)
+        resp = http.get("https://api.example.com/items", params={"q": "x"})
+        resp.from_cache  # True when served or revalidated from the cache
+    """
+
+    DEFAULT_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        max_per_host: int = 10,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_size: int = 256,
+        stale_ttl: float = 3600.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            max_per_host: Concurrent requests (and pooled connections) per host
+            timeout: Default timeout in seconds for connecting and for each
+                socket read (not a limit on the whole request)
+            cache_size: Maximum number of cached responses (LRU); 0
+                disables caching
+            stale_ttl: Seconds a stale response with validators is kept
+                for revalidation
+            headers: Headers sent with every request
+        """
+        # Imported here so that `import latch_bot` stays cheap
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.stale_ttl = stale_ttl
+        self._requests = requests
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = USER_AGENT
+        if headers:
+            self._session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_per_host)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._cache: Optional[TTLCache] = (
+            TTLCache(maxsize=cache_size, ttl=stale_ttl) if cache_size > 0 else None
+        )
+        self._hosts: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._fresh_hits = 0
+        self._revalidated = 0
+        self._fetched = 0
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        cache: bool = True,
+        **kwargs: Any,
+    ) -> "requests.Response":
+        """
+        Send a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            params: Query parameters
+            headers: Extra request headers (part of the cache key)
+            timeout: Timeout in seconds for connecting and for each socket
+                read (defaults to the client's)
+            cache: Use the HTTP cache (GET only)
+            **kwargs: Passed on to ``requests.Session.request`` (``json``,
+                ``data``, ``auth``, ...)
+
+        Returns:
+            ``requests.Response`` with an extra ``from_cache`` attribute
+
+        Raises:
+            requests.Timeout: If no connection slot for the host frees up,
+                or the request does not complete, within ``timeout``
+            requests.RequestException: On other transport errors
+        """
+        timeout = self.timeout if timeout is None else timeout
+        method = method.upper()
+        use_cache = (
+            cache
+            and self._cache is not None
+            and method == "GET"
+            # Credentials we can't key on: never share their responses
+            and not kwargs.get("auth")
+            and not kwargs.get("cookies")
+        )
+        key = self._cache_key(url, params, headers) if use_cache else None
+        entry: Optional[_CacheEntry] = self._cache.get(key) if key is not None else None
+
+        if entry is not None and not entry.no_cache and entry.fresh_until > time.time():
+            with self._lock:
+                self._fresh_hits += 1
+            return self._from_entry(entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        response = self._send(method, url, params, request_headers, timeout, kwargs)
+
+        if entry is not None and response.status_code == 304:
+            # Not modified: refresh freshness from the 304's headers
+            merged = dict(entry.headers)
+            merged.update(response.headers)
+            with self._lock:
+                self._revalidated += 1
+            refreshed = self._store(key, entry.status_code, merged, entry.content, entry.encoding, entry.url)
+            return self._from_entry(refreshed or entry)
+
+        with self._lock:
+            self._fetched += 1
+        response.from_cache = False  # type: ignore[attr-defined]
+        if key is not None and response.status_code == 200:
+            self._store(
+                key, 200, dict(response.headers), response.content, response.encoding, response.url
+            )
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> "requests.Response":
+        """Send a GET request (see :meth:`request`)."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> "requests.Response":
+        """Send a POST request (see :meth:`request`)."""
+        return self.request("POST", url, **kwargs)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: float,
+        kwargs: Dict[str, Any],
+    ) -> "requests.Response":
+        slot = self._host_slot(url)
+        started = time.monotonic()
+        if not slot.acquire(timeout=timeout):
+            raise self._requests.Timeout(f"No connection to {urlsplit(url).netloc} free within {timeout:.1f}s")
+        try:
+            remaining = max(0.001, timeout - (time.monotonic() - started))
+            return self._session.request(
+                method, url, params=params, headers=headers, timeout=remaining, **kwargs
+            )
+        finally:
+            slot.release()
+
+    def _cache_key(
+        self, url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]
+    ) -> str:
+        key = url
+        if params:
+            query = urlencode(sorted(params.items()), doseq=True)
+            key = f"{url}{'&' if '?' in url else '?'}{query}"
+        if headers:
+            # Hashed so credentials don't sit in the keys
+            canonical = "\n".join(
+                f"{name.lower()}:{value}"
+                for name, value in sorted(headers.items(), key=lambda item: item[0].lower())
+            )
+            key += "#" + hashlib.sha256(canonical.encode()).hexdigest()
+        return key
+
+    def _store(
+        self,
+        key: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        encoding: Optional[str],
+        url: str,
+    ) -> Optional[_CacheEntry]:
+        from requests.structures import CaseInsensitiveDict
+
+        headers = CaseInsensitiveDict(headers)
+        now = time.time()
+        fresh_for = _freshness(headers, now)
+        if fresh_for is None:
+            self._cache.invalidate(key)
+            return None
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if fresh_for <= 0 and not (etag or last_modified):
+            # Stale at once and cannot be revalidated: nothing to gain
+            return None
+        entry = _CacheEntry(
+            status_code=status_code,
+            headers=dict(headers),
+            content=content,
+            encoding=encoding,
+            url=url,
+            fresh_until=now + fresh_for,
+            etag=etag,
+            last_modified=last_modified,
+            no_cache="no-cache" in _cache_control(headers),
+        )
+        keep = fresh_for + (self.stale_ttl if etag or last_modified else 0.0)
+        self._cache.set(key, entry, ttl=keep)
+        return entry
+
+    def _from_entry(self, entry: _CacheEntry) -> "requests.Response":
+        from requests.structures import CaseInsensitiveDict
+
+        response = self._requests.Response()
+        response.status_code = entry.status_code
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.content
+        response.encoding = entry.encoding
+        response.url = entry.url
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters.
+
+        Returns:
+            Dict with ``fresh_hits`` (served without a request),
+            ``revalidated`` (304 Not Modified), ``fetched`` (full
+            responses) and ``cached`` (entries held)
+        """
+        with self._lock:
+            return {
+                "fresh_hits": self._fresh_hits,
+                "revalidated": self._revalidated,
+                "fetched": self._fetched,
+                "cached": len(self._cache) if self._cache is not None else 0,
+            }
+
+    def bind(self, ctx: "CommandContext") -> "BoundHTTPClient":
+        """View of this client whose timeouts are capped by ``ctx``'s deadline."""
+        return BoundHTTPClient(self, ctx)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
+
+class BoundHTTPClient:
+    """
+    :class:`HTTPClient` tied to a command's deadline (``ctx.http``).
+
+    Each request's timeout is capped at ``ctx.remaining_time``; once the
+    command is cancelled requests fail at once with ``requests.Timeout``
+    instead of starting doomed work. ``requests`` applies the timeout to
+    connecting and to each socket read, not to the whole request, so a
+    server trickling its response can still run past the deadline; check
+    ``ctx.cancelled`` afterwards.
+    """
+
+    def __init__(self, client: HTTPClient, ctx: "CommandContext"):
+        self.client = client
+        self.ctx = ctx
+
+    def _timeout(self, timeout: Optional[float]) -> Tuple[float, bool]:
+        timeout = self.client.timeout if timeout is None else timeout
+        remaining = self.ctx.remaining_time
+        if remaining is not None and remaining < timeout:
+            return remaining, True
+        return timeout, False
+
+    def request(self, method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """Send a request (see :meth:`HTTPClient.request`)."""
+        timeout, capped = self._timeout(kwargs.pop("timeout", None))
+        if self.ctx.cancelled or timeout <= 0:
+            raise self.client._requests.Timeout(f"Deadline of /{self.ctx.command} has passed")
+        if capped:
+            logger.debug(f"Capping {method} {url} at {timeout:.2f}s for /{self.ctx.command}")
+        return self.client.request(method, url, timeout=timeout, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> "requests.Response":
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> "requests.Response":
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+
+_default: Optional[HTTPClient] = None
+_default_lock = threading.Lock()
+
+
+def default_client() -> HTTPClient:
+    """Process-wide HTTPClient, for contexts not created by a WebhookServer."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = HTTPClient()
+        return _default
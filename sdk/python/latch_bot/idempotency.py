@@ -0,0 +1,310 @@
+"""
+Latch Bot SDK Webhook Idempotency
+
+Drops redelivered webhook events. The server retries a delivery (with
+backoff, up to ``apps.outbox_max_retries`` times) whenever the callback
+times out, even if the handler went on to succeed; without deduplication
+each retry runs the command again and posts another reply. Every delivery
+of one event carries the same ``event_id``.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .cache import TTLCache
+
+Response = Dict[str, Any]
+
+# Covers the server's default backoff schedule (1+5+30+120+300+600 seconds)
+DEFAULT_TTL = 1200.0
+
+# A claim whose handler never finished (e.g. the worker died) expires after
+# this long, so a later redelivery can run the command
+DEFAULT_PENDING_TTL = 60.0
+
+
+def payload_key(data: Dict[str, Any]) -> Optional[str]:
+    """
+    Dedup key for a webhook payload: its ``event_id``.
+
+    Args:
+        data: Request JSON data
+
+    Returns:
+        Key string, or None if the payload has no ``event_id`` (it is then
+        processed without deduplication)
+    """
+    event_id = data.get("event_id")
+    if event_id is not None:
+        return f"event:{event_id}"
+    return None
+
+
+def content_key(data: Dict[str, Any]) -> str:
+    """
+    Dedup key for a webhook payload, falling back to a hash of its content.
+
+    Opt-in for servers that do not send ``event_id``: payloads carry no
+    timestamp, so the same command with the same text from the same user
+    in the same conversation hashes the same, and a deliberate repeat
+    within ``ttl`` is dropped as a duplicate.
+
+    Example:
+        IdempotencyCache(key=content_key, ttl=60)
+
+    Args:
+        data: Request JSON data
+
+    Returns:
+        ``event_id`` key when present, otherwise a SHA-256 of the payload
+    """
+    key = payload_key(data)
+    if key is not None:
+        return key
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Storage backend for :class:`IdempotencyCache`.
+
+    ``claim`` must be atomic: of several concurrent claims for one key
+    (across threads, or processes for shared stores) exactly one succeeds.
+    """
+
+    def claim(self, key: str, ttl: float) -> Tuple[bool, Optional[Response]]:
+        """
+        Claim a key for processing.
+
+        Args:
+            key: Dedup key
+            ttl: Seconds before an unfinished claim expires
+
+        Returns:
+            ``(True, None)`` if the caller now owns the key, otherwise
+            ``(False, response)`` with the stored response, or None while
+            the original is still being processed
+        """
+        raise NotImplementedError
+
+    def complete(self, key: str, response: Response, ttl: float) -> None:
+        """Store the response for a claimed key, keeping it ``ttl`` seconds."""
+        raise NotImplementedError
+
+    def release(self, key: str) -> None:
+        """Drop a claim without a response, so the event can be processed again."""
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Bounded in-process store; enough for a single server process."""
+
+    _PENDING = object()
+
+    def __init__(self, maxsize: int = 10000):
+        """
+        Args:
+            maxsize: Maximum number of remembered events (least recently
+                used are dropped first)
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=DEFAULT_TTL)
+        self._lock = threading.Lock()
+
+    def claim(self, key: str, ttl: float) -> Tuple[bool, Optional[Response]]:
+        with self._lock:
+            value = self._cache.get(key, None)
+            if value is None:
+                self._cache.set(key, self._PENDING, ttl=ttl)
+                return True, None
+        return False, None if value is self._PENDING else value
+
+    def complete(self, key: str, response: Response, ttl: float) -> None:
+        self._cache.set(key, response, ttl=ttl)
+
+    def release(self, key: str) -> None:
+        self._cache.invalidate(key)
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """
+    Store in a SQLite database, shared by all worker processes on a host.
+
+    Each thread uses its own connection; the database runs in WAL mode so
+    readers do not block the writer. Expired rows are purged periodically.
+    """
+
+    PURGE_EVERY = 1000
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Args:
+            path: Database file (created if missing)
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._claims = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS latch_idempotency ("
+                "key TEXT PRIMARY KEY, response TEXT, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def claim(self, key: str, ttl: float) -> Tuple[bool, Optional[Response]]:
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "DELETE FROM latch_idempotency WHERE key = ? AND expires_at <= ?", (key, now)
+            )
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO latch_idempotency (key, response, expires_at) "
+                "VALUES (?, NULL, ?)",
+                (key, now + ttl),
+            ).rowcount
+            row = None
+            if not inserted:
+                row = conn.execute(
+                    "SELECT response FROM latch_idempotency WHERE key = ?", (key,)
+                ).fetchone()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._claims += 1
+        if self._claims % self.PURGE_EVERY == 0:
+            conn.execute("DELETE FROM latch_idempotency WHERE expires_at <= ?", (now,))
+
+        if inserted:
+            return True, None
+        return False, json.loads(row[0]) if row and row[0] is not None else None
+
+    def complete(self, key: str, response: Response, ttl: float) -> None:
+        self._connect().execute(
+            "UPDATE latch_idempotency SET response = ?, expires_at = ? WHERE key = ?",
+            (json.dumps(response), time.time() + ttl, key),
+        )
+
+    def release(self, key: str) -> None:
+        self._connect().execute("DELETE FROM latch_idempotency WHERE key = ?", (key,))
+
+
+class IdempotencyCache:
+    """
+    Deduplicates webhook deliveries for :class:`WebhookServer`.
+
+    The first delivery of an event runs normally and its response is
+    stored; redeliveries within ``ttl`` get that response back without
+    running the handler again. A redelivery that arrives while the first
+    is still running is acknowledged with ``{"ok": True}``.
+
+    Events are keyed by ``event_id``; payloads without one are processed
+    every time. Pass ``key=content_key`` to deduplicate those by content
+    instead, at the cost of dropping identical commands repeated within
+    ``ttl``.
+
+    Example:
+        webhook = WebhookServer(bot, idempotency=IdempotencyCache())
+
+        # Several worker processes on one host:
+        store = SQLiteIdempotencyStore("/var/run/mybot/dedup.db")
+        webhook = WebhookServer(bot, idempotency=IdempotencyCache(store))
+    """
+
+    def __init__(
+        self,
+        store: Optional[IdempotencyStore] = None,
+        ttl: float = DEFAULT_TTL,
+        pending_ttl: float = DEFAULT_PENDING_TTL,
+        key: Callable[[Dict[str, Any]], Optional[str]] = payload_key,
+    ):
+        """
+        Args:
+            store: Backend (defaults to a MemoryIdempotencyStore)
+            ttl: Seconds a processed event is remembered
+            pending_ttl: Seconds before an unfinished claim expires
+            key: Function computing the dedup key of a payload, or None
+                to process it without deduplication
+        """
+        self.store = store if store is not None else MemoryIdempotencyStore()
+        self.ttl = ttl
+        self.pending_ttl = pending_ttl
+        self.key = key
+        self._lock = threading.Lock()
+        self._processed = 0
+        self._duplicates = 0
+        self._in_progress = 0
+        self._unkeyed = 0
+
+    def begin(self, data: Dict[str, Any]) -> Tuple[Optional[str], Optional[Response]]:
+        """
+        Start processing a delivery.
+
+        Args:
+            data: Request JSON data
+
+        Returns:
+            ``(key, None)`` if the delivery should be processed (finish it
+            with :meth:`finish` or :meth:`abandon`), or ``(key, response)``
+            with the response to return for a duplicate. ``key`` is None
+            for a payload without a dedup key.
+        """
+        key = self.key(data)
+        if key is None:
+            with self._lock:
+                self._unkeyed += 1
+            return None, None
+        claimed, response = self.store.claim(key, self.pending_ttl)
+        with self._lock:
+            if claimed:
+                self._processed += 1
+                return key, None
+            self._duplicates += 1
+            if response is None:
+                self._in_progress += 1
+        return key, response if response is not None else {"ok": True}
+
+    def finish(self, key: Optional[str], response: Response) -> None:
+        """Record the response of a processed delivery."""
+        if key is not None:
+            self.store.complete(key, response, self.ttl)
+
+    def abandon(self, key: Optional[str]) -> None:
+        """Forget a delivery whose processing was interrupted."""
+        if key is not None:
+            self.store.release(key)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Dedup counters.
+
+        Returns:
+            Dict with ``processed`` (first deliveries), ``duplicates``
+            (short-circuited redeliveries), ``in_progress`` (duplicates
+            that arrived while the original was still running) and
+            ``unkeyed`` (payloads without a dedup key, processed as is)
+        """
+        with self._lock:
+            return {
+                "processed": self._processed,
+                "duplicates": self._duplicates,
+                "in_progress": self._in_progress,
+                "unkeyed": self._unkeyed,
+            }
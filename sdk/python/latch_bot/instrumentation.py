@@ -0,0 +1,252 @@
+"""
+Latch Bot SDK Instrumentation
+
+Per-request hooks and a built-in metrics collector for the API clients.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class RequestInfo:
+    """
+    Describes one attempt of an API request.
+
+    ``path`` is the path template (``/api/bot/conversations/{id}``) so that
+    metrics are not split per conversation. ``status``, ``response_bytes``,
+    ``duration`` and ``error`` are filled in when the attempt ends.
+    """
+
+    method: str
+    path: str
+    attempt: int = 0
+    request_bytes: int = 0
+    status: Optional[int] = None
+    response_bytes: int = 0
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+
+
+class ClientHooks:
+    """
+    Base class for client instrumentation hooks.
+
+    Override any of the methods and register the instance with
+    ``LatchBot(hooks=[...])`` or ``bot.add_hook(...)``. Hooks run inline on
+    the request path, so keep them cheap. Exceptions raised by a hook are
+    logged and otherwise ignored.
+
+    Example:
+        class SlowRequestLogger(ClientHooks):
+            def on_request_end(self, info):
+                if info.duration > 1:
+                    print(f"slow {info.method} {info.path}: {info.duration:.2f}s")
+    """
+
+    def on_request_start(self, info: RequestInfo) -> None:
+        """Called before each attempt is sent."""
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        """Called after each attempt completes or fails to connect."""
+
+    def on_retry(self, info: RequestInfo, delay: float) -> None:
+        """Called when a failed attempt will be retried after ``delay`` seconds."""
+
+    def on_rate_limited(self, info: RequestInfo, delay: float) -> None:
+        """
+        Called when the rate limiter holds a request back ``delay`` seconds.
+
+        This includes the pause after a 429 response; the 429 itself is
+        reported through on_request_end and on_retry.
+        """
+
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+_Key = Tuple[str, str]
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsCollector(ClientHooks):
+    """
+    In-memory request metrics with Prometheus text rendering.
+
+    Records a latency histogram per method and path template, along with
+    counters for responses by status, retries, rate-limit stalls and bytes
+    transferred.
+
+    Example:
+        metrics = MetricsCollector(labels={"bot": "weather"})
+        bot = LatchBot(token="bot_...", hooks=[metrics])
+        ...
+        metrics.quantile(0.99, "POST", "/api/bot/messages")
+        print(metrics.render_prometheus())
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        labels: Optional[Dict[str, str]] = None,
+        namespace: str = "latch_bot",
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            buckets: Histogram upper bounds in seconds, ascending
+            labels: Constant labels added to every series (e.g. the bot name)
+            namespace: Metric name prefix
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.labels = dict(labels or {})
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._histograms: Dict[_Key, _Histogram] = {}
+        self._statuses: Dict[Tuple[str, str, str], int] = {}
+        self._retries: Dict[_Key, int] = {}
+        self._rate_limited: Dict[_Key, int] = {}
+        self._rate_limit_wait: Dict[_Key, float] = {}
+        self._request_bytes: Dict[_Key, int] = {}
+        self._response_bytes: Dict[_Key, int] = {}
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        key = (info.method, info.path)
+        status = str(info.status) if info.status is not None else "error"
+        index = bisect.bisect_left(self.buckets, info.duration)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets))
+            histogram.counts[index] += 1
+            histogram.sum += info.duration
+            histogram.count += 1
+            status_key = (info.method, info.path, status)
+            self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+            self._request_bytes[key] = self._request_bytes.get(key, 0) + info.request_bytes
+            self._response_bytes[key] = self._response_bytes.get(key, 0) + info.response_bytes
+
+    def on_retry(self, info: RequestInfo, delay: float) -> None:
+        key = (info.method, info.path)
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def on_rate_limited(self, info: RequestInfo, delay: float) -> None:
+        key = (info.method, info.path)
+        with self._lock:
+            self._rate_limited[key] = self._rate_limited.get(key, 0) + 1
+            self._rate_limit_wait[key] = self._rate_limit_wait.get(key, 0.0) + delay
+
+    def quantile(self, q: float, method: str, path: str) -> Optional[float]:
+        """
+        Estimate a latency quantile from the histogram.
+
+        Uses linear interpolation within the bucket, like Prometheus'
+        ``histogram_quantile``.
+
+        Args:
+            q: Quantile between 0 and 1 (0.5 for p50, 0.99 for p99)
+            method: HTTP method
+            path: Path template, e.g. ``/api/bot/messages``
+
+        Returns:
+            Latency in seconds, or None if nothing was recorded
+        """
+        with self._lock:
+            histogram = self._histograms.get((method, path))
+            if histogram is None or histogram.count == 0:
+                return None
+            counts = list(histogram.counts)
+            total = histogram.count
+
+        rank = q * total
+        cumulative = 0
+        for i, count in enumerate(counts):
+            if cumulative + count >= rank and count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower  # +Inf bucket: best estimate is its lower bound
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        with self._lock:
+            self._histograms.clear()
+            self._statuses.clear()
+            self._retries.clear()
+            self._rate_limited.clear()
+            self._rate_limit_wait.clear()
+            self._request_bytes.clear()
+            self._response_bytes.clear()
+
+    def _labels(self, **extra: str) -> str:
+        labels = dict(self.labels)
+        labels.update(extra)
+        return ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines: List[str] = []
+
+        with self._lock:
+            histograms = {k: (list(h.counts), h.sum, h.count) for k, h in self._histograms.items()}
+            counters = [
+                ("requests_total", "API responses by status", "counter", dict(self._statuses)),
+                ("retries_total", "Retried request attempts", "counter", dict(self._retries)),
+                ("rate_limited_total", "Requests held back by rate limiting", "counter", dict(self._rate_limited)),
+                ("rate_limit_wait_seconds_total", "Time spent waiting on rate limits", "counter", dict(self._rate_limit_wait)),
+                ("request_bytes_total", "Request body bytes sent", "counter", dict(self._request_bytes)),
+                ("response_bytes_total", "Response body bytes received", "counter", dict(self._response_bytes)),
+            ]
+
+        name = f"{ns}_request_duration_seconds"
+        lines.append(f"# HELP {name} API request latency")
+        lines.append(f"# TYPE {name} histogram")
+        for (method, path), (counts, total, count) in sorted(histograms.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = self._labels(method=method, path=path, le=_format_bound(bound))
+                lines.append(f"{name}_bucket{{{labels}}} {cumulative}")
+            labels = self._labels(method=method, path=path, le="+Inf")
+            lines.append(f"{name}_bucket{{{labels}}} {count}")
+            labels = self._labels(method=method, path=path)
+            lines.append(f"{name}_sum{{{labels}}} {total}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+
+        for suffix, help_text, kind, values in counters:
+            name = f"{ns}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(values.items()):
+                if len(key) == 3:
+                    labels = self._labels(method=key[0], path=key[1], status=key[2])
+                else:
+                    labels = self._labels(method=key[0], path=key[1])
+                lines.append(f"{name}{{{labels}}} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
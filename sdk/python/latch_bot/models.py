@@ -2,15 +2,81 @@
 Latch Bot SDK Models
 
 Data models representing Latch entities.
+
+Models are slotted (no per-instance ``__dict__``), so bots that keep large
+numbers of messages in memory pay only for the fields themselves.
 """
 
-from dataclasses import dataclass, field
+import weakref
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, FrozenSet, Tuple, Type, TypeVar
+
+from .timestamps import parse_timestamp as _parse_datetime
+
+T = TypeVar("T")
+
+
+def _slotted(*extra: str) -> Callable[[Type[T]], Type[T]]:
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields plus ``extra``.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10.
+    Apply it above ``@dataclass``.
+    """
+    return lambda cls: _add_slots(cls, extra)
+
+
+def _add_slots(cls: Type[T], extra: Tuple[str, ...]) -> Type[T]:
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names + extra
+    for name in field_names:
+        # Defaults live in the generated __init__; as class attributes they
+        # would clash with the slot descriptors.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+class _BinarySerializable:
+    """to_bytes/from_bytes for models; see latch_bot.serialization."""
+
+    __slots__ = ()
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the compact, versioned binary format."""
+        from .serialization import dumps
 
+        return dumps(self)
 
+    @classmethod
+    def from_bytes(cls: Type[T], data: bytes, ctx: Optional["DecodeContext"] = None) -> T:
+        """
+        Deserialize bytes produced by :meth:`to_bytes`.
+
+        Args:
+            data: Serialized model
+            ctx: Identity map for sharing users/conversations
+
+        Raises:
+            ValueError: If ``data`` is not a serialized ``cls`` of a
+                supported schema version
+        """
+        from .serialization import loads
+
+        obj = loads(data, ctx)
+        if not isinstance(obj, cls):
+            raise ValueError(f"Serialized data is a {type(obj).__name__}, not a {cls.__name__}")
+        return obj
+
+
+@_slotted("__weakref__")
 @dataclass
-class User:
+class User(_BinarySerializable):
     """Represents a Latch user."""
 
     id: int
@@ -19,8 +85,10 @@ class User:
     avatar_url: Optional[str] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "User":
-        """Create a User from a dictionary."""
+    def from_dict(cls, data: Dict[str, Any], ctx: Optional["DecodeContext"] = None) -> "User":
+        """Create a User from a dictionary, shared through ``ctx`` if given."""
+        if ctx is not None:
+            return ctx.user(data)
         return cls(
             id=data["id"],
             name=data["name"],
@@ -29,8 +97,9 @@ class User:
         )
 
 
+@_slotted()
 @dataclass
-class ConversationMember:
+class ConversationMember(_BinarySerializable):
     """Represents a member of a conversation."""
 
     id: int
@@ -38,17 +107,20 @@ class ConversationMember:
     user: User
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ConversationMember":
+    def from_dict(
+        cls, data: Dict[str, Any], ctx: Optional["DecodeContext"] = None
+    ) -> "ConversationMember":
         """Create a ConversationMember from a dictionary."""
         return cls(
             id=data["id"],
             conversation_id=data.get("conversation_id", 0),
-            user=User.from_dict(data["user"]) if data.get("user") else None,
+            user=User.from_dict(data["user"], ctx) if data.get("user") else None,
         )
 
 
+@_slotted()
 @dataclass
-class Attachment:
+class Attachment(_BinarySerializable):
     """Represents a file attachment."""
 
     id: int
@@ -69,8 +141,9 @@ class Attachment:
         )
 
 
+@_slotted()
 @dataclass
-class Reaction:
+class Reaction(_BinarySerializable):
     """Represents a reaction on a message."""
 
     id: int
@@ -79,18 +152,19 @@ class Reaction:
     user: Optional[User] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Reaction":
+    def from_dict(cls, data: Dict[str, Any], ctx: Optional["DecodeContext"] = None) -> "Reaction":
         """Create a Reaction from a dictionary."""
         return cls(
             id=data["id"],
             emoji=data["emoji"],
             user_id=data["user_id"],
-            user=User.from_dict(data["user"]) if data.get("user") else None,
+            user=User.from_dict(data["user"], ctx) if data.get("user") else None,
         )
 
 
+@_slotted("_raw", "_ctx")
 @dataclass
-class Message:
+class Message(_BinarySerializable):
     """Represents a Latch message."""
 
     id: int
@@ -106,8 +180,40 @@ class Message:
     attachments: List[Attachment] = field(default_factory=list)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Message":
-        """Create a Message from a dictionary."""
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        lazy: bool = False,
+        ctx: Optional["DecodeContext"] = None,
+    ) -> "Message":
+        """
+        Create a Message from a dictionary.
+
+        Args:
+            data: Message data as returned by the API
+            lazy: Defer decoding ``user``, ``reactions``, ``attachments``,
+                ``created_at`` and ``updated_at`` until first access. The
+                result behaves exactly like an eagerly decoded message, but
+                keeps a reference to ``data``, which must not be mutated.
+            ctx: Identity map shared across decodes, so repeated authors
+                and reaction users become one ``User`` instance
+
+        Returns:
+            Message instance
+        """
+        if lazy:
+            message = object.__new__(cls)
+            message.id = data["id"]
+            message.conversation_id = data["conversation_id"]
+            message.user_id = data["user_id"]
+            message.body_md = data.get("body_md", "")
+            message.body_html = data.get("body_html", "")
+            message.parent_message_id = data.get("parent_message_id")
+            message._raw = data
+            message._ctx = ctx
+            return message
+
+        created_at = _parse_datetime(data.get("created_at"))
         return cls(
             id=data["id"],
             conversation_id=data["conversation_id"],
@@ -115,20 +221,59 @@ class Message:
             body_md=data.get("body_md", ""),
             body_html=data.get("body_html", ""),
             parent_message_id=data.get("parent_message_id"),
-            created_at=_parse_datetime(data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updated_at")),
-            user=User.from_dict(data["user"]) if data.get("user") else None,
+            created_at=created_at,
+            updated_at=_parse_updated_at(data, created_at),
+            user=User.from_dict(data["user"], ctx) if data.get("user") else None,
             reactions=[
-                Reaction.from_dict(r) for r in data.get("reactions", [])
+                Reaction.from_dict(r, ctx) for r in data.get("reactions", [])
             ],
             attachments=[
                 Attachment.from_dict(a) for a in data.get("attachments", [])
             ],
         )
 
-
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for slots that are still unset, i.e. the lazy fields
+        # of a message created with from_dict(..., lazy=True).
+        decode = _LAZY_MESSAGE_FIELDS.get(name)
+        if decode is not None:
+            try:
+                data = object.__getattribute__(self, "_raw")
+            except AttributeError:
+                pass
+            else:
+                value = decode(self, data, object.__getattribute__(self, "_ctx"))
+                setattr(self, name, value)
+                return value
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickle (and copy) the decoded fields only: reading them finishes a
+        # lazy decode, and _raw/_ctx stay behind (a DecodeContext holds
+        # weak references, which can't be pickled)
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self)))
+
+
+def _parse_updated_at(data: Dict[str, Any], created_at: Optional[datetime]) -> Optional[datetime]:
+    # Unedited messages share one (immutable) datetime for both fields
+    updated_at = data.get("updated_at")
+    if updated_at == data.get("created_at"):
+        return created_at
+    return _parse_datetime(updated_at)
+
+
+_LAZY_MESSAGE_FIELDS: Dict[str, Callable[[Message, Dict[str, Any], Optional["DecodeContext"]], Any]] = {
+    "created_at": lambda message, data, ctx: _parse_datetime(data.get("created_at")),
+    "updated_at": lambda message, data, ctx: _parse_updated_at(data, message.created_at),
+    "user": lambda message, data, ctx: User.from_dict(data["user"], ctx) if data.get("user") else None,
+    "reactions": lambda message, data, ctx: [Reaction.from_dict(r, ctx) for r in data.get("reactions", [])],
+    "attachments": lambda message, data, ctx: [Attachment.from_dict(a) for a in data.get("attachments", [])],
+}
+
+
+@_slotted("__weakref__", "_member_index")
 @dataclass
-class Conversation:
+class Conversation(_BinarySerializable):
     """Represents a Latch conversation (channel or DM)."""
 
     id: int
@@ -141,9 +286,9 @@ class Conversation:
     members: List[ConversationMember] = field(default_factory=list)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Conversation":
-        """Create a Conversation from a dictionary."""
-        return cls(
+    def from_dict(cls, data: Dict[str, Any], ctx: Optional["DecodeContext"] = None) -> "Conversation":
+        """Create a Conversation from a dictionary, shared through ``ctx`` if given."""
+        conversation = cls(
             id=data["id"],
             workspace_id=data["workspace_id"],
             name=data.get("name"),
@@ -152,9 +297,54 @@ class Conversation:
             is_archived=data.get("is_archived", False),
             created_by=data.get("created_by"),
             members=[
-                ConversationMember.from_dict(m) for m in data.get("members", [])
+                ConversationMember.from_dict(m, ctx) for m in data.get("members", [])
             ],
         )
+        if ctx is not None:
+            conversation = ctx._intern_conversation(conversation)
+        return conversation
+
+    def _members_by_user(self) -> Dict[int, ConversationMember]:
+        # Built on first lookup; rebuilt when members is replaced or resized
+        members = self.members
+        try:
+            indexed, size, index, _ = self._member_index
+        except AttributeError:
+            indexed = None
+        if indexed is not members or size != len(members):
+            index = {m.user.id: m for m in reversed(members) if m.user is not None}
+            self._member_index = (members, len(members), index, None)
+        return index
+
+    def has_member(self, user_id: int) -> bool:
+        """Check whether a user is a member, in O(1) after the first lookup."""
+        return user_id in self._members_by_user()
+
+    def get_member(self, user_id: int) -> Optional[ConversationMember]:
+        """Return the membership of a user, or None if not a member."""
+        return self._members_by_user().get(user_id)
+
+    @property
+    def member_ids(self) -> FrozenSet[int]:
+        """User ids of all members."""
+        index = self._members_by_user()
+        members, size, _, ids = self._member_index
+        if ids is None:
+            ids = frozenset(index)
+            self._member_index = (members, size, index, ids)
+        return ids
+
+    def reindex_members(self) -> None:
+        """
+        Drop the member index.
+
+        Only needed after replacing items of ``members`` in place; replacing
+        the list or adding/removing members is detected automatically.
+        """
+        try:
+            del self._member_index
+        except AttributeError:
+            pass
 
     @property
     def is_channel(self) -> bool:
@@ -172,8 +362,76 @@ class Conversation:
         return self.type == "public_channel"
 
 
+class DecodeContext:
+    """
+    Identity map for decoding API responses.
+
+    Pass the same context to several ``from_dict`` calls and identical
+    users (same id, name, email and avatar) and identical conversations
+    decode to one shared instance. Instances are held weakly and are
+    collected once nothing else references them.
+
+    Mutating a shared instance is visible through every object that
+    references it. A context is not thread-safe; use one per thread or per
+    batch.
+
+    Example:
+        ctx = DecodeContext()
+        messages = [Message.from_dict(m, ctx=ctx) for m in page]
+        messages[0].user is messages[12].user   # same author -> True
+    """
+
+    def __init__(self) -> None:
+        self._users: "weakref.WeakValueDictionary[tuple, User]" = weakref.WeakValueDictionary()
+        self._conversations: "weakref.WeakValueDictionary[int, Conversation]" = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def user(self, data: Dict[str, Any]) -> User:
+        """Decode a user, returning the shared instance if one exists."""
+        return self._intern_user((data["id"], data["name"], data.get("email"), data.get("avatar_url")))
+
+    def _intern_user(self, key: Tuple[int, str, Optional[str], Optional[str]]) -> User:
+        user = self._users.get(key)
+        if user is not None:
+            self.hits += 1
+            return user
+        self.misses += 1
+        user = User(*key)
+        self._users[key] = user
+        return user
+
+    def conversation(self, data: Dict[str, Any]) -> Conversation:
+        """Decode a conversation, returning the shared instance if it is unchanged."""
+        return Conversation.from_dict(data, self)
+
+    def _intern_conversation(self, conversation: Conversation) -> Conversation:
+        existing = self._conversations.get(conversation.id)
+        if existing is not None and existing == conversation:
+            self.hits += 1
+            return existing
+        self.misses += 1
+        self._conversations[conversation.id] = conversation
+        return conversation
+
+    def clear(self) -> None:
+        """Forget all shared instances."""
+        self._users.clear()
+        self._conversations.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the number of live shared instances."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "users": len(self._users),
+            "conversations": len(self._conversations),
+        }
+
+
+@_slotted()
 @dataclass
-class CommandPayload:
+class CommandPayload(_BinarySerializable):
     """Represents a slash command invocation payload."""
 
     command: str
@@ -197,15 +455,3 @@ class CommandPayload:
             config=data.get("config", {}),
         )
 
-
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    """Parse an ISO datetime string."""
-    if not value:
-        return None
-    try:
-        # Handle various ISO formats
-        if value.endswith("Z"):
-            value = value[:-1] + "+00:00"
-        return datetime.fromisoformat(value)
-    except (ValueError, TypeError):
-        return None
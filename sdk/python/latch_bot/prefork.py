@@ -0,0 +1,442 @@
+"""
+Latch Bot SDK Prefork Server
+
+Serves webhooks from several worker processes sharing one listening
+address, so CPU-heavy handlers can use every core of a bot host. POSIX
+only (uses ``os.fork``).
+"""
+
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.sharedctypes import RawArray
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .codec import get_codec
+
+if TYPE_CHECKING:
+    from .webhook import WebhookServer
+
+logger = logging.getLogger(__name__)
+
+# Per-worker slots in the shared stats array; each worker writes only its own
+_FIELDS = ("pid", "requests", "errors", "in_flight", "latency_us", "max_latency_us", "restarts")
+_PID, _REQUESTS, _ERRORS, _IN_FLIGHT, _LATENCY, _MAX_LATENCY, _RESTARTS = range(len(_FIELDS))
+
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+# A worker that exits sooner than this after starting is restarted with a delay
+_MIN_UPTIME = 1.0
+
+
+class _WorkerHTTPServer(ThreadingHTTPServer):
+    # Request threads are joined on shutdown so in-flight requests drain
+    daemon_threads = False
+    block_on_close = True
+    request_queue_size = 1024
+
+
+class PreforkServer:
+    """
+    Pre-forking webhook server.
+
+    The parent process binds the listening socket and forks ``workers``
+    processes that accept from it (or, with ``reuse_port``, each worker
+    binds its own ``SO_REUSEPORT`` socket and the kernel balances
+    connections between them). Each worker serves the webhook on a
+    threaded HTTP server. The parent restarts workers that die and, on
+    SIGTERM or SIGINT, stops them gracefully: workers stop accepting,
+    finish in-flight requests and deferred handlers, then exit.
+
+    Create clients and other connections lazily or in ``post_fork``:
+    sockets opened in the parent would be shared by every worker. For
+    deduplication across workers use a ``SQLiteIdempotencyStore``.
+
+    Example:
+        server = PreforkServer(webhook, port=3000, workers=4, stats_path="/stats")
+        server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        webhook: "WebhookServer",
+        host: str = "0.0.0.0",
+        port: int = 3000,
+        workers: Optional[int] = None,
+        webhook_path: str = "/latch/webhook",
+        reuse_port: bool = False,
+        graceful_timeout: float = 30.0,
+        stats_path: Optional[str] = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        keepalive_timeout: float = 5.0,
+        post_fork: Optional[Callable[[int], None]] = None,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            webhook: Webhook server holding the command handlers
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            workers: Number of worker processes (defaults to the CPU count)
+            webhook_path: URL path for the webhook endpoint
+            reuse_port: Give each worker its own SO_REUSEPORT socket
+                (Linux, BSD) instead of sharing the parent's
+            graceful_timeout: Seconds workers get to drain on shutdown
+                before they are killed
+            stats_path: If set, serve aggregated worker stats as JSON at
+                this path (e.g. "/stats")
+            max_body_size: Largest request body accepted, in bytes
+            keepalive_timeout: Seconds an idle keep-alive connection is
+                kept open
+            post_fork: Called in each new worker with its index, e.g. to
+                open database connections
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Prefork mode requires os.fork (POSIX)")
+        if reuse_port and not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError("SO_REUSEPORT is not supported on this platform")
+        self.webhook = webhook
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.webhook_path = webhook_path
+        self.reuse_port = reuse_port
+        self.graceful_timeout = graceful_timeout
+        self.stats_path = stats_path
+        self.max_body_size = max_body_size
+        self.keepalive_timeout = keepalive_timeout
+        self.post_fork = post_fork
+        self.codec = getattr(webhook.bot, "codec", None) or get_codec()
+
+        self._stats = RawArray("q", self.workers * len(_FIELDS))
+        self._socket: Optional[socket.socket] = None
+        self._children: Dict[int, int] = {}  # pid -> worker index
+        self._stopping = False
+
+    @property
+    def address(self) -> str:
+        """``host:port`` the server listens on (after it has started)."""
+        if self._socket is None:
+            return f"{self.host}:{self.port}"
+        host, port = self._socket.getsockname()[:2]
+        return f"{host}:{port}"
+
+    def _bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((self.host, self.port))
+        return sock
+
+    def serve_forever(self) -> None:
+        """Start the workers and supervise them until SIGTERM or SIGINT."""
+        self._socket = self._bind()
+        if self.reuse_port:
+            # Workers bind their own sockets; the parent's only reserves the port
+            self.port = self._socket.getsockname()[1]
+        else:
+            self._socket.listen(_WorkerHTTPServer.request_queue_size)
+
+        previous = {
+            sig: signal.signal(sig, self._request_stop) for sig in (signal.SIGTERM, signal.SIGINT)
+        }
+        logger.info(f"Prefork server listening on {self.address} with {self.workers} workers")
+        try:
+            started = [0.0] * self.workers
+            for index in range(self.workers):
+                started[index] = time.monotonic()
+                self._spawn(index)
+            self._supervise(started)
+        finally:
+            self._shutdown_workers()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            self._socket.close()
+            logger.info(f"Prefork server stopped: {self.stats()}")
+
+    def _request_stop(self, signum: int, frame: Any) -> None:
+        self._stopping = True
+
+    def stop(self) -> None:
+        """Ask :meth:`serve_forever` to shut down gracefully."""
+        self._stopping = True
+
+    def _spawn(self, index: int) -> None:
+        # A crashed worker may have left requests counted as in flight
+        self._set(index, _IN_FLIGHT, 0)
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                self._run_worker(index)
+                code = 0
+            except BaseException:
+                logger.exception(f"Worker {index} crashed")
+            finally:
+                os._exit(code)
+        self._children[pid] = index
+        self._set(index, _PID, pid)
+
+    def _supervise(self, started: List[float]) -> None:
+        pending: Dict[int, float] = {}  # worker index -> earliest restart time
+        while not self._stopping:
+            for index, at in list(pending.items()):
+                if time.monotonic() >= at:
+                    del pending[index]
+                    started[index] = time.monotonic()
+                    self._spawn(index)
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            except InterruptedError:
+                continue
+            if pid == 0:
+                time.sleep(0.1)
+                continue
+            index = self._children.pop(pid, None)
+            if index is None or self._stopping:
+                continue
+            logger.warning(f"Worker {index} (pid {pid}) exited with status {status}, restarting")
+            self._set(index, _RESTARTS, self._get(index, _RESTARTS) + 1)
+            # Don't spin on a worker that dies at startup
+            uptime = time.monotonic() - started[index]
+            pending[index] = time.monotonic() + (_MIN_UPTIME if uptime < _MIN_UPTIME else 0.0)
+
+    def _shutdown_workers(self) -> None:
+        for pid in self._children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + self.graceful_timeout
+        while self._children and time.monotonic() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid:
+                self._children.pop(pid, None)
+            else:
+                time.sleep(0.05)
+        for pid in list(self._children):
+            logger.warning(f"Worker pid {pid} did not drain in time, killing it")
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._children.clear()
+
+    def _get(self, index: int, field: int) -> int:
+        return self._stats[index * len(_FIELDS) + field]
+
+    def _set(self, index: int, field: int, value: int) -> None:
+        self._stats[index * len(_FIELDS) + field] = value
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Aggregated worker counters.
+
+        Returns:
+            Dict with totals of ``requests``, ``errors`` (5xx or error
+            responses), ``in_flight`` and ``restarts``, ``avg_latency`` and
+            ``max_latency`` in seconds, and ``workers``: the same counters
+            (plus ``pid``) per worker
+        """
+        workers = []
+        for index in range(self.workers):
+            values = {name: self._get(index, i) for i, name in enumerate(_FIELDS)}
+            requests = values["requests"]
+            workers.append(
+                {
+                    "pid": values["pid"],
+                    "requests": requests,
+                    "errors": values["errors"],
+                    "in_flight": values["in_flight"],
+                    "restarts": values["restarts"],
+                    "avg_latency": values["latency_us"] / requests / 1e6 if requests else 0.0,
+                    "max_latency": values["max_latency_us"] / 1e6,
+                }
+            )
+        total_requests = sum(w["requests"] for w in workers)
+        total_latency = sum(self._get(i, _LATENCY) for i in range(self.workers)) / 1e6
+        return {
+            "requests": total_requests,
+            "errors": sum(w["errors"] for w in workers),
+            "in_flight": sum(w["in_flight"] for w in workers),
+            "restarts": sum(w["restarts"] for w in workers),
+            "avg_latency": total_latency / total_requests if total_requests else 0.0,
+            "max_latency": max((w["max_latency"] for w in workers), default=0.0),
+            "workers": workers,
+        }
+
+    # Worker process
+
+    def _run_worker(self, index: int) -> None:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent handles Ctrl-C
+        self._children = {}
+        self._reset_after_fork()
+        if self.post_fork is not None:
+            self.post_fork(index)
+
+        if self.reuse_port:
+            self._socket.close()
+            sock = self._bind()
+            sock.listen(_WorkerHTTPServer.request_queue_size)
+        else:
+            sock = self._socket
+        server = _WorkerHTTPServer(sock.getsockname()[:2], self._handler_class(index), bind_and_activate=False)
+        server.socket.close()
+        server.socket = sock
+        server.draining = False  # type: ignore[attr-defined]
+
+        def drain(signum: int, frame: Any) -> None:
+            server.draining = True  # type: ignore[attr-defined]
+            # shutdown() waits for serve_forever, which runs in this thread
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, drain)
+        if self._stopping:
+            # SIGTERM arrived before ``drain`` was installed
+            drain(signal.SIGTERM, None)
+        logger.debug(f"Worker {index} (pid {os.getpid()}) serving")
+        server.serve_forever()
+        server.server_close()  # joins in-flight request threads
+        self.webhook.close()
+
+    def _reset_after_fork(self) -> None:
+        """Drop state that must not be shared with the parent."""
+        # Pooled keep-alive sockets inherited from the parent
+        for owner in (self.webhook.bot, self.webhook._http):
+            session = getattr(owner, "_session", None)
+            if session is not None:
+                session.close()
+        # Threads don't survive fork
+        self.webhook._executor = None
+        self.webhook._overflow_executor = None
+        # A dispatcher already started in the parent would otherwise see its
+        # dead worker threads and never start new ones
+        reset = getattr(self.webhook._dispatcher, "_reset_after_fork", None)
+        if reset is not None:
+            reset()
+
+    def _handler_class(self, index: int) -> type:
+        prefork = self
+        lock = threading.Lock()
+        base = index * len(_FIELDS)
+        stats = self._stats
+
+        def count(in_flight: int, latency_us: int = 0, error: bool = False) -> None:
+            with lock:
+                stats[base + _IN_FLIGHT] += in_flight
+                if in_flight < 0:
+                    stats[base + _REQUESTS] += 1
+                    stats[base + _LATENCY] += latency_us
+                    if latency_us > stats[base + _MAX_LATENCY]:
+                        stats[base + _MAX_LATENCY] = latency_us
+                    if error:
+                        stats[base + _ERRORS] += 1
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            timeout = prefork.keepalive_timeout
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f"Worker {index}: {format % args}")
+
+            def _reply(self, status: int, body: Dict[str, Any]) -> None:
+                data = prefork.codec.dumps(body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if self.server.draining:  # type: ignore[attr-defined]
+                    self.send_header("Connection", "close")
+                    self.close_connection = True
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                path = self.path.split("?", 1)[0]
+                if path == "/health":
+                    self._reply(200, {"status": "ok", "worker": index})
+                elif prefork.stats_path is not None and path == prefork.stats_path:
+                    self._reply(200, prefork.stats())
+                elif path == prefork.webhook_path:
+                    self._reply(405, {"error": "Method not allowed"})
+                else:
+                    self._reply(404, {"error": "Not found"})
+
+            def do_POST(self) -> None:
+                if self.path.split("?", 1)[0] != prefork.webhook_path:
+                    self._reply(404, {"error": "Not found"})
+                    return
+                started = time.monotonic()
+                count(1)
+                status = 500
+                result: Dict[str, Any] = {"error": "Internal error"}
+                try:
+                    try:
+                        length = int(self.headers.get("Content-Length") or 0)
+                    except ValueError:
+                        length = -1
+                    if length < 0:
+                        # The body can't be framed, so the connection can't be reused
+                        status, result = 400, {"error": "Invalid Content-Length"}
+                        self.close_connection = True
+                        return
+                    if length > prefork.max_body_size:
+                        status, result = 413, {"error": "Payload too large"}
+                        self.close_connection = True
+                        return
+                    try:
+                        data = prefork.codec.loads(self.rfile.read(length))
+                    except ValueError:
+                        status, result = 400, {"error": "Invalid JSON"}
+                        return
+                    if not isinstance(data, dict):
+                        status, result = 400, {"error": "Invalid payload"}
+                        return
+                    status, result = 200, prefork.webhook.handle(data)
+                finally:
+                    self._reply(status, result)
+                    latency_us = int((time.monotonic() - started) * 1e6)
+                    count(-1, latency_us, error=status >= 500 or "error" in result)
+
+        return Handler
+
+
+def serve(
+    webhook: "WebhookServer",
+    host: str = "0.0.0.0",
+    port: int = 3000,
+    workers: Optional[int] = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Serve webhooks from ``workers`` prefork processes until SIGTERM/SIGINT.
+
+    Args:
+        webhook: Webhook server holding the command handlers
+        host: Interface to listen on
+        port: Port to listen on
+        workers: Number of worker processes (defaults to the CPU count)
+        **kwargs: Other :class:`PreforkServer` options
+
+    Example:
+        webhook = WebhookServer(LatchBot(token="bot_YOUR_TOKEN"))
+
+        @webhook.command("report")
+        def report(ctx):
+            ctx.reply(build_report(ctx.text))  # CPU-heavy
+
+        serve(webhook, port=3000, workers=4)
+    """
+    PreforkServer(webhook, host=host, port=port, workers=workers, **kwargs).serve_forever()
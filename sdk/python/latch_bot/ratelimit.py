@@ -0,0 +1,219 @@
+"""
+Latch Bot SDK Rate Limiting
+
+Client-side token buckets that pace requests to stay inside the server's
+``throttle:api`` budget instead of bouncing off 429 responses.
+"""
+
+import math
+import time
+import threading
+from typing import Callable, Dict, Hashable, Mapping, Optional
+
+from .exceptions import RateLimitError
+
+
+class TokenBucket:
+    """
+    A single token bucket.
+
+    Tokens refill continuously at ``capacity / period`` per second. Taking
+    a token never blocks: :meth:`reserve` returns how long the caller has
+    to wait before its reserved slot comes up.
+    """
+
+    def __init__(self, capacity: float, period: float, now: float):
+        self.capacity = float(capacity)
+        self.period = float(period)
+        self.tokens = float(capacity)
+        self.updated_at = now
+        self.blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Refill rate in tokens per second."""
+        return self.capacity / self.period
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until the next token would be available."""
+        self._refill(now)
+        delay = max(0.0, self.blocked_until - now)
+        if self.tokens < 1:
+            delay = max(delay, (1 - self.tokens) / self.rate)
+        return delay
+
+    def reserve(self, now: float) -> float:
+        """
+        Reserve one token.
+
+        Returns:
+            Seconds to wait before the reserved slot comes up
+        """
+        delay = self.delay(now)
+        self.tokens -= 1
+        return delay
+
+    def sync(
+        self,
+        now: float,
+        limit: Optional[int] = None,
+        remaining: Optional[int] = None,
+    ) -> None:
+        """Adopt the budget reported by the server."""
+        self._refill(now)
+        if limit is not None and limit > 0 and limit != self.capacity:
+            self.capacity = float(limit)
+            self.tokens = min(self.tokens, self.capacity)
+        if remaining is not None:
+            # The server is authoritative; never believe we have more
+            # headroom than it reports.
+            self.tokens = min(self.tokens, float(remaining))
+
+    def block(self, now: float, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. after a 429)."""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class RateLimiter:
+    """
+    Per-key token bucket rate limiter.
+
+    The server's ``throttle:api`` budget is shared by every bot endpoint, so
+    the clients key buckets by bot token alone; one limiter can be shared
+    between several clients. With ``per_route=True`` they key by token,
+    HTTP method and path template (``/api/bot/conversations/{id}``) instead,
+    for servers that throttle each route separately. Budgets start at the
+    server's default of 60 requests per minute and are corrected from
+    ``X-RateLimit-Limit``, ``X-RateLimit-Remaining`` and ``Retry-After``
+    response headers.
+
+    Example:
+        limiter = RateLimiter(limit=120, period=60)
+        bot = LatchBot(token="bot_...", rate_limiter=limiter)
+    """
+
+    DEFAULT_LIMIT = 60
+    DEFAULT_PERIOD = 60.0
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        period: float = DEFAULT_PERIOD,
+        clock: Callable[[], float] = time.monotonic,
+        per_route: bool = False,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limit: Requests allowed per period until the server says otherwise
+            period: Length of the rate limit window in seconds
+            clock: Monotonic time source
+            per_route: Keep a separate budget per endpoint instead of one
+                per bot token
+        """
+        self.limit = limit
+        self.period = period
+        self.per_route = per_route
+        self._clock = clock
+        self._buckets: Dict[Hashable, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: Hashable, now: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.limit, self.period, now)
+            self._buckets[key] = bucket
+        return bucket
+
+    def capacity(self, key: Hashable) -> float:
+        """Burst size of ``key``'s bucket: the learned limit, or ``limit``."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            return bucket.capacity if bucket is not None else float(self.limit)
+
+    def reserve(self, key: Hashable, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve a request slot for ``key``.
+
+        Reserving never blocks; the caller sleeps (or awaits) the returned
+        delay itself, outside of any lock.
+
+        Args:
+            key: Bucket key
+            max_wait: Longest acceptable wait in seconds (None for no limit)
+
+        Returns:
+            Seconds the caller should wait before sending
+
+        Raises:
+            RateLimitError: If the wait would exceed ``max_wait``. No slot
+                is reserved in that case.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(key, now)
+            delay = bucket.delay(now)
+            if max_wait is not None and delay > max_wait:
+                raise RateLimitError(
+                    "Client-side rate limit budget exhausted",
+                    retry_after=math.ceil(delay),
+                )
+            return bucket.reserve(now)
+
+    def observe(
+        self,
+        key: Hashable,
+        status: int,
+        headers: Mapping[str, str],
+    ) -> Optional[float]:
+        """
+        Learn from a response's rate limit headers.
+
+        Args:
+            key: Bucket key the request was made under
+            status: HTTP status code
+            headers: Response headers (case-insensitive mapping)
+
+        Returns:
+            The ``Retry-After`` delay in seconds for a 429, otherwise None
+        """
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        retry_after = None
+        if status == 429:
+            retry_after = _int_header(headers, "Retry-After")
+            if retry_after is None:
+                retry_after = int(self.period)
+
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(key, now)
+            bucket.sync(now, limit=limit, remaining=remaining)
+            if retry_after is not None:
+                bucket.block(now, retry_after)
+
+        return retry_after
+
+    def reset(self) -> None:
+        """Forget all learned budgets."""
+        with self._lock:
+            self._buckets.clear()
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
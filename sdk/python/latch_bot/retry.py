@@ -0,0 +1,311 @@
+"""
+Latch Bot SDK Retry Handling
+
+Retry policies, retry budgets and circuit breakers for API requests.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, Optional
+
+from .exceptions import CircuitOpenError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    The n-th retry waits a random time between 0 and
+    ``min(max_delay, base_delay * 2 ** n)`` seconds. Only idempotent
+    methods are retried by default, so a message is never posted twice
+    because a response got lost.
+
+    Example:
+        # Retry GETs up to 4 times, never retry POSTs
+        policy = RetryPolicy(max_retries=4, base_delay=0.5)
+        bot = LatchBot(token="bot_...", retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 10.0,
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        retry_statuses: Iterable[int] = (500, 502, 503, 504),
+        random_func: Callable[[float, float], float] = random.uniform,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retries)
+            base_delay: Backoff ceiling for the first retry, in seconds
+            max_delay: Upper bound for any single backoff, in seconds
+            methods: HTTP methods that may be retried
+            retry_statuses: Server error statuses worth retrying
+            random_func: Jitter source, ``uniform(low, high)``
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.methods: FrozenSet[str] = frozenset(m.upper() for m in methods)
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self._random = random_func
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+    ) -> bool:
+        """
+        Decide whether a failed attempt may be retried.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries already made
+            status_code: Response status, or None for connection errors
+        """
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return self._random(0, ceiling)
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent traffic.
+
+    Within a sliding window, retries may not exceed ``ratio`` of the
+    requests made, plus ``min_retries_per_second`` so that low-traffic
+    bots can still retry. When the server is down every request fails, so
+    without a budget each caller's retries would multiply the load.
+
+    Share one budget between clients to make it global.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Allowed retries per request in the window
+            min_retries_per_second: Retries always allowed regardless of traffic
+            window: Sliding window length in seconds
+            clock: Monotonic time source
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._clock = clock
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self) -> None:
+        """Count a first attempt."""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Take a retry from the budget. Returns False if it is spent."""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            allowed = (
+                self.ratio * len(self._requests)
+                + self.min_retries_per_second * self.window
+            )
+            if len(self._retries) >= allowed:
+                self.rejected += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests and retries in the current window."""
+        with self._lock:
+            self._trim(self._clock())
+            return {
+                "requests": len(self._requests),
+                "retries": len(self._retries),
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a host is unhealthy.
+
+    ``closed``: requests flow normally. After ``failure_threshold``
+    consecutive failures (connection errors or 5xx) the breaker opens.
+
+    ``open``: requests fail immediately with :class:`CircuitOpenError`
+    until ``recovery_timeout`` seconds have passed.
+
+    ``half_open``: up to ``half_open_max_calls`` probe requests are let
+    through; a success closes the breaker, a failure opens it again.
+    Callers must report every allowed request with :meth:`record_success`,
+    :meth:`record_failure` or, if it ended without reaching the server
+    (cancelled, rate limited, ...), :meth:`release`; otherwise its probe
+    slot stays taken.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds to stay open before probing
+            half_open_max_calls: Concurrent probes allowed while half-open
+            clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: ``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def allow(self) -> None:
+        """
+        Check whether a request may go out.
+
+        Raises:
+            CircuitOpenError: If the breaker is open or out of probes
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+            self.rejected += 1
+            retry_after = max(0.0, self.recovery_timeout - (now - self._opened_at))
+            raise CircuitOpenError(
+                "Circuit breaker is open; the server is failing",
+                retry_after=retry_after,
+            )
+
+    def record_success(self) -> None:
+        """Report a request that reached a healthy server."""
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Report a connection error or server error."""
+        with self._lock:
+            now = self._clock()
+            self._failures += 1
+            state = self._current_state(now)
+            if state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = now
+
+    def release(self) -> None:
+        """Report an allowed request that ended without an outcome."""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def reset(self) -> None:
+        """Force the breaker closed."""
+        self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """State and counters for monitoring."""
+        with self._lock:
+            return {
+                "state": self._current_state(self._clock()),
+                "consecutive_failures": self._failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+_registry_lock = threading.Lock()
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_retry_budgets: Dict[str, RetryBudget] = {}
+
+
+def circuit_breaker_for(host: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for ``host``."""
+    with _registry_lock:
+        breaker = _circuit_breakers.get(host)
+        if breaker is None:
+            breaker = _circuit_breakers[host] = CircuitBreaker()
+        return breaker
+
+
+def retry_budget_for(host: str) -> RetryBudget:
+    """Return the process-wide retry budget for ``host``."""
+    with _registry_lock:
+        budget = _retry_budgets.get(host)
+        if budget is None:
+            budget = _retry_budgets[host] = RetryBudget()
+        return budget
+
+
+def circuit_breaker_states() -> Dict[str, str]:
+    """State of every known host's circuit breaker, for monitoring."""
+    with _registry_lock:
+        breakers = dict(_circuit_breakers)
+    return {host: breaker.state for host, breaker in breakers.items()}
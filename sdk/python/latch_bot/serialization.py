@@ -0,0 +1,249 @@
+"""
+Latch Bot SDK Binary Serialization
+
+Compact, versioned binary encoding of ``latch_bot.models`` objects for
+caches shared between processes (e.g. prefork webhook workers) or kept on
+local disk.
+
+Layout: ``b"LB"``, one byte schema version, one byte model tag, then the
+model as nested tuples of plain values encoded with :mod:`marshal`.
+Datetimes are stored as epoch microseconds plus a UTC offset.
+
+marshal is fast and built in, but it is not meant for untrusted input:
+only load bytes your own processes wrote. Its format is not guaranteed
+to be stable across Python versions, so treat this as a cache format:
+:func:`loads` raises ValueError for anything it cannot decode, which
+callers should handle as a cache miss (and expect after upgrading Python).
+"""
+
+import marshal
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from .models import (
+    Attachment,
+    CommandPayload,
+    Conversation,
+    ConversationMember,
+    DecodeContext,
+    Message,
+    Reaction,
+    User,
+)
+
+MAGIC = b"LB"
+SCHEMA_VERSION = 1
+
+_MARSHAL_VERSION = 4
+_HEADER_SIZE = 4
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+Ctx = Optional[DecodeContext]
+
+
+def _dump_datetime(value: Optional[datetime]) -> Optional[Tuple[int, Optional[int]]]:
+    if value is None:
+        return None
+    offset = value.utcoffset()
+    if offset is None:
+        return (value - _NAIVE_EPOCH) // _ONE_MICROSECOND, None
+    return (value - _EPOCH) // _ONE_MICROSECOND, offset // _ONE_MICROSECOND
+
+
+def _load_datetime(value: Optional[Tuple[int, Optional[int]]]) -> Optional[datetime]:
+    if value is None:
+        return None
+    micros, offset = value
+    if offset is None:
+        return _NAIVE_EPOCH + timedelta(microseconds=micros)
+    dt = _EPOCH + timedelta(microseconds=micros)
+    if offset:
+        dt = dt.astimezone(timezone(timedelta(microseconds=offset)))
+    return dt
+
+
+def _dump_user(user: Optional[User]) -> Optional[tuple]:
+    if user is None:
+        return None
+    return (user.id, user.name, user.email, user.avatar_url)
+
+
+def _load_user(value: Optional[tuple], ctx: Ctx) -> Optional[User]:
+    if value is None:
+        return None
+    if ctx is not None:
+        return ctx._intern_user(value)
+    return User(*value)
+
+
+def _dump_member(member: ConversationMember) -> tuple:
+    return (member.id, member.conversation_id, _dump_user(member.user))
+
+
+def _load_member(value: tuple, ctx: Ctx) -> ConversationMember:
+    return ConversationMember(value[0], value[1], _load_user(value[2], ctx))
+
+
+def _dump_attachment(attachment: Attachment) -> tuple:
+    return (attachment.id, attachment.filename, attachment.mime_type, attachment.size, attachment.url)
+
+
+def _load_attachment(value: tuple, ctx: Ctx) -> Attachment:
+    return Attachment(*value)
+
+
+def _dump_reaction(reaction: Reaction) -> tuple:
+    return (reaction.id, reaction.emoji, reaction.user_id, _dump_user(reaction.user))
+
+
+def _load_reaction(value: tuple, ctx: Ctx) -> Reaction:
+    return Reaction(value[0], value[1], value[2], _load_user(value[3], ctx))
+
+
+def _dump_message(message: Message) -> tuple:
+    created_at = message.created_at
+    updated_at = message.updated_at
+    return (
+        message.id,
+        message.conversation_id,
+        message.user_id,
+        message.body_md,
+        message.body_html,
+        message.parent_message_id,
+        _dump_datetime(created_at),
+        # None marks "same as created_at", which is the common case
+        None if updated_at is created_at else (_dump_datetime(updated_at),),
+        _dump_user(message.user),
+        tuple(_dump_reaction(r) for r in message.reactions),
+        tuple(_dump_attachment(a) for a in message.attachments),
+    )
+
+
+def _load_message(value: tuple, ctx: Ctx) -> Message:
+    created_at = _load_datetime(value[6])
+    return Message(
+        id=value[0],
+        conversation_id=value[1],
+        user_id=value[2],
+        body_md=value[3],
+        body_html=value[4],
+        parent_message_id=value[5],
+        created_at=created_at,
+        updated_at=created_at if value[7] is None else _load_datetime(value[7][0]),
+        user=_load_user(value[8], ctx),
+        reactions=[_load_reaction(r, ctx) for r in value[9]],
+        attachments=[Attachment(*a) for a in value[10]],
+    )
+
+
+def _dump_conversation(conversation: Conversation) -> tuple:
+    return (
+        conversation.id,
+        conversation.workspace_id,
+        conversation.name,
+        conversation.description,
+        conversation.type,
+        conversation.is_archived,
+        conversation.created_by,
+        tuple(_dump_member(m) for m in conversation.members),
+    )
+
+
+def _load_conversation(value: tuple, ctx: Ctx) -> Conversation:
+    conversation = Conversation(
+        id=value[0],
+        workspace_id=value[1],
+        name=value[2],
+        description=value[3],
+        type=value[4],
+        is_archived=value[5],
+        created_by=value[6],
+        members=[_load_member(m, ctx) for m in value[7]],
+    )
+    if ctx is not None:
+        conversation = ctx._intern_conversation(conversation)
+    return conversation
+
+
+def _dump_command(payload: CommandPayload) -> tuple:
+    return (
+        payload.command,
+        payload.text,
+        payload.conversation_id,
+        payload.user_id,
+        payload.user_name,
+        payload.workspace_id,
+        payload.config,
+    )
+
+
+def _load_command(value: tuple, ctx: Ctx) -> CommandPayload:
+    return CommandPayload(*value)
+
+
+# Tags are part of the format: never reuse or renumber them
+_CODECS: Dict[Type[Any], Tuple[int, Callable[[Any], tuple], Callable[[tuple, Ctx], Any]]] = {
+    User: (1, _dump_user, _load_user),
+    ConversationMember: (2, _dump_member, _load_member),
+    Attachment: (3, _dump_attachment, _load_attachment),
+    Reaction: (4, _dump_reaction, _load_reaction),
+    Message: (5, _dump_message, _load_message),
+    Conversation: (6, _dump_conversation, _load_conversation),
+    CommandPayload: (7, _dump_command, _load_command),
+}
+_LOADERS = {tag: load for tag, _, load in _CODECS.values()}
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize a model.
+
+    Args:
+        obj: Instance of one of the ``latch_bot.models`` classes
+
+    Returns:
+        Versioned binary representation
+
+    Raises:
+        TypeError: If ``obj`` is not a supported model
+    """
+    try:
+        tag, dump, _ = _CODECS[type(obj)]
+    except KeyError:
+        raise TypeError(f"Cannot serialize {type(obj).__name__}")
+    header = MAGIC + bytes((SCHEMA_VERSION, tag))
+    return header + marshal.dumps(dump(obj), _MARSHAL_VERSION)
+
+
+def loads(data: bytes, ctx: Optional[DecodeContext] = None) -> Any:
+    """
+    Deserialize a model written by :func:`dumps`.
+
+    Args:
+        data: Serialized model
+        ctx: Identity map, so users and conversations already decoded
+            through it are shared
+
+    Returns:
+        The model instance
+
+    Raises:
+        ValueError: If ``data`` is not in this format, is corrupt or was
+            written with an unsupported schema version
+    """
+    if len(data) < _HEADER_SIZE or data[:2] != MAGIC:
+        raise ValueError("Not a serialized latch_bot model")
+    version, tag = data[2], data[3]
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported schema version {version} (expected {SCHEMA_VERSION})")
+    load = _LOADERS.get(tag)
+    if load is None:
+        raise ValueError(f"Unknown model tag {tag}")
+    try:
+        value = marshal.loads(memoryview(data)[_HEADER_SIZE:])
+        return load(value, ctx)
+    except (EOFError, ValueError, TypeError, IndexError, KeyError, OverflowError) as e:
+        raise ValueError(f"Corrupt serialized model: {e}") from e
@@ -0,0 +1,258 @@
+"""
+Latch Bot SDK Testing Utilities
+
+An in-process stand-in for the Latch Bot API, for tests and benchmarks
+that must run without a live Latch instance.
+"""
+
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+Latency = Union[float, Callable[[], float]]
+
+_CONVERSATION_PATH = re.compile(r"^/api/bot/conversations/(\d+)/?$")
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections from concurrent clients,
+    # which then stall for a full SYN retransmit (~1s).
+    request_queue_size = 128
+
+
+class StubLatchServer:
+    """
+    Stub implementation of the Latch Bot API.
+
+    Serves ``POST /api/bot/messages`` and
+    ``GET /api/bot/conversations/{id}`` with responses shaped like the real
+    ``BotApiController``, over HTTP/1.1 keep-alive. Latency, 429s and 5xx
+    errors can be injected.
+
+    Example:
+        with StubLatchServer(latency=0.02, rate_limited_ratio=0.01) as server:
+            bot = LatchBot(token="bot_test", base_url=server.url)
+            bot.send_message(conversation_id=1, text="hi")
+            print(server.stats())
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency = 0.0,
+        rate_limited_ratio: float = 0.0,
+        server_error_ratio: float = 0.0,
+        retry_after: int = 1,
+        rate_limit: int = 60,
+        members: int = 25,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the stub server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds to delay each response, or a callable
+                returning the delay (e.g. ``lambda: random.expovariate(50)``)
+            rate_limited_ratio: Fraction of requests answered with 429
+            server_error_ratio: Fraction of requests answered with 503
+            retry_after: ``Retry-After`` seconds sent with 429 responses
+            rate_limit: Value reported in ``X-RateLimit-Limit``
+            members: Members returned per conversation
+            seed: Seed for the fault injection RNG
+        """
+        self.latency = latency
+        self.rate_limited_ratio = rate_limited_ratio
+        self.server_error_ratio = server_error_ratio
+        self.retry_after = retry_after
+        self.rate_limit = rate_limit
+        self.members = members
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._httpd = _HTTPServer((host, port), _make_handler(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to LatchBot."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubLatchServer":
+        """Serve requests on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                name="latch-stub-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubLatchServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """Responses served, keyed by ``"<endpoint> <status>"``."""
+        with self._lock:
+            return {f"{endpoint} {status}": n for (endpoint, status), n in self._counts.items()}
+
+    def reset_stats(self) -> None:
+        """Clear response counters."""
+        with self._lock:
+            self._counts.clear()
+
+    def _record(self, endpoint: str, status: int) -> None:
+        with self._lock:
+            key = (endpoint, status)
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _delay(self) -> None:
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def _inject_fault(self) -> Optional[Tuple[int, Dict[str, Any], Dict[str, str]]]:
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.rate_limited_ratio:
+            return (
+                429,
+                {"message": "Too Many Attempts."},
+                {"Retry-After": str(self.retry_after), "X-RateLimit-Remaining": "0"},
+            )
+        if roll < self.rate_limited_ratio + self.server_error_ratio:
+            return 503, {"message": "Service Unavailable"}, {}
+        return None
+
+    def _message(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        now = _timestamp()
+        return {
+            "id": next(self._ids),
+            "conversation_id": body["conversation_id"],
+            "user_id": 1,
+            "body_md": body["text"],
+            "body_html": f"<p>{body['text']}</p>",
+            "parent_message_id": body.get("thread_id"),
+            "created_at": now,
+            "updated_at": now,
+            "user": {"id": 1, "name": "Stub Bot", "email": "bot_1@bots.local"},
+            "reactions": [],
+            "attachments": [],
+        }
+
+    def _conversation(self, conversation_id: int) -> Dict[str, Any]:
+        return {
+            "id": conversation_id,
+            "workspace_id": 1,
+            "name": f"channel-{conversation_id}",
+            "description": None,
+            "type": "public_channel",
+            "is_archived": False,
+            "created_by": 1,
+            "members": [
+                {
+                    "id": i + 1,
+                    "conversation_id": conversation_id,
+                    "user_id": i + 1,
+                    "user": {"id": i + 1, "name": f"User {i + 1}"},
+                }
+                for i in range(self.members)
+            ],
+        }
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _make_handler(server: StubLatchServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _reply(
+            self,
+            endpoint: str,
+            status: int,
+            body: Dict[str, Any],
+            headers: Optional[Dict[str, str]] = None,
+        ) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("X-RateLimit-Limit", str(server.rate_limit))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+            server._record(endpoint, status)
+
+        def _preflight(self, endpoint: str) -> bool:
+            server._delay()
+            if not self.headers.get("Authorization", "").startswith("Bearer bot_"):
+                self._reply(endpoint, 401, {"error": "Unauthorized"})
+                return False
+            fault = server._inject_fault()
+            if fault is not None:
+                status, body, headers = fault
+                self._reply(endpoint, status, body, headers)
+                return False
+            return True
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            if self.path.rstrip("/") != "/api/bot/messages":
+                self._reply("other", 404, {"error": "Not found"})
+                return
+            endpoint = "POST /api/bot/messages"
+            if not self._preflight(endpoint):
+                return
+            try:
+                body = json.loads(raw or b"{}")
+                if not body.get("conversation_id") or not body.get("text"):
+                    raise ValueError
+            except ValueError:
+                self._reply(endpoint, 422, {"error": "Validation failed", "errors": {}})
+                return
+            self._reply(endpoint, 201, {"success": True, "message": server._message(body)})
+
+        def do_GET(self) -> None:
+            match = _CONVERSATION_PATH.match(self.path)
+            if match is None:
+                self._reply("other", 404, {"error": "Not found"})
+                return
+            endpoint = "GET /api/bot/conversations/{id}"
+            if not self._preflight(endpoint):
+                return
+            conversation = server._conversation(int(match.group(1)))
+            self._reply(endpoint, 200, {"conversation": conversation})
+
+    return Handler
@@ -0,0 +1,49 @@
+"""
+Latch Bot SDK Timestamp Parsing
+
+Fast parsing of the ISO-8601 timestamps Latch serializes
+(``2024-05-06T12:34:07.000000Z``).
+"""
+
+import sys
+from datetime import datetime
+from typing import Optional
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_NATIVE_Z = sys.version_info >= (3, 11)
+
+_fromisoformat = datetime.fromisoformat
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 timestamp as returned by the Latch API.
+
+    The server's fixed format is handed straight to the C parser, other
+    ISO-8601 strings fall back to the general parse. Results are not
+    memoized: most timestamps in a history are distinct, and a memo lookup
+    costs about as much as the fast path saves.
+
+    Args:
+        value: Timestamp string; empty values and None are allowed
+
+    Returns:
+        Timezone-aware datetime for ``Z``/offset timestamps, or None if
+        ``value`` is empty or not a valid timestamp
+    """
+    if not value:
+        return None
+    try:
+        # Fast path: the exact format Laravel emits, YYYY-MM-DDTHH:MM:SS.ffffffZ
+        if len(value) == 27 and value[26] == "Z" and value[10] == "T":
+            try:
+                return _fromisoformat(value if _NATIVE_Z else value[:26] + "+00:00")
+            except ValueError:
+                pass
+
+        # General ISO-8601
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return _fromisoformat(value)
+    except (ValueError, TypeError):  # invalid, or not a string
+        return None
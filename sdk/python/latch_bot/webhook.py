@@ -4,13 +4,27 @@ Latch Bot SDK Webhook Server
 Server for handling slash command callbacks.
 """
 
+import functools
 import logging
-from typing import Callable, Dict, Optional, Any, Awaitable
-from dataclasses import dataclass
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Optional, Any, Awaitable, Tuple, Union
+from dataclasses import dataclass, field
 
-from .client import LatchBot
 from .models import CommandPayload
 
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from flask import Flask
+
+    from .client import LatchBot
+    from .dispatch import DeferredDispatcher
+    from .http import BoundHTTPClient, HTTPClient
+    from .idempotency import IdempotencyCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,10 +34,22 @@ class CommandContext:
     Context object passed to command handlers.
 
     Provides easy access to command data and helper methods.
+
+    When the command has a deadline, ``cancel_event`` is set once it
+    passes (the invoker has then already received the fallback response);
+    long-running handlers should check ``ctx.cancelled`` or
+    ``ctx.remaining_time`` between slow steps.
+
+    ``loop`` is the event loop the webhook arrived on when it was handled
+    with :meth:`WebhookServer.handle_async`.
     """
 
     payload: CommandPayload
-    bot: LatchBot
+    bot: "LatchBot"
+    deadline: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+    server: Optional["WebhookServer"] = field(default=None, repr=False, compare=False)
+    loop: Optional["asyncio.AbstractEventLoop"] = field(default=None, repr=False, compare=False)
 
     @property
     def command(self) -> str:
@@ -70,17 +96,101 @@ class CommandContext:
         """
         return self.payload.config
 
+    @property
+    def http(self) -> "BoundHTTPClient":
+        """
+        Pooled, caching HTTP client for upstream APIs, bound to this
+        command's deadline (see :class:`latch_bot.http.HTTPClient`).
+        """
+        if self.server is not None:
+            return self.server.http.bind(self)
+        from .http import default_client
+
+        return default_client().bind(self)
+
+    @property
+    def remaining_time(self) -> Optional[float]:
+        """Seconds left before the deadline (0 once passed), or None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the deadline passed or the command was cancelled."""
+        if self.cancel_event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel_event.set()
+            return True
+        return False
+
     def reply(self, text: str) -> None:
         """
         Send a reply message to the conversation.
 
+        Skipped (and logged) once the command is cancelled, since the
+        invoker has already received the timeout fallback.
+
+        With an AsyncLatchBot the request is run on the event loop the
+        webhook was handled on and this call waits for it; ``async def``
+        handlers should use :meth:`reply_async` instead.
+
         Args:
             text: Message content (supports Markdown)
+
+        Raises:
+            TypeError: If the bot is an AsyncLatchBot and there is no event
+                loop to send on (the webhook was not handled with
+                ``handle_async``, or this is called on the loop's own thread)
         """
-        self.bot.send_message(
-            conversation_id=self.conversation_id,
-            text=text,
-        )
+        if self.cancelled:
+            logger.info(f"Skipping reply for cancelled /{self.command}")
+            return
+        send = self.bot.send_message
+        if not _is_coroutine_function(send):
+            send(conversation_id=self.conversation_id, text=text)
+            return
+
+        import asyncio
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self.loop is None or self.loop is running or self.loop.is_closed():
+            raise TypeError(
+                "ctx.reply() cannot send through an AsyncLatchBot here; "
+                "use 'await ctx.reply_async(...)' from an async def handler"
+            )
+        asyncio.run_coroutine_threadsafe(
+            send(conversation_id=self.conversation_id, text=text), self.loop
+        ).result()
+
+    async def reply_async(self, text: str) -> None:
+        """
+        Send a reply from an ``async def`` handler.
+
+        Awaits the request directly with an AsyncLatchBot; with the
+        synchronous LatchBot the request runs in a thread so the event
+        loop is not blocked.
+
+        Args:
+            text: Message content (supports Markdown)
+        """
+        import asyncio
+
+        if self.cancelled:
+            logger.info(f"Skipping reply for cancelled /{self.command}")
+            return
+        send = self.bot.send_message
+        if asyncio.iscoroutinefunction(send):
+            await send(conversation_id=self.conversation_id, text=text)
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, functools.partial(send, conversation_id=self.conversation_id, text=text)
+            )
 
     def reply_ephemeral(self, text: str) -> Dict[str, Any]:
         """
@@ -98,7 +208,53 @@ class CommandContext:
         return {"type": "ephemeral", "text": text}
 
 
-CommandHandler = Callable[[CommandContext], Optional[Dict[str, Any]]]
+CommandHandler = Callable[
+    [CommandContext],
+    Union[Optional[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]],
+]
+
+
+class _ReplyRecorder:
+    """Stands in for a CommandContext, collecting replies instead of sending them."""
+
+    def __init__(self, ctx: CommandContext):
+        self._ctx = ctx
+        self.replies: List[str] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
+
+    def reply(self, text: str) -> None:
+        self.replies.append(text)
+
+    async def reply_async(self, text: str) -> None:
+        self.replies.append(text)
+
+
+# Cached handler outcome: texts passed to ctx.reply, then the return value
+_CachedResult = Tuple[Tuple[str, ...], Optional[Dict[str, Any]]]
+
+
+def _cacheable(ctx: CommandContext, result: Any) -> bool:
+    """Cancelled runs and error responses are not memoized."""
+    if ctx.cancelled:
+        return False
+    return not (isinstance(result, dict) and "error" in result)
+
+
+def _copy_result(result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return dict(result) if isinstance(result, dict) else result
+
+
+class _PoolCall:
+    """Accounting for one plain handler call run on a thread."""
+
+    __slots__ = ("pooled", "abandoned", "done")
+
+    def __init__(self, pooled: bool):
+        self.pooled = pooled
+        self.abandoned = False
+        self.done = False
 
 
 class WebhookServer:
@@ -125,6 +281,10 @@ class WebhookServer:
         def latch_webhook():
             return webhook.handle(request.json)
 
+    Handlers may be plain functions or ``async def`` coroutines. Under
+    ASGI (see :func:`latch_bot.asgi.create_asgi_app`) coroutines run on the
+    event loop and plain handlers on a bounded thread pool.
+
     Example (with FastAPI):
         from fastapi import FastAPI, Request
         from latch_bot import LatchBot, WebhookServer
@@ -143,31 +303,95 @@ class WebhookServer:
             return webhook.handle(data)
     """
 
-    def __init__(self, bot: LatchBot, debug: bool = False):
+    DEFAULT_MAX_WORKERS = 32
+
+    # Ephemeral response when a deferred command is shed under load
+    BUSY_MESSAGE = "I'm busy right now, please try again in a moment."
+
+    # Default ephemeral response when a handler misses its deadline
+    TIMEOUT_MESSAGE = "Sorry, that took too long. Please try again."
+
+    def __init__(
+        self,
+        bot: "LatchBot",
+        debug: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        dispatcher: Optional["DeferredDispatcher"] = None,
+        idempotency: Optional["IdempotencyCache"] = None,
+        timeout: Optional[float] = None,
+        timeout_message: str = TIMEOUT_MESSAGE,
+        http: Optional["HTTPClient"] = None,
+    ):
         """
         Initialize the webhook server.
 
         Args:
-            bot: LatchBot client instance
+            bot: LatchBot (or AsyncLatchBot) client instance
             debug: Enable debug logging
+            max_workers: Threads available to plain (non-async) handlers
+                when requests are handled with :meth:`handle_async`
+            dispatcher: Background pool for commands registered with
+                ``defer=True`` (a default DeferredDispatcher is created
+                when first needed)
+            idempotency: Dedup cache answering redelivered events with the
+                original response instead of running the handler again
+            timeout: Deadline in seconds for every inline (non-deferred)
+                handler; keep it below the server's 10 second webhook
+                timeout. None disables deadlines unless set per command.
+                Plain handlers with a deadline run on the thread pool,
+                and one that misses it keeps its thread until it returns
+                (see :meth:`stats`).
+            timeout_message: Ephemeral text returned when a handler misses
+                its deadline
+            http: Client behind ``ctx.http`` (a default HTTPClient is
+                created when first needed)
         """
         self.bot = bot
         self.debug = debug
+        self.max_workers = max_workers
         self._handlers: Dict[str, CommandHandler] = {}
         self._default_handler: Optional[CommandHandler] = None
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._overflow_executor: Optional["ThreadPoolExecutor"] = None
+        self._pool_lock = threading.Lock()
+        self._pool_busy = 0
+        self._abandoned = 0
+        self._overflowing = 0
+        self._overflowed = 0
+        self._dispatcher = dispatcher
+        self.idempotency = idempotency
+        self.timeout = timeout
+        self.timeout_message = timeout_message
+        # Per-command deadlines, overriding ``timeout``
+        self._timeouts: Dict[str, float] = {}
+        self._http = http
+        # Only a client created here is closed by close()
+        self._owns_http = False
+        # Deferred command name -> ack text (None for a plain ack)
+        self._deferred: Dict[str, Optional[str]] = {}
 
         if debug:
             logging.basicConfig(level=logging.DEBUG)
             logger.setLevel(logging.DEBUG)
 
     def command(
-        self, name: str
+        self,
+        name: str,
+        defer: bool = False,
+        ack: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Callable[[CommandHandler], CommandHandler]:
         """
         Decorator to register a command handler.
 
         Args:
             name: Command name (without /)
+            defer: Acknowledge the webhook immediately and run the handler
+                on the background dispatcher; it answers with ``ctx.reply``
+            ack: Ephemeral text returned as the immediate response of a
+                deferred command (e.g. "Working on it…")
+            timeout: Deadline in seconds for this command, overriding the
+                server-wide ``timeout``
 
         Example:
             @webhook.command("weather")
@@ -176,7 +400,7 @@ class WebhookServer:
         """
 
         def decorator(func: CommandHandler) -> CommandHandler:
-            self._handlers[name.lower()] = func
+            self.on_command(name, func, defer=defer, ack=ack, timeout=timeout)
             logger.debug(f"Registered handler for command: {name}")
             return func
 
@@ -194,26 +418,189 @@ class WebhookServer:
         self._default_handler = func
         return func
 
-    def on_command(self, name: str, handler: CommandHandler) -> None:
+    def cached(
+        self,
+        ttl: float = 60.0,
+        key: Optional[Callable[[CommandContext], Hashable]] = None,
+        maxsize: int = 256,
+        per_workspace: bool = False,
+        vary_on_config: bool = False,
+    ) -> Callable[[CommandHandler], CommandHandler]:
         """
-        Register a command handler programmatically.
+        Decorator memoizing a handler's outcome for ``ttl`` seconds.
+
+        The outcome is what the handler returned (e.g. an ephemeral dict)
+        plus the texts it passed to ``ctx.reply``; on a hit the replies
+        are re-sent to the invoking conversation without running the
+        handler. Concurrent misses for the same key run the handler once
+        (for ``async def`` handlers: once per event loop).
+        Error responses and runs that missed their deadline are not cached.
+
+        By default entries are keyed by command and its lower-cased,
+        whitespace-normalized arguments, so only use this for commands
+        whose output depends on nothing else (not on the invoking user).
 
         Args:
-            name: Command name (without /)
-            handler: Handler function
+            ttl: Seconds an outcome is reused
+            key: Custom key function of the context, replacing the
+                arguments (the command name is always part of the key)
+            maxsize: Maximum number of cached outcomes (LRU)
+            per_workspace: Keep separate entries per workspace
+            vary_on_config: Keep separate entries per bot configuration
+
+        Example:
+            @webhook.command("weather")
+            @webhook.cached(ttl=300)
+            def handle_weather(ctx):
+                ctx.reply(fetch_weather(ctx.text))
+
+            handle_weather.cache_stats()  # {"hits": 12, "misses": 3, ...}
         """
-        self._handlers[name.lower()] = handler
+        from .cache import SingleFlight, TTLCache
+
+        def make_key(ctx: CommandContext) -> Hashable:
+            parts: Tuple[Hashable, ...] = (ctx.command.lower(),)
+            if key is not None:
+                parts += (key(ctx),)
+            else:
+                parts += (" ".join(ctx.args).lower(),)
+            if per_workspace:
+                parts += (ctx.workspace_id,)
+            if vary_on_config:
+                import json
+
+                parts += (json.dumps(ctx.config, sort_keys=True, default=str),)
+            return parts
 
-    def handle(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        def decorator(func: CommandHandler) -> CommandHandler:
+            cache = TTLCache(maxsize=maxsize, ttl=ttl)
+            flight = SingleFlight()
+            # Async flights hold tasks, which belong to one event loop; the
+            # sync handle() path runs each coroutine on its own loop
+            async_flights: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+            flights_lock = threading.Lock()
+            runs = [0]
+            miss = object()
+
+            def async_flight() -> Any:
+                import asyncio
+
+                loop = asyncio.get_running_loop()
+                with flights_lock:
+                    current = async_flights.get(loop)
+                    if current is None:
+                        from .async_client import AsyncSingleFlight
+
+                        current = async_flights[loop] = AsyncSingleFlight()
+                    return current
+
+            def start_run(ctx: CommandContext) -> _ReplyRecorder:
+                with flights_lock:
+                    runs[0] += 1
+                return _ReplyRecorder(ctx)
+
+            def finish_run(
+                ctx: CommandContext, cache_key: Hashable, recorder: _ReplyRecorder, result: Any
+            ) -> _CachedResult:
+                outcome = (tuple(recorder.replies), result)
+                if _cacheable(ctx, result):
+                    cache.set(cache_key, outcome)
+                return outcome
+
+            if _is_coroutine_function(func):
+
+                @functools.wraps(func)
+                async def wrapper(ctx: CommandContext) -> Optional[Dict[str, Any]]:
+                    cache_key = make_key(ctx)
+                    entry = cache.get(cache_key, miss)
+                    if entry is miss:
+
+                        async def compute() -> _CachedResult:
+                            recorder = start_run(ctx)
+                            result = await func(recorder)
+                            return finish_run(ctx, cache_key, recorder, result)
+
+                        entry = await async_flight().do(cache_key, compute)
+                    replies, result = entry
+                    for text in replies:
+                        await ctx.reply_async(text)
+                    return _copy_result(result)
+
+            else:
+
+                @functools.wraps(func)
+                def wrapper(ctx: CommandContext) -> Optional[Dict[str, Any]]:
+                    cache_key = make_key(ctx)
+                    entry = cache.get(cache_key, miss)
+                    if entry is miss:
+
+                        def compute() -> _CachedResult:
+                            recorder = start_run(ctx)
+                            result = func(recorder)
+                            return finish_run(ctx, cache_key, recorder, result)
+
+                        entry = flight.do(cache_key, compute)
+                    replies, result = entry
+                    for text in replies:
+                        ctx.reply(text)
+                    return _copy_result(result)
+
+            def cache_stats() -> Dict[str, Any]:
+                """
+                Hit/miss counters.
+
+                ``coalesced`` counts misses that waited for a concurrent run
+                instead of running the handler; ``hit_rate`` is the share of
+                calls that did not run it (hits plus coalesced).
+                """
+                stats = cache.stats()
+                # Every miss either ran the handler or waited for a run
+                with flights_lock:
+                    coalesced = max(0, stats["misses"] - runs[0])
+                lookups = stats["hits"] + stats["misses"]
+                stats["coalesced"] = coalesced
+                stats["hit_rate"] = (stats["hits"] + coalesced) / lookups if lookups else 0.0
+                return stats
+
+            wrapper.cache_stats = cache_stats  # type: ignore[attr-defined]
+            wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+            return wrapper
+
+        return decorator
+
+    def on_command(
+        self,
+        name: str,
+        handler: CommandHandler,
+        defer: bool = False,
+        ack: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
         """
-        Handle an incoming webhook request.
+        Register a command handler programmatically.
 
         Args:
-            data: Request JSON data
-
-        Returns:
-            Response dict (can be ephemeral or acknowledgment)
+            name: Command name (without /)
+            handler: Handler function
+            defer: Run the handler in the background (see :meth:`command`)
+            ack: Immediate ephemeral text for a deferred command
+            timeout: Deadline in seconds for this command
         """
+        name = name.lower()
+        self._handlers[name] = handler
+        if defer:
+            self._deferred[name] = ack
+        else:
+            self._deferred.pop(name, None)
+        if timeout is not None:
+            self._timeouts[name] = timeout
+        else:
+            self._timeouts.pop(name, None)
+
+    def _resolve(
+        self, data: Dict[str, Any], loop: Optional["asyncio.AbstractEventLoop"] = None
+    ) -> Union[Dict[str, Any], Tuple[CommandContext, CommandHandler]]:
+        """Parse a webhook and find its handler, or return the response to send."""
         if self.debug:
             logger.debug(f"Received webhook: {data}")
 
@@ -223,10 +610,11 @@ class WebhookServer:
             logger.error(f"Invalid payload: {e}")
             return {"error": "Invalid payload"}
 
-        ctx = CommandContext(payload=payload, bot=self.bot)
+        ctx = CommandContext(payload=payload, bot=self.bot, server=self, loop=loop)
 
         # Find handler
-        handler = self._handlers.get(payload.command.lower())
+        name = payload.command.lower()
+        handler = self._handlers.get(name)
         if handler is None:
             handler = self._default_handler
 
@@ -234,15 +622,325 @@ class WebhookServer:
             logger.warning(f"No handler for command: {payload.command}")
             return {"ok": True}
 
+        if name in self._deferred:
+            return self._defer(ctx, handler, self._deferred[name])
+
+        timeout = self._timeouts.get(name, self.timeout)
+        if timeout is not None:
+            ctx.deadline = time.monotonic() + timeout
+
+        return ctx, handler
+
+    def _timed_out(self, ctx: CommandContext) -> Dict[str, Any]:
+        """Cancel a command that missed its deadline and build the fallback."""
+        ctx.cancel_event.set()
+        logger.warning(f"Handler for /{ctx.command} missed its deadline")
+        return ctx.reply_ephemeral(self.timeout_message)
+
+    def _defer(
+        self, ctx: CommandContext, handler: CommandHandler, ack: Optional[str]
+    ) -> Dict[str, Any]:
+        """Queue a deferred handler and build the immediate response."""
+        if not self.dispatcher.submit(ctx, handler):
+            return ctx.reply_ephemeral(self.BUSY_MESSAGE)
+        if ack is not None:
+            return ctx.reply_ephemeral(ack)
+        return {"ok": True}
+
+    @property
+    def http(self) -> "HTTPClient":
+        """HTTP client shared by handlers through ``ctx.http``."""
+        if self._http is None:
+            with _http_lock:
+                if self._http is None:
+                    from .http import HTTPClient
+
+                    self._http = HTTPClient()
+                    self._owns_http = True
+        return self._http
+
+    @property
+    def dispatcher(self) -> "DeferredDispatcher":
+        """Background dispatcher running deferred commands."""
+        if self._dispatcher is None:
+            from .dispatch import DeferredDispatcher
+
+            self._dispatcher = DeferredDispatcher()
+        return self._dispatcher
+
+    def handle(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an incoming webhook request.
+
+        ``async def`` handlers are run to completion on a new event loop;
+        inside an event loop use :meth:`handle_async` instead.
+
+        Args:
+            data: Request JSON data
+
+        Returns:
+            Response dict (can be ephemeral or acknowledgment)
+        """
+        if self.idempotency is None:
+            return self._handle(data)
+        key, duplicate = self.idempotency.begin(data)
+        if duplicate is not None:
+            logger.info(f"Dropping redelivered webhook {key}")
+            return duplicate
+        try:
+            response = self._handle(data)
+        except BaseException:
+            self.idempotency.abandon(key)
+            raise
+        self.idempotency.finish(key, response)
+        return response
+
+    def _handle(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        resolved = self._resolve(data)
+        if isinstance(resolved, dict):
+            return resolved
+        ctx, handler = resolved
+
+        try:
+            if ctx.deadline is None:
+                result = _call(handler, ctx)
+            else:
+                from concurrent.futures import TimeoutError
+
+                call = self._start_call(inline=True)
+                if call.pooled:
+                    # The handler runs on the pool so this thread can give up
+                    # at the deadline; the handler is told via ctx.cancel_event
+                    future = self._get_executor().submit(self._run_call, call, _call, handler, ctx)
+                    try:
+                        result = future.result(timeout=ctx.remaining_time)
+                    except TimeoutError:
+                        self._abandon_call(call, future)
+                        return self._timed_out(ctx)
+                else:
+                    # Every pool thread is taken (e.g. by handlers that missed
+                    # their deadline): run here rather than queue behind them
+                    result = self._run_call(call, _call, handler, ctx)
+                    if ctx.cancelled:
+                        return self._timed_out(ctx)
+            if result is not None:
+                return result
+            return {"ok": True}
+        except Exception as e:
+            logger.exception(f"Handler error for /{ctx.command}: {e}")
+            return {"error": str(e)}
+
+    async def handle_async(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an incoming webhook request on an event loop.
+
+        ``async def`` handlers are awaited directly; plain handlers run on
+        a thread pool of ``max_workers`` threads so they never block the
+        loop.
+
+        Args:
+            data: Request JSON data
+
+        Returns:
+            Response dict (can be ephemeral or acknowledgment)
+        """
+        if self.idempotency is None:
+            return await self._handle_async(data)
+        key, duplicate = self.idempotency.begin(data)
+        if duplicate is not None:
+            logger.info(f"Dropping redelivered webhook {key}")
+            return duplicate
         try:
-            result = handler(ctx)
+            response = await self._handle_async(data)
+        except BaseException:
+            self.idempotency.abandon(key)
+            raise
+        self.idempotency.finish(key, response)
+        return response
+
+    async def _handle_async(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        resolved = self._resolve(data, loop)
+        if isinstance(resolved, dict):
+            return resolved
+        ctx, handler = resolved
+
+        pool_call: Optional[_PoolCall] = None
+        try:
+            if asyncio.iscoroutinefunction(handler):
+                call = handler(ctx)
+            else:
+                pool_call = self._start_call(inline=False)
+                executor = (
+                    self._get_executor() if pool_call.pooled else self._get_overflow_executor()
+                )
+                future = executor.submit(self._run_call, pool_call, handler, ctx)
+                call = asyncio.wrap_future(future, loop=loop)
+            if ctx.deadline is None:
+                result = await call
+            else:
+                try:
+                    # Cancels coroutine handlers; threads see ctx.cancel_event
+                    result = await asyncio.wait_for(call, ctx.remaining_time)
+                except asyncio.TimeoutError:
+                    if pool_call is not None:
+                        self._abandon_call(pool_call, future)
+                    return self._timed_out(ctx)
+            if hasattr(result, "__await__"):
+                result = await result
             if result is not None:
                 return result
             return {"ok": True}
         except Exception as e:
-            logger.exception(f"Handler error for /{payload.command}: {e}")
+            logger.exception(f"Handler error for /{ctx.command}: {e}")
             return {"error": str(e)}
 
+    def _get_executor(self) -> "ThreadPoolExecutor":
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="latch-webhook"
+            )
+        return self._executor
+
+    def _get_overflow_executor(self) -> "ThreadPoolExecutor":
+        if self._overflow_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._overflow_executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="latch-webhook-overflow"
+            )
+        return self._overflow_executor
+
+    def _start_call(self, inline: bool) -> _PoolCall:
+        """
+        Account for a plain handler call and decide where it runs.
+
+        Calls go to the pool while it has a free thread. When it has none,
+        synchronous callers run the handler themselves (``inline``). On an
+        event loop, calls bypass the pool only while handlers that missed
+        their deadline hold its threads, one overflow call per abandoned
+        handler, so ``max_workers`` still bounds the live ones.
+        """
+        with self._pool_lock:
+            if self._pool_busy < self.max_workers:
+                pooled = True
+            elif inline:
+                pooled = False
+            else:
+                pooled = self._overflowing >= self._abandoned
+            call = _PoolCall(pooled)
+            if pooled:
+                self._pool_busy += 1
+            else:
+                self._overflowing += 1
+                self._overflowed += 1
+        return call
+
+    def _run_call(self, call: _PoolCall, func: Callable[..., Any], *args: Any) -> Any:
+        try:
+            return func(*args)
+        finally:
+            with self._pool_lock:
+                self._finish_call(call)
+
+    def _finish_call(self, call: _PoolCall) -> None:
+        # Caller holds _pool_lock
+        if call.done:
+            return
+        call.done = True
+        if call.pooled:
+            self._pool_busy -= 1
+        else:
+            self._overflowing -= 1
+        if call.abandoned:
+            self._abandoned -= 1
+
+    def _abandon_call(self, call: _PoolCall, future: "Future[Any]") -> None:
+        """Record a call whose caller gave up at its deadline."""
+        # A call still waiting for a thread will never run
+        cancelled = future.cancel()
+        with self._pool_lock:
+            if cancelled:
+                self._finish_call(call)
+            elif not call.done:
+                call.abandoned = True
+                self._abandoned += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Handler pool counters.
+
+        A plain handler that misses its deadline keeps its pool thread until
+        it returns; ``abandoned`` counts those (handlers that ignore
+        ``ctx.cancelled``). While they fill the pool, new calls run outside
+        it, counted in ``overflowed``, instead of timing out in its queue.
+
+        Returns:
+            Dict with ``max_workers``, ``busy`` (calls on the pool, running
+            or queued), ``abandoned`` (calls still running past their
+            deadline), ``overflowing`` (calls running outside the pool now)
+            and ``overflowed`` (total calls run outside the pool)
+        """
+        with self._pool_lock:
+            return {
+                "max_workers": self.max_workers,
+                "busy": self._pool_busy,
+                "abandoned": self._abandoned,
+                "overflowing": self._overflowing,
+                "overflowed": self._overflowed,
+            }
+
+    def close(self) -> None:
+        """
+        Shut down the handler pools, waiting for queued and running handlers.
+
+        Also closes the default ``http`` client if one was created; a client
+        passed in as ``http`` is left to its owner.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._overflow_executor is not None:
+            self._overflow_executor.shutdown(wait=True)
+            self._overflow_executor = None
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=True)
+        if self._owns_http and self._http is not None:
+            self._http.close()
+            self._http = None
+            self._owns_http = False
+
+    def serve(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 3000,
+        workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Serve this webhook from prefork worker processes (POSIX only).
+
+        Blocks until SIGTERM or SIGINT, then drains in-flight requests.
+        See :class:`latch_bot.prefork.PreforkServer` for the options.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on
+            workers: Number of worker processes (defaults to the CPU count)
+            **kwargs: Other PreforkServer options (``reuse_port``,
+                ``graceful_timeout``, ``stats_path``, ``post_fork``, ...)
+
+        Example:
+            webhook.serve(port=3000, workers=4)
+        """
+        from .prefork import serve
+
+        serve(self, host=host, port=port, workers=workers, **kwargs)
+
     def get_flask_handler(self):
         """
         Get a Flask-compatible handler function.
@@ -267,8 +965,45 @@ class WebhookServer:
         return handler
 
 
+_http_lock = threading.Lock()
+
+
+def _is_coroutine_function(func: Callable[..., Any]) -> bool:
+    import asyncio
+
+    return asyncio.iscoroutinefunction(func)
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+def _call(handler: CommandHandler, ctx: CommandContext) -> Any:
+    """
+    Call a handler from synchronous code, running coroutine handlers to completion.
+
+    Coroutines run on the event loop the webhook was handled on, if there is
+    one, since an AsyncLatchBot's connections belong to that loop; otherwise
+    on a new event loop.
+    """
+    result = handler(ctx)
+    if hasattr(result, "__await__"):
+        import asyncio
+
+        loop = ctx.loop
+        if loop is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                return asyncio.run_coroutine_threadsafe(_await(result), loop).result()
+        result = asyncio.run(_await(result))
+    return result
+
+
 def create_flask_app(
-    bot: LatchBot,
+    bot: "LatchBot",
     webhook_path: str = "/latch/webhook",
 ) -> "Flask":
     """
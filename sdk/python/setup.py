@@ -22,7 +22,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/your-org/latch-bot-sdk-python",
-    packages=find_packages(exclude=["tests", "tests.*", "examples"]),
+    packages=find_packages(exclude=["tests", "tests.*", "examples", "benchmarks"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -49,6 +49,18 @@ setup(
             "mypy>=1.0.0",
             "types-requests>=2.25.0",
         ],
+        "async": [
+            "httpx>=0.24.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "analytics": [
+            "numpy>=1.21.0",
+        ],
         "flask": [
             "flask>=2.0.0",
         ],
@@ -56,6 +68,9 @@ setup(
             "fastapi>=0.100.0",
             "uvicorn>=0.20.0",
         ],
+        "asgi": [
+            "uvicorn>=0.20.0",
+        ],
     },
     entry_points={
         "console_scripts": [
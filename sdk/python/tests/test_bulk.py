@@ -0,0 +1,64 @@
+"""Tests for bulk message sending."""
+
+import asyncio
+
+import pytest
+
+from latch_bot import LatchBot, RateLimiter
+from latch_bot.models import Message
+from latch_bot.testing import StubLatchServer
+
+ITEMS = [(i % 7 + 1, f"Announcement {i}") for i in range(200)]
+
+
+def make_limiter():
+    # The server's 60 requests per window, with a 0.6 second window so
+    # the test takes about two seconds instead of minutes
+    return RateLimiter(limit=60, period=0.6)
+
+
+@pytest.fixture
+def server():
+    with StubLatchServer(rate_limit=60) as server:
+        yield server
+
+
+def test_bulk_waits_for_rate_limit_budget(server):
+    bot = LatchBot(
+        token="bot_test",
+        base_url=server.url,
+        rate_limiter=make_limiter(),
+        max_rate_limit_wait=0.05,
+    )
+
+    results = bot.send_messages_bulk(ITEMS, max_concurrency=100)
+
+    assert all(isinstance(r, Message) for r in results)
+    assert [r.body_md for r in results] == [text for _, text in ITEMS]
+    assert server.stats() == {"POST /api/bot/messages 201": 200}
+
+
+def test_async_bulk_waits_for_rate_limit_budget(server):
+    pytest.importorskip("httpx")
+    from latch_bot import AsyncLatchBot
+
+    async def send():
+        async with AsyncLatchBot(
+            token="bot_test",
+            base_url=server.url,
+            rate_limiter=make_limiter(),
+            max_rate_limit_wait=0.05,
+        ) as bot:
+            return await bot.send_messages_bulk(ITEMS)
+
+    results = asyncio.run(send())
+
+    assert all(isinstance(r, Message) for r in results)
+    assert server.stats() == {"POST /api/bot/messages 201": 200}
+
+
+def test_bulk_concurrency_is_capped_at_the_burst():
+    bot = LatchBot(token="bot_test", pool_maxsize=100, rate_limiter=RateLimiter(limit=20))
+
+    assert bot._bulk_concurrency(None, 100) == 20
+    assert bot._bulk_concurrency(50, 100) == 50
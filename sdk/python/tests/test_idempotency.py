@@ -0,0 +1,57 @@
+"""Tests for webhook redelivery deduplication."""
+
+from latch_bot import IdempotencyCache, LatchBot, WebhookServer
+from latch_bot.idempotency import content_key
+
+PAYLOAD = {
+    "command": "roll",
+    "text": "d20",
+    "conversation_id": 42,
+    "user_id": 7,
+    "user_name": "ada",
+    "workspace_id": 1,
+}
+
+
+def make_server(idempotency):
+    webhook = WebhookServer(LatchBot(token="bot_test"), idempotency=idempotency)
+    calls = []
+
+    @webhook.command("roll")
+    def roll(ctx):
+        calls.append(ctx.text)
+        return ctx.reply_ephemeral(f"Rolled {len(calls)}")
+
+    return webhook, calls
+
+
+def test_identical_commands_without_event_id_both_run():
+    webhook, calls = make_server(IdempotencyCache())
+
+    first = webhook.handle(dict(PAYLOAD))
+    second = webhook.handle(dict(PAYLOAD))
+
+    assert len(calls) == 2
+    assert first != second
+    assert webhook.idempotency.stats()["unkeyed"] == 2
+
+
+def test_redelivered_event_runs_once():
+    webhook, calls = make_server(IdempotencyCache())
+
+    first = webhook.handle(dict(PAYLOAD, event_id=10))
+    redelivery = webhook.handle(dict(PAYLOAD, event_id=10))
+    webhook.handle(dict(PAYLOAD, event_id=11))
+
+    assert len(calls) == 2
+    assert redelivery == first
+    assert webhook.idempotency.stats()["duplicates"] == 1
+
+
+def test_content_key_is_opt_in():
+    webhook, calls = make_server(IdempotencyCache(key=content_key))
+
+    webhook.handle(dict(PAYLOAD))
+    webhook.handle(dict(PAYLOAD))
+
+    assert len(calls) == 1
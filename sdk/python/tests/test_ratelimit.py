@@ -0,0 +1,32 @@
+"""Tests for client-side rate limiting."""
+
+from latch_bot import LatchBot, RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_endpoints_share_the_token_budget():
+    clock = FakeClock()
+    bot = LatchBot(token="bot_test", rate_limiter=RateLimiter(limit=2, period=60, clock=clock))
+    limiter = bot.rate_limiter
+
+    assert limiter.reserve(bot._rate_limit_key("POST", "/api/bot/messages")) == 0
+    assert limiter.reserve(bot._rate_limit_key("GET", "/api/bot/conversations/1")) == 0
+    # The third request waits regardless of the endpoint it goes to
+    assert limiter.reserve(bot._rate_limit_key("GET", "/api/bot/conversations/2")) == 30
+
+
+def test_per_route_buckets_are_opt_in():
+    clock = FakeClock()
+    limiter = RateLimiter(limit=1, period=60, clock=clock, per_route=True)
+    bot = LatchBot(token="bot_test", rate_limiter=limiter)
+
+    assert limiter.reserve(bot._rate_limit_key("POST", "/api/bot/messages")) == 0
+    assert limiter.reserve(bot._rate_limit_key("GET", "/api/bot/conversations/1")) == 0
+    assert limiter.reserve(bot._rate_limit_key("GET", "/api/bot/conversations/2")) == 60
@@ -0,0 +1,152 @@
+"""Round-trip tests for latch_bot.serialization."""
+
+import copy
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from latch_bot import serialization
+from latch_bot.models import (
+    Attachment,
+    CommandPayload,
+    Conversation,
+    ConversationMember,
+    DecodeContext,
+    Message,
+    Reaction,
+    User,
+)
+
+USER = User(id=1, name="Ada", email=None, avatar_url="https://cdn.example.com/a.png")
+
+
+def user_data(user_id):
+    return {
+        "id": user_id,
+        "name": f"User {user_id}",
+        "email": f"user{user_id}@example.com",
+        "avatar_url": None,
+    }
+
+
+def message_data(message_id, **overrides):
+    data = {
+        "id": message_id,
+        "conversation_id": 42,
+        "user_id": message_id % 3 + 1,
+        "body_md": f"Message **{message_id}**",
+        "body_html": f"<p>Message <strong>{message_id}</strong></p>",
+        "parent_message_id": None,
+        "created_at": "2024-05-06T12:30:07.123456Z",
+        "updated_at": "2024-05-06T12:30:07.123456Z",
+        "user": user_data(message_id % 3 + 1),
+        "reactions": [{"id": 7, "emoji": ":+1:", "user_id": 2, "user": user_data(2)}],
+        "attachments": [
+            {
+                "id": message_id,
+                "filename": "report.pdf",
+                "mime_type": "application/pdf",
+                "size": 48213,
+                "url": f"https://cdn.example.com/files/{message_id}",
+            }
+        ],
+    }
+    data.update(overrides)
+    return data
+
+
+CONVERSATION = Conversation.from_dict(
+    {
+        "id": 42,
+        "workspace_id": 1,
+        "name": "general",
+        "description": None,
+        "type": "public_channel",
+        "is_archived": False,
+        "created_by": 1,
+        "members": [
+            {"id": 100 + i, "conversation_id": 42, "user": user_data(i + 1)} for i in range(5)
+        ],
+    }
+)
+
+SAMPLES = [
+    USER,
+    ConversationMember(id=5, conversation_id=42, user=USER),
+    ConversationMember(id=6, conversation_id=42, user=None),
+    Attachment(id=3, filename="a.pdf", mime_type="application/pdf", size=10),
+    Reaction(id=4, emoji=":tada:", user_id=1),
+    Reaction(id=4, emoji=":tada:", user_id=1, user=USER),
+    Message.from_dict(message_data(1)),
+    Message.from_dict(message_data(2, updated_at="2024-05-07T08:00:00.500000Z")),
+    Message.from_dict(message_data(3), lazy=True),
+    Message(1, 2, 3, "md", "<p>md</p>", created_at=datetime(2024, 5, 6, 12, 0)),
+    Message(1, 2, 3, "md", "", created_at=datetime(2024, 5, 6, 12, tzinfo=timezone(timedelta(hours=-5)))),
+    CONVERSATION,
+    CommandPayload("weather", "London", 42, 7, "ada", 1, {"units": "metric"}),
+]
+
+
+@pytest.mark.parametrize("obj", SAMPLES, ids=lambda obj: type(obj).__name__)
+def test_round_trip(obj):
+    restored = type(obj).from_bytes(obj.to_bytes())
+
+    assert restored == obj
+    if isinstance(obj, Message):
+        assert restored.created_at.utcoffset() == obj.created_at.utcoffset()
+        assert restored.updated_at == obj.updated_at
+
+
+def test_decode_context_shares_users():
+    ctx = DecodeContext()
+    restored = [
+        Message.from_bytes(Message.from_dict(message_data(i)).to_bytes(), ctx) for i in range(6)
+    ]
+
+    assert restored[0].user is restored[3].user
+    assert restored[0].user is not restored[1].user
+
+
+@pytest.mark.parametrize("obj", SAMPLES, ids=lambda obj: type(obj).__name__)
+def test_pickle_round_trip(obj):
+    assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+def test_pickle_lazy_message_with_decode_context():
+    message = Message.from_dict(message_data(1), lazy=True, ctx=DecodeContext())
+
+    restored = pickle.loads(pickle.dumps(message))
+
+    assert restored == Message.from_dict(message_data(1))
+    assert restored.user.name == "User 2"
+    assert copy.copy(message) == restored
+
+
+def test_dumps_rejects_unsupported_types():
+    with pytest.raises(TypeError):
+        serialization.dumps({"id": 1})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"XX\x01\x05",
+        b"plain text, not a model",
+        serialization.MAGIC + bytes((99, 5)),
+        serialization.MAGIC + bytes((serialization.SCHEMA_VERSION, 200)),
+        serialization.MAGIC + bytes((serialization.SCHEMA_VERSION, 5)),
+        serialization.MAGIC + bytes((serialization.SCHEMA_VERSION, 5)) + b"\xff\x00",
+        serialization.MAGIC + bytes((serialization.SCHEMA_VERSION, 1)) + b"\x00garbage",
+        Message.from_dict(message_data(1)).to_bytes()[:-3],
+    ],
+)
+def test_loads_rejects_invalid_data(data):
+    with pytest.raises(ValueError):
+        serialization.loads(data)
+
+
+def test_from_bytes_rejects_other_models():
+    with pytest.raises(ValueError):
+        User.from_bytes(SAMPLES[3].to_bytes())
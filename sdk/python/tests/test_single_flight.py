@@ -0,0 +1,50 @@
+"""Tests for coalescing of identical concurrent requests."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from latch_bot.async_client import AsyncSingleFlight  # noqa: E402
+
+
+def test_followers_survive_leader_cancellation():
+    async def main():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        leader = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do("k", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await asyncio.gather(*followers) == [42, 42, 42]
+        assert len(calls) == 1
+
+    asyncio.run(main())
+
+
+def test_new_caller_after_last_waiter_cancelled_starts_fresh_call():
+    async def main():
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return 42
+
+        only = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0.01)
+        only.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await only
+        # Same tick: the cancelled call's task has not finished yet
+        assert await flight.do("k", fetch) == 42
+
+    asyncio.run(main())
@@ -7,9 +7,9 @@ from textual.screen import Screen
 from textual.widgets import Input, Static, ListItem, ListView, Label, Footer, Header
 from textual.binding import Binding
 from textual.reactive import reactive
-from datetime import datetime
 from rich.text import Text
 from rich.markdown import Markdown
+from ..timestamps import format_time
 from .create_modals import CreateChannelModal, CreateDMModal, EditMessageModal, DeleteMessageModal, SelectMessageModal
 
 
@@ -114,12 +114,8 @@ class MessageDisplay(ScrollableContainer):
             msg_id = msg.get("id")
             user_id = msg.get("user_id")
 
-            # Format timestamp
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                time_str = dt.strftime("%H:%M")
-            except:
-                time_str = ""
+            # Format timestamp (memoized across redraws)
+            time_str = format_time(timestamp)
 
             # Build message line with message number for selection
             msg_text = f"[bold yellow]#{i+1}[/bold yellow] [bold cyan]{user_name}[/bold cyan]"
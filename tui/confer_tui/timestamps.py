@@ -0,0 +1,50 @@
+"""Fast parsing of the server's ISO-8601 timestamps.
+
+Mirrors ``latch_bot.timestamps`` in the Python SDK; the TUI does not
+depend on the SDK, so the few lines are kept here too.
+"""
+
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_NATIVE_Z = sys.version_info >= (3, 11)
+
+_fromisoformat = datetime.fromisoformat
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a server timestamp; returns None if empty or invalid.
+
+    Not memoized, like the SDK: most timestamps are distinct, and a cache
+    lookup costs about as much as the fast path saves.
+    """
+    if not value:
+        return None
+    try:
+        # Fast path: the exact format Laravel emits, YYYY-MM-DDTHH:MM:SS.ffffffZ
+        if len(value) == 27 and value[26] == "Z" and value[10] == "T":
+            try:
+                return _fromisoformat(value if _NATIVE_Z else value[:26] + "+00:00")
+            except ValueError:
+                pass
+
+        # General ISO-8601
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return _fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def format_time(value: Optional[str], fmt: str = "%H:%M") -> str:
+    """Format a server timestamp for display; returns "" if it can't be parsed.
+
+    Memoized, so redrawing the same messages does not re-parse or
+    re-format their timestamps.
+    """
+    dt = parse_timestamp(value)
+    return dt.strftime(fmt) if dt is not None else ""